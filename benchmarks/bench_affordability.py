@@ -0,0 +1,46 @@
+"""Benchmark the maximum principals of many applicants and terms.
+
+Compare max_principals over 5000 applicants and 36 monthly terms against
+building the unit principal schedule of each applicant and term and
+dividing the target payment by its PMT.
+
+Run it from the repository root with
+
+    PYTHONPATH=. python benchmarks/bench_affordability.py
+"""
+
+import random
+import time
+
+from loan_calculator.batch import max_principals
+from loan_calculator.schedule import ProgressivePriceSchedule
+
+TERMS = [[30 * (j + 1) for j in range(k)] for k in range(1, 37)]
+
+
+def main(num_applicants=5000, num_scalar_applicants=200):
+
+    rnd = random.Random(0)
+    targets = [rnd.uniform(200, 2000) for _ in range(num_applicants)]
+    rates = [rnd.uniform(0.0003, 0.002) for _ in range(num_applicants)]
+
+    start = time.perf_counter()
+    max_principals(targets, rates, TERMS)
+    batch_time = (time.perf_counter() - start) / num_applicants
+
+    start = time.perf_counter()
+    for target, rate in zip(
+        targets[:num_scalar_applicants], rates[:num_scalar_applicants]
+    ):
+        [
+            target / ProgressivePriceSchedule(1.0, rate, return_days).pmt
+            for return_days in TERMS
+        ]
+    scalar_time = (time.perf_counter() - start) / num_scalar_applicants
+
+    print("loop            {:>10.1f} us/applicant".format(scalar_time * 1e6))
+    print("max_principals  {:>10.1f} us/applicant".format(batch_time * 1e6))
+
+
+if __name__ == "__main__":
+    main()
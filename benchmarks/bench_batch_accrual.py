@@ -0,0 +1,76 @@
+"""Benchmark the daily accrual of a book of loans.
+
+Compare accruing the balances of a book of loans at a reference date with
+BatchAccrual against calling Loan.balance_at for each one of them.
+
+Run it from the repository root with
+
+    PYTHONPATH=. python benchmarks/bench_batch_accrual.py
+"""
+
+import random
+import timeit
+from datetime import date, timedelta
+
+from loan_calculator import Loan
+from loan_calculator.batch import BatchAccrual, BatchSchedule
+
+START_DATE = date(2020, 1, 1)
+
+REFERENCE_DATE = date(2020, 9, 15)
+
+
+def build_book(num_loans, seed=0):
+
+    rnd = random.Random(seed)
+
+    principals, rates, return_days, start_dates = [], [], [], []
+    for _ in range(num_loans):
+        first_day = rnd.randint(15, 45)
+        principals.append(rnd.uniform(1000, 50000))
+        rates.append(rnd.uniform(0.1, 1.0))
+        return_days.append([first_day + 30 * i for i in range(rnd.randint(6, 24))])
+        start_dates.append(START_DATE + timedelta(rnd.randint(0, 90)))
+
+    return principals, rates, return_days, start_dates
+
+
+def main(num_loans=1000000, num_scalar_loans=10000):
+
+    principals, rates, return_days, start_dates = build_book(num_loans)
+
+    accrual = BatchAccrual(
+        BatchSchedule(
+            principals, [(1 + r) ** (1 / 365) - 1 for r in rates], return_days
+        ),
+        start_dates,
+    )
+    accrual.accrue(REFERENCE_DATE)  # build the schedules once
+
+    elapsed = timeit.timeit(lambda: accrual.accrue(REFERENCE_DATE), number=1)
+    print("{:<15} {:>8.3f} s for {} loans".format("BatchAccrual", elapsed, num_loans))
+
+    loans = [
+        Loan(p, r, s, [s + timedelta(n) for n in r_days])
+        for p, r, r_days, s in zip(
+            principals[:num_scalar_loans],
+            rates[:num_scalar_loans],
+            return_days[:num_scalar_loans],
+            start_dates[:num_scalar_loans],
+        )
+    ]
+    for loan in loans:
+        loan.balance
+
+    elapsed = timeit.timeit(
+        lambda: [loan.balance_at(REFERENCE_DATE) for loan in loans], number=1
+    )
+    print(
+        "{:<15} {:>8.3f} s for {} loans (extrapolated)".format(
+            "Loan loop", elapsed * num_loans / num_scalar_loans, num_loans
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
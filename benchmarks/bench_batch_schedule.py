@@ -0,0 +1,78 @@
+"""Benchmark the batch schedule engine.
+
+Compare building the schedules of a book of loans with BatchSchedule
+against building a Loan for each one of them.
+
+Run it from the repository root with
+
+    PYTHONPATH=. python benchmarks/bench_batch_schedule.py
+"""
+
+import random
+import timeit
+from datetime import date, timedelta
+
+from loan_calculator import Loan
+from loan_calculator.batch import BatchSchedule
+from loan_calculator.schedule.base import AmortizationScheduleType
+
+
+START_DATE = date(2020, 1, 1)
+
+
+def build_book(num_loans, seed=0):
+
+    rnd = random.Random(seed)
+    schedule_types = list(AmortizationScheduleType)
+
+    principals, rates, return_days, types = [], [], [], []
+    for _ in range(num_loans):
+        first_day = rnd.randint(15, 45)
+        principals.append(rnd.uniform(1000, 50000))
+        rates.append(rnd.uniform(0.1, 1.0))
+        return_days.append([first_day + 30 * i for i in range(rnd.randint(6, 24))])
+        types.append(rnd.choice(schedule_types))
+
+    return principals, rates, return_days, types
+
+
+def batch(principals, rates, return_days, types):
+
+    schedule = BatchSchedule(
+        principals,
+        [(1 + r) ** (1 / 365) - 1 for r in rates],
+        return_days,
+        types,
+    )
+    schedule.balance
+    schedule.due_payments
+
+
+def loop(principals, rates, return_days, types):
+
+    for principal, rate, r_days, schedule_type in zip(
+        principals, rates, return_days, types
+    ):
+        loan = Loan(
+            principal,
+            rate,
+            START_DATE,
+            [START_DATE + timedelta(n) for n in r_days],
+            amortization_schedule_type=schedule_type,
+            schedule_cache=None,
+        )
+        loan.balance
+        loan.due_payments
+
+
+def main(num_loans=100000):
+
+    book = build_book(num_loans)
+
+    for name, function in [("BatchSchedule", batch), ("Loan loop", loop)]:
+        elapsed = timeit.timeit(lambda: function(*book), number=1)
+        print("{:<15} {:>8.3f} s for {} loans".format(name, elapsed, num_loans))
+
+
+if __name__ == "__main__":
+    main()
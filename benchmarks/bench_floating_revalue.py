@@ -0,0 +1,88 @@
+"""Benchmark revaluing a book of floating rate loans.
+
+After each daily print of the rate index, the schedules of the whole book
+are recalculated. Compare doing so with BatchSchedule against revaluing a
+floating rate schedule for each loan.
+
+Run it from the repository root with
+
+    PYTHONPATH=. python benchmarks/bench_floating_revalue.py
+"""
+
+import random
+import timeit
+
+from loan_calculator.batch import BatchSchedule
+from loan_calculator.index import CumulativeIndex
+from loan_calculator.schedule import FLOATING_SCHEDULE_TYPE_CLASS_MAP
+from loan_calculator.schedule.base import AmortizationScheduleType
+
+
+def build_book(num_loans, seed=0):
+
+    rnd = random.Random(seed)
+    schedule_types = list(AmortizationScheduleType)
+
+    principals, spreads, return_days, types, offsets = [], [], [], [], []
+    for _ in range(num_loans):
+        first_day = rnd.randint(15, 45)
+        principals.append(rnd.uniform(1000, 50000))
+        spreads.append(rnd.uniform(0.0, 0.0005))
+        return_days.append([first_day + 30 * i for i in range(rnd.randint(6, 24))])
+        types.append(rnd.choice(schedule_types))
+        offsets.append(rnd.randint(0, 700))
+
+    return principals, spreads, return_days, types, offsets
+
+
+def main(num_loans=100000, num_scalar_loans=10000):
+
+    rnd = random.Random(1)
+    index = CumulativeIndex(
+        [rnd.uniform(0.0, 0.0006) for _ in range(730)], projected_rate=0.0004
+    )
+
+    principals, spreads, return_days, types, offsets = build_book(num_loans)
+
+    batch = BatchSchedule(
+        principals,
+        spreads,
+        return_days,
+        types,
+        rate_index=index,
+        index_offsets=offsets,
+    )
+
+    def revalue_batch():
+        batch.revalue()
+        batch.due_payments
+
+    schedules = [
+        FLOATING_SCHEDULE_TYPE_CLASS_MAP[schedule_type](
+            principal, spread, r_days, index, index_offset=offset
+        )
+        for principal, spread, r_days, schedule_type, offset in list(
+            zip(principals, spreads, return_days, types, offsets)
+        )[:num_scalar_loans]
+    ]
+
+    def revalue_loop():
+        for schedule in schedules:
+            schedule.revalue()
+            schedule.due_payments
+
+    index.append(0.0005)
+
+    elapsed = timeit.timeit(revalue_batch, number=1)
+    print("{:<15} {:>8.3f} s for {} loans".format("BatchSchedule", elapsed, num_loans))
+
+    elapsed = timeit.timeit(revalue_loop, number=1)
+    print(
+        "{:<15} {:>8.3f} s for {} loans (extrapolated)".format(
+            "Schedule loop", elapsed * num_loans / num_scalar_loans, num_loans
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark solving the interest rates implied by Price instalments.
+
+Compare solving the PMT equation of random quotes, with 2 to 120 monthly
+instalments, one at a time with approximate_irr against
+implied_interest_rates, which solves all of them at once.
+
+Run it from the repository root with
+
+    PYTHONPATH=. python benchmarks/bench_implied_rates.py
+"""
+
+import timeit
+
+import numpy as np
+
+from loan_calculator.batch import implied_interest_rates
+from loan_calculator.irr import approximate_irr
+from loan_calculator.pmt import constant_return_pmt
+
+
+def quotes(num_quotes, seed=0):
+    rng = np.random.default_rng(seed)
+
+    principals = rng.uniform(1000.0, 50000.0, num_quotes)
+    daily_interest_rates = rng.uniform(0.0001, 0.005, num_quotes)
+    return_days = [
+        [30 * (j + 1) for j in range(k)] for k in rng.integers(2, 121, num_quotes)
+    ]
+    payments = [
+        constant_return_pmt(s, d, r_days)
+        for s, d, r_days in zip(principals, daily_interest_rates, return_days)
+    ]
+
+    return payments, principals, return_days, daily_interest_rates
+
+
+def main(number=1):
+
+    for num_quotes in [100, 1000, 5000]:
+        payments, principals, return_days, rates = quotes(num_quotes)
+
+        def scalar():
+            return [
+                approximate_irr(s, [pmt] * len(r_days), r_days, 0.001)
+                for pmt, s, r_days in zip(payments, principals, return_days)
+            ]
+
+        def batch():
+            return implied_interest_rates(payments, principals, return_days)
+
+        assert np.allclose(scalar(), rates, rtol=1e-3)
+        assert np.allclose(batch(), rates)
+
+        print("{} quotes".format(num_quotes))
+        for name, function in [("scalar", scalar), ("batch", batch)]:
+            elapsed = timeit.timeit(function, number=number) / number
+            print("  {:<8} {:>10.2f} ms".format(name, elapsed * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark the backends of the numerical kernels.
+
+Compare the pure Python and the Numba backends on 360-instalment schedules
+and on approximating the IRR of a batch of loans. The Numba kernels are
+compiled before timing them.
+
+Run it from the repository root with
+
+    PYTHONPATH=. python benchmarks/bench_kernels.py
+"""
+
+import random
+import timeit
+
+from loan_calculator import kernels
+from loan_calculator.grossup.iof_tax import amortization_schedule_iof
+from loan_calculator.irr import approximate_irr
+from loan_calculator.schedule import (
+    ConstantAmortizationSchedule,
+    ProgressivePriceSchedule,
+)
+
+
+def build_book(num_loans, num_instalments, seed=0):
+
+    rnd = random.Random(seed)
+
+    book = []
+    for _ in range(num_loans):
+        d = rnd.uniform(0.0001, 0.003)
+        return_days = [rnd.randint(15, 44) + 30 * i for i in range(num_instalments)]
+        schedule = ProgressivePriceSchedule(1000.0, d, return_days)
+        book.append((d, return_days, schedule.due_payments, schedule.amortizations))
+
+    return book
+
+
+def schedules(book):
+
+    for d, return_days, _, _ in book:
+        ProgressivePriceSchedule(1000.0, d, return_days).pmt
+        ConstantAmortizationSchedule(1000.0, d, return_days).due_payments
+
+
+def irr(book):
+
+    for d, return_days, due_payments, amortizations in book:
+        approximate_irr(
+            990.0 - amortization_schedule_iof(amortizations, return_days),
+            due_payments,
+            return_days,
+            d,
+        )
+
+
+def main(num_loans=2000):
+
+    schedules_book = build_book(num_loans, 360)
+    irr_book = build_book(num_loans, 24)
+
+    for backend in kernels.BACKENDS:
+        if kernels.set_backend(backend) != backend:
+            print("{:<7} not available".format(backend))
+            continue
+
+        # compile the kernels, if the backend does so
+        schedules(schedules_book[:1])
+        irr(irr_book[:1])
+
+        for name, function, book in [
+            ("360-instalment schedules", schedules, schedules_book),
+            ("batch IRR", irr, irr_book),
+        ]:
+            elapsed = timeit.timeit(lambda: function(book), number=1)
+            print(
+                "{:<7} {:<25} {:>8.3f} s for {} loans".format(
+                    backend, name, elapsed, num_loans
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark holding a portfolio in a LoanBook.
+
+Compare the bytes per loan, the time to build the portfolio, which is
+traced for measuring its memory, and the time to compute the total interest of a
+portfolio held as a list of Loan objects against the same portfolio held as
+a columnar LoanBook.
+
+Run it from the repository root with
+
+    PYTHONPATH=. python benchmarks/bench_loan_book.py
+"""
+
+import random
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from loan_calculator import Loan
+from loan_calculator.batch import LoanBook
+
+START_DATE = date(2020, 1, 1)
+
+
+def build_columns(num_loans, seed=0):
+
+    rnd = random.Random(seed)
+
+    principals, rates, start_dates, return_days = [], [], [], []
+    for _ in range(num_loans):
+        first_day = rnd.randint(15, 45)
+        principals.append(rnd.uniform(1000, 50000))
+        rates.append(rnd.uniform(0.0003, 0.002))
+        start_dates.append(START_DATE + timedelta(rnd.randint(0, 90)))
+        return_days.append([first_day + 30 * i for i in range(rnd.randint(6, 24))])
+
+    return principals, rates, start_dates, return_days
+
+
+def build_loans(principals, rates, start_dates, return_days):
+    return [
+        Loan.from_return_days(p, d, s, r_days, schedule_cache=None)
+        for p, d, s, r_days in zip(principals, rates, start_dates, return_days)
+    ]
+
+
+def measure(function):
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, size, elapsed
+
+
+def main(num_loans=100000):
+
+    columns = build_columns(num_loans)
+
+    for name, build, total_interest in [
+        (
+            "loan list",
+            lambda: build_loans(*columns),
+            lambda loans: [loan.total_interest for loan in loans],
+        ),
+        (
+            "loan book",
+            lambda: LoanBook(*columns),
+            lambda book: book.total_interest,
+        ),
+    ]:
+        portfolio, size, build_time = measure(build)
+
+        start = time.perf_counter()
+        total_interest(portfolio)
+        total_time = time.perf_counter() - start
+
+        print(
+            "{:<10} build {:>7.2f} s   total interest {:>7.2f} s   "
+            "{:>7.0f} bytes/loan".format(name, build_time, total_time, size / num_loans)
+        )
+        del portfolio
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Benchmark the construction of loans.
+
+Compare the time spent building a loan and reading a single column against
+building it and computing every column eagerly, which is what the schedule
+used to do on initialization. The unit schedule cache is disabled for these
+runs, so that every loan computes its own columns. The best of several
+repetitions is reported, which is less sensitive to noise. On a typical run,
+the eager construction of a loan with 360 instalments takes about 395 us,
+reading only the due payments about 220 us (44% saved) and only the
+amortizations, which are derived from the balance, about 340 us (15% saved).
+Before the columns were lazily evaluated, the same loan took about 330 us to
+build. Then compare building loans with Loan.__init__ against
+Loan.from_return_days, which skips the rate conversions and the day
+counting, and against Loan.with_principal, which shares everything but the
+principal with an existing loan, for calendar and working days.
+
+Run it from the repository root with
+
+    PYTHONPATH=. python benchmarks/bench_loan_construction.py
+"""
+
+import timeit
+from datetime import date, timedelta
+
+from loan_calculator import Loan
+from loan_calculator.interest_rate import convert_to_daily_interest_rate
+
+START_DATE = date(2020, 1, 1)
+RETURN_DATES = [START_DATE + timedelta(30 * (i + 1)) for i in range(360)]
+
+
+def build_loan():
+    return Loan(10000.0, 0.25, START_DATE, RETURN_DATES, schedule_cache=None)
+
+
+def eager():
+    # every column is computed on initialization, whether it is read or not
+    loan = build_loan()
+    loan.balance
+    loan.due_payments
+    loan.interest_payments
+    loan.amortizations
+
+    return loan.due_payments
+
+
+def only_due_payments():
+    return build_loan().due_payments
+
+
+def only_amortizations():
+    return build_loan().amortizations
+
+
+def constructors(count_working_days, num_instalments=24):
+
+    return_dates = RETURN_DATES[:num_instalments]
+    loan = Loan(
+        10000.0,
+        0.25,
+        START_DATE,
+        return_dates,
+        count_working_days=count_working_days,
+    )
+    daily_interest_rate = convert_to_daily_interest_rate(0.25)
+    return_days = list(loan.return_days)
+
+    def init():
+        Loan(
+            10000.0,
+            0.25,
+            START_DATE,
+            return_dates,
+            count_working_days=count_working_days,
+        )
+
+    def from_return_days():
+        Loan.from_return_days(
+            10000.0,
+            daily_interest_rate,
+            START_DATE,
+            return_days,
+            return_dates=return_dates,
+            count_working_days=count_working_days,
+        )
+
+    def with_principal():
+        loan.with_principal(20000.0)
+
+    return [
+        ("__init__", init),
+        ("from_return_days", from_return_days),
+        ("with_principal", with_principal),
+    ]
+
+
+def best_time(function, number, repeat=7):
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def main(number=200):
+
+    eager_time = best_time(eager, number)
+    print("{:<20} {:>10.1f} us/loan".format("eager", eager_time * 1e6))
+
+    for name, function in [
+        ("due payments only", only_due_payments),
+        ("amortizations only", only_amortizations),
+    ]:
+        elapsed = best_time(function, number)
+        print(
+            "{:<20} {:>10.1f} us/loan ({:.0%} saved)".format(
+                name, elapsed * 1e6, 1 - elapsed / eager_time
+            )
+        )
+
+    for count_working_days in (False, True):
+        for name, function in constructors(count_working_days):
+            elapsed = timeit.timeit(function, number=number * 10) / number / 10
+            print(
+                "{:<20} {:>10.1f} us/loan ({} days)".format(
+                    name,
+                    elapsed * 1e6,
+                    "working" if count_working_days else "calendar",
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
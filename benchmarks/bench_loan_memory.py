@@ -0,0 +1,58 @@
+"""Benchmark the memory held by loans with materialized schedules.
+
+Compare the bytes per 120-instalment loan when the schedule columns are
+held as lists of floats against when they are moved to compact
+``array('d')`` buffers with `Loan.compact`.
+
+Run it from the repository root with
+
+    PYTHONPATH=. python benchmarks/bench_loan_memory.py
+"""
+
+import tracemalloc
+from datetime import date, timedelta
+
+from loan_calculator import Loan
+
+
+START_DATE = date(2020, 1, 1)
+RETURN_DATES = [START_DATE + timedelta(30 * (i + 1)) for i in range(120)]
+
+
+def build_loans(number, compact):
+
+    loans = []
+
+    for i in range(number):
+        loan = Loan(1000.0 + i, 0.25, START_DATE, RETURN_DATES)
+        # servicing jobs read every column
+        loan.balance
+        loan.due_payments
+        loan.interest_payments
+        loan.amortizations
+
+        loans.append(loan.compact() if compact else loan)
+
+    return loans
+
+
+def bytes_per_loan(number, compact):
+
+    tracemalloc.start()
+    loans = build_loans(number, compact)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return size / len(loans)
+
+
+def main(number=2000):
+
+    for name, compact in [("lists", False), ("compact", True)]:
+        print(
+            "{:<10} {:>10.0f} bytes/loan".format(name, bytes_per_loan(number, compact))
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark quoting PMTs from a PmtFactorGrid.
+
+Compare quoting the PMT of random quotes on a grid of 100 annual rates, 24
+terms and 31 first payment days with constant_return_pmt against looking
+them up in a PmtFactorGrid, and report the time to build, save and memory
+map the grid.
+
+Run it from the repository root with
+
+    PYTHONPATH=. python benchmarks/bench_pmt_grid.py
+"""
+
+import os
+import random
+import tempfile
+import time
+import timeit
+
+from loan_calculator.interest_rate import (
+    convert_to_daily_interest_rate,
+    InterestRateType,
+)
+from loan_calculator.pmt import constant_return_pmt
+from loan_calculator.pmt_grid import PmtFactorGrid
+
+RATES = [round(0.05 + 0.01 * i, 2) for i in range(100)]
+TERMS = list(range(1, 25))
+FIRST_PAYMENT_DAYS = list(range(15, 46))
+
+
+def main(number=100000):
+
+    start = time.perf_counter()
+    grid = PmtFactorGrid(RATES, TERMS, FIRST_PAYMENT_DAYS)
+    print("build      {:>10.2f} s".format(time.perf_counter() - start))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "grid.bin")
+        grid.save(path)
+
+        start = time.perf_counter()
+        grid = PmtFactorGrid.load(path)
+        print("load       {:>10.2f} ms".format((time.perf_counter() - start) * 1e3))
+
+        rnd = random.Random(0)
+        quotes = [
+            (
+                rnd.choice(RATES),
+                rnd.choice(TERMS),
+                rnd.choice(FIRST_PAYMENT_DAYS),
+            )
+            for _ in range(number)
+        ]
+
+        def exact():
+            for rate, term, first_day in quotes:
+                constant_return_pmt(
+                    1000.0,
+                    convert_to_daily_interest_rate(rate, InterestRateType.annual),
+                    [first_day + 30 * j for j in range(term)],
+                )
+
+        def lookup():
+            for rate, term, first_day in quotes:
+                grid.pmt(1000.0, rate, term, first_day)
+
+        for name, function in [("exact", exact), ("grid", lookup)]:
+            elapsed = timeit.timeit(function, number=1) / number
+            print("{:<10} {:>10.2f} us/quote".format(name, elapsed * 1e6))
+
+        grid.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark replaying partial prepayments of a loan.
+
+Compare replaying 12 monthly prepayments reducing the instalments of a loan
+with 360 monthly instalments by building a new Loan from each prepayment date
+over the remaining return dates against Loan.with_prepayments, which
+recomputes only the remaining schedules from the discount factors of the
+previous ones. Replaying prepayments reducing the term is reported as well.
+
+Run it from the repository root with
+
+    PYTHONPATH=. python benchmarks/bench_prepayments.py
+"""
+
+import timeit
+from datetime import date, timedelta
+
+from loan_calculator.loan import Loan, PrepaymentType
+from loan_calculator.return_dates import generate_return_dates
+
+START_DATE = date(2020, 1, 1)
+RETURN_DATES = generate_return_dates(START_DATE, 360).return_dates
+PREPAYMENTS = [(r_date + timedelta(5), 1000.0) for r_date in RETURN_DATES[:12]]
+
+
+def rebuild(loan):
+
+    for prepayment_date, amount in PREPAYMENTS:
+        loan = Loan(
+            loan.balance_at(prepayment_date) - amount,
+            loan.annual_interest_rate,
+            prepayment_date,
+            [r_date for r_date in loan.return_dates if r_date > prepayment_date],
+            schedule_cache=None,
+        )
+        loan.due_payments
+
+    return loan
+
+
+def replay(loan, prepayment_type):
+
+    loan = loan.with_prepayments(PREPAYMENTS, prepayment_type)
+    loan.due_payments
+
+    return loan
+
+
+def main(number=20):
+
+    loan = Loan(500000.0, 0.12, START_DATE, RETURN_DATES, schedule_cache=None)
+
+    expected = rebuild(loan).due_payments[0]
+    assert (
+        abs(replay(loan, PrepaymentType.reduce_instalment).due_payments[0] - expected)
+        < 1e-6 * expected
+    )
+
+    timings = [
+        ("rebuild", lambda: rebuild(loan)),
+        ("replay", lambda: replay(loan, PrepaymentType.reduce_instalment)),
+        ("replay term", lambda: replay(loan, PrepaymentType.reduce_term)),
+    ]
+
+    for name, function in timings:
+        elapsed = timeit.timeit(function, number=number) / number
+        print("{:<12} {:>10.2f} ms".format(name, elapsed * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark repricing a book of loans under rate shocks.
+
+Compare the total paid of every loan under seven rate shocks computed by
+RateShockScenarios against rebuilding every loan with Loan.with_rate once
+per scenario.
+
+Run it from the repository root with
+
+    PYTHONPATH=. python benchmarks/bench_rate_shocks.py
+"""
+
+import random
+import time
+from datetime import date, timedelta
+
+from loan_calculator import Loan
+from loan_calculator.batch import LoanBook, RateShockScenarios
+
+START_DATE = date(2020, 1, 1)
+
+RATE_SHIFTS = [-0.01, -0.005, -0.001, 0.0, 0.001, 0.005, 0.01]
+
+
+def build_loans(num_loans, seed=0):
+
+    rnd = random.Random(seed)
+
+    loans = []
+    for _ in range(num_loans):
+        first_day = rnd.randint(15, 45)
+        loans.append(
+            Loan.from_return_days(
+                rnd.uniform(1000, 50000),
+                rnd.uniform(0.0003, 0.002),
+                START_DATE + timedelta(rnd.randint(0, 90)),
+                [first_day + 30 * i for i in range(rnd.randint(6, 24))],
+                schedule_cache=None,
+            )
+        )
+
+    return loans
+
+
+def main(num_loans=100000, num_scalar_loans=5000):
+
+    loans = build_loans(num_loans)
+    book = LoanBook.from_loans(loans)
+
+    start = time.perf_counter()
+    RateShockScenarios(book, RATE_SHIFTS).total_paid
+    batch_time = (time.perf_counter() - start) / num_loans
+
+    start = time.perf_counter()
+    for loan in loans[:num_scalar_loans]:
+        for shift in RATE_SHIFTS:
+            loan.with_rate(
+                loan.annual_interest_rate + shift, schedule_cache=None
+            ).total_paid
+    scalar_time = (time.perf_counter() - start) / num_scalar_loans
+
+    print("with_rate  {:>10.2f} us/loan".format(scalar_time * 1e6))
+    print("scenarios  {:>10.2f} us/loan".format(batch_time * 1e6))
+
+
+if __name__ == "__main__":
+    main()
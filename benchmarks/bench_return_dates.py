@@ -0,0 +1,81 @@
+"""Benchmark building loans on generated monthly return dates.
+
+Compare building a loan whose monthly return dates are computed by hand
+with relativedelta and whose return days are counted by Loan.__init__
+against generating them with generate_return_dates, which memoizes the
+grids, and building the loan with Loan.from_return_days.
+
+Run it from the repository root with
+
+    PYTHONPATH=. python benchmarks/bench_return_dates.py
+"""
+
+import timeit
+from datetime import date
+
+from dateutil.relativedelta import relativedelta
+
+from loan_calculator import Loan, generate_return_dates
+from loan_calculator.interest_rate import convert_to_daily_interest_rate
+
+START_DATE = date(2020, 1, 10)
+
+
+def by_hand(count_working_days, num_instalments=24):
+
+    first_return_date = date(START_DATE.year, START_DATE.month, 5)
+    if (first_return_date - START_DATE).days < 15:
+        first_return_date += relativedelta(months=1)
+
+    return_dates = [
+        first_return_date + relativedelta(months=i) for i in range(num_instalments)
+    ]
+
+    return Loan(
+        10000.0,
+        0.25,
+        START_DATE,
+        return_dates,
+        count_working_days=count_working_days,
+    )
+
+
+def generated(count_working_days, num_instalments=24):
+
+    grid = generate_return_dates(
+        START_DATE,
+        num_instalments,
+        payment_day=5,
+        min_days=15,
+        count_working_days=count_working_days,
+    )
+
+    return Loan.from_return_days(
+        10000.0,
+        convert_to_daily_interest_rate(0.25),
+        START_DATE,
+        grid.return_days,
+        return_dates=grid.return_dates,
+        count_working_days=count_working_days,
+    )
+
+
+def main(number=2000):
+
+    for count_working_days in (False, True):
+        for name, function in [("by hand", by_hand), ("generated", generated)]:
+            elapsed = (
+                timeit.timeit(lambda: function(count_working_days), number=number)
+                / number
+            )
+            print(
+                "{:<10} {:>10.1f} us/loan ({} days)".format(
+                    name,
+                    elapsed * 1e6,
+                    "working" if count_working_days else "calendar",
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark searching the shortest term under an instalment ceiling.
+
+Compare building a Loan for every candidate number of instalments, up to 120
+monthly instalments, until its PMT fits the ceiling against minimal_term,
+which walks the candidate terms updating the running sums of the discount
+factors.
+
+Run it from the repository root with
+
+    PYTHONPATH=. python benchmarks/bench_term_search.py
+"""
+
+import timeit
+from datetime import date
+
+from loan_calculator.interest_rate import (
+    convert_to_daily_interest_rate,
+    InterestRateType,
+)
+from loan_calculator.loan import Loan
+from loan_calculator.return_dates import generate_return_dates
+from loan_calculator.term_search import minimal_term
+
+START_DATE = date(2020, 1, 1)
+RETURN_DATES = generate_return_dates(START_DATE, 120)
+DAILY_INTEREST_RATE = convert_to_daily_interest_rate(0.25, InterestRateType.annual)
+
+
+def loans(principal, max_payment):
+    for term in range(1, len(RETURN_DATES.return_dates) + 1):
+        loan = Loan.from_return_days(
+            principal,
+            DAILY_INTEREST_RATE,
+            START_DATE,
+            RETURN_DATES.return_days[:term],
+            RETURN_DATES.return_dates[:term],
+        )
+        if max(loan.due_payments) <= max_payment:
+            return term
+
+
+def search(principal, max_payment):
+    return minimal_term(
+        principal,
+        DAILY_INTEREST_RATE,
+        RETURN_DATES.return_days,
+        max_payment=max_payment,
+    ).term
+
+
+def main(number=20):
+
+    for max_payment in [500.0, 150.0, 120.0]:
+        assert loans(5000.0, max_payment) == search(5000.0, max_payment)
+        print(
+            "max payment {:.0f}, term {}".format(
+                max_payment, search(5000.0, max_payment)
+            )
+        )
+
+        for name, function in [("loans", loans), ("search", search)]:
+            elapsed = (
+                timeit.timeit(lambda: function(5000.0, max_payment), number=number)
+                / number
+            )
+            print("  {:<8} {:>10.3f} ms".format(name, elapsed * 1e3))
+
+
+if __name__ == "__main__":
+    main()
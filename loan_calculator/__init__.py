@@ -24,10 +24,11 @@
 
 """Loan Calculator"""
 
-from loan_calculator.loan import Loan
+from loan_calculator.loan import FrozenLoan, Loan
 from loan_calculator.utils import display_summary
 from loan_calculator.grossup.iof import IofGrossup
 from loan_calculator.projection import Projection
+from loan_calculator.return_dates import generate_return_dates, PaymentFrequency
 from loan_calculator.schedule.base import AmortizationScheduleType
 from loan_calculator.grossup.base import GrossupType
 from loan_calculator.interest_rate import (
@@ -38,6 +39,7 @@ from loan_calculator.interest_rate import (
 
 __all__ = [
     "Loan",
+    "FrozenLoan",
     "IofGrossup",
     "Projection",
     "AmortizationScheduleType",
@@ -45,6 +47,8 @@ __all__ = [
     "convert_to_daily_interest_rate",
     "InterestRateType",
     "display_summary",
+    "generate_return_dates",
+    "PaymentFrequency",
     "YearSizeType",
 ]
 
@@ -0,0 +1,36 @@
+"""Vectorized implementations for batches of loans.
+
+This subpackage depends on NumPy, which is an optional dependency of this
+library and can be installed with the extra ``batch``.
+"""
+
+from loan_calculator.batch.accrual import BatchAccrual
+from loan_calculator.batch.affordability import max_principals
+from loan_calculator.batch.book import LoanBook, ragged_offsets
+from loan_calculator.batch.indexed import (
+    BatchInflationIndexedSchedule,
+    inflation_index_numbers,
+)
+from loan_calculator.batch.rate import implied_interest_rates
+from loan_calculator.batch.scenarios import RateShockScenarios
+from loan_calculator.batch.schedule import (
+    Accrual,
+    BatchSchedule,
+    index_factors,
+    pad_return_days,
+)
+
+__all__ = [
+    "Accrual",
+    "BatchAccrual",
+    "BatchInflationIndexedSchedule",
+    "BatchSchedule",
+    "implied_interest_rates",
+    "index_factors",
+    "inflation_index_numbers",
+    "LoanBook",
+    "max_principals",
+    "pad_return_days",
+    "ragged_offsets",
+    "RateShockScenarios",
+]
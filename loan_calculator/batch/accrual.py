@@ -0,0 +1,203 @@
+from datetime import timedelta
+
+import numpy as np
+
+from loan_calculator.batch.schedule import (
+    Accrual,
+    BatchSchedule,
+    search_keys,
+    search_paid_instalments,
+)
+from loan_calculator.schedule.base import memoized_property
+
+
+class BatchAccrual(object):
+    """Daily accrual of a book of loans.
+
+    The schedules of all loans are built once as a BatchSchedule and each
+    accrual run is then a handful of vectorized operations over the loans:
+    the number of days of each loan up to the reference date is counted with
+    NumPy's calendar routines, the last payment of each loan is found by
+    binary search, and its balance is capitalized up to the reference date.
+
+    Parameters
+    ----------
+    batch_schedule: BatchSchedule, required
+        Batch schedule of the loans.
+    capitalization_start_dates: array_like, required
+        Capitalization start date of each loan.
+    count_working_days: array_like, optional
+        Whether to count only working days, for each loan or for all of them.
+        (default False)
+    include_end_date: array_like, optional
+        Whether to include the end date when counting calendar days, for
+        each loan or for all of them. (default False)
+    return_dates: array_like, optional
+        Return dates of the loans, padded as the return days of the batch
+        schedule. A return date on a weekend counts as many working days as
+        the Friday before it, so the payments made are found by searching
+        the reference date in the return dates, if given, rather than its
+        number of days in the return days. (default None)
+    """
+
+    def __init__(
+        self,
+        batch_schedule,
+        capitalization_start_dates,
+        count_working_days=False,
+        include_end_date=False,
+        return_dates=None,
+    ):
+        """Initialize batch accrual."""
+
+        self.batch_schedule = batch_schedule
+
+        self.capitalization_start_dates = np.asarray(
+            capitalization_start_dates, dtype="datetime64[D]"
+        )
+        self.count_working_days = np.broadcast_to(
+            np.asarray(count_working_days, dtype=bool),
+            self.capitalization_start_dates.shape,
+        )
+        self.include_end_date = np.broadcast_to(
+            np.asarray(include_end_date, dtype=bool),
+            self.capitalization_start_dates.shape,
+        )
+        self.return_dates = (
+            None
+            if return_dates is None
+            else np.asarray(return_dates, dtype="datetime64[D]")
+        )
+
+    @classmethod
+    def from_loans(cls, loans):
+        """Build the batch accrual of the given loans or LoanBook."""
+
+        # imported here since the book module builds batch accruals
+        from loan_calculator.batch.book import LoanBook
+
+        if isinstance(loans, LoanBook):
+            return loans.batch_accrual
+
+        batch_schedule = BatchSchedule.from_loans(loans)
+        return_dates = None
+
+        if all(loan.return_dates is not None for loan in loans):
+            return_dates = np.zeros(batch_schedule.mask.shape, dtype="datetime64[D]")
+            return_dates[batch_schedule.mask] = [
+                r_date for loan in loans for r_date in loan.return_dates
+            ]
+
+        return cls(
+            batch_schedule,
+            [loan.capitalization_start_date for loan in loans],
+            [loan.count_working_days for loan in loans],
+            [loan.include_end_date for loan in loans],
+            return_dates=return_dates,
+        )
+
+    def __len__(self):
+        return len(self.capitalization_start_dates)
+
+    @memoized_property
+    def _working_days_rows(self):
+        return np.flatnonzero(self.count_working_days)
+
+    def count_days(self, reference_date):
+        """Number of days of each loan up to the reference date.
+
+        The days are counted as in `Loan.balance_at`, i.e., from the
+        capitalization start date of each loan and according to its day
+        count flags, and are zero up to the capitalization start date.
+        """
+
+        start = self.capitalization_start_dates
+        end = np.datetime64(reference_date, "D")
+
+        days = (end - start).astype(np.int64) + self.include_end_date
+
+        rows = self._working_days_rows
+        if len(rows):
+            # weekdays from the start date up to the end date, inclusive
+            days[rows] = np.busday_count(start[rows], end + 1)
+
+        return np.where(start < end, days, 0)
+
+    @memoized_property
+    def _return_date_keys(self):
+        """Calendar days from the capitalization start dates to the return dates."""
+
+        days = (self.return_dates - self.capitalization_start_dates[:, None]).astype(
+            np.int64
+        )
+
+        return search_keys(days, self.batch_schedule.mask)
+
+    def count_paid(self, reference_date):
+        """Number of payments made by each loan up to the reference date.
+
+        The payments due on the reference date are considered made. The
+        payments are counted from the return dates, if given, and None is
+        returned otherwise, in which case they are found from the number of
+        days of each loan by the batch schedule.
+        """
+
+        if self.return_dates is None:
+            return None
+
+        return search_paid_instalments(
+            self._return_date_keys,
+            (
+                np.datetime64(reference_date, "D") - self.capitalization_start_dates
+            ).astype(np.int64),
+        )
+
+    def accrue(self, reference_date):
+        """Balance and accrued interest of each loan at the reference date.
+
+        Returns
+        -------
+        Accrual
+            Named tuple with the arrays of balances and interest accrued
+            since the last due date of each loan.
+        """
+
+        return self.batch_schedule.accrue_at_days(
+            self.count_days(reference_date), self.count_paid(reference_date)
+        )
+
+    def accrue_between(self, start_date, end_date, working_days_only=False):
+        """Balance and accrued interest of each loan on a range of dates.
+
+        Parameters
+        ----------
+        start_date: datetime.date, required
+            First reference date.
+        end_date: datetime.date, required
+            Last reference date, inclusive.
+        working_days_only: bool, optional
+            Whether to skip Saturdays and Sundays. (default False)
+
+        Returns
+        -------
+        tuple
+            List of reference dates and an Accrual whose fields are matrices
+            with a row for each reference date and a column for each loan.
+        """
+
+        reference_dates = [
+            start_date + timedelta(i)
+            for i in range((end_date - start_date).days + 1)
+            if not working_days_only or (start_date + timedelta(i)).weekday() < 5
+        ]
+
+        accruals = [self.accrue(r_date) for r_date in reference_dates]
+
+        return reference_dates, Accrual(
+            np.array([accrual.balance for accrual in accruals]).reshape(
+                len(reference_dates), len(self)
+            ),
+            np.array([accrual.accrued_interest for accrual in accruals]).reshape(
+                len(reference_dates), len(self)
+            ),
+        )
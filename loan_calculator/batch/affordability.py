@@ -0,0 +1,107 @@
+import numpy as np
+
+from loan_calculator.batch.schedule import BatchSchedule, pad_return_days
+from loan_calculator.schedule.base import AmortizationScheduleType
+
+
+def max_principals(
+    target_payments,
+    daily_interest_rates,
+    return_days,
+    amortization_schedule_type=AmortizationScheduleType.progressive_price_schedule,
+    daily_iof_aliquot=None,
+    complementary_iof_aliquot=0.0038,
+    service_fee_aliquot=0.0,
+):
+    """Largest principals whose due payments fit the target payments.
+
+    Every schedule is linear on the principal, so if :math:`P_j` are the due
+    payments of the schedule with unit principal, the largest principal
+    whose due payments do not exceed the target payment :math:`T` is
+
+    .. math::
+
+        s = \\frac{T}{\\max_j P_j},
+
+    which is :math:`T\\sum_j v_j` for Price schedules. The unit schedules of
+    every applicant and term are evaluated at once as a BatchSchedule.
+
+    If the daily IOF aliquot is given, the principal is taken as grossed up
+    for the IOF tax and the service fee, following the model of IofGrossup,
+    and the net principal made available to the borrower is returned
+    instead, i.e.,
+
+    .. math::
+
+        s\\left(1 - \\sum_j A_j\\min(n_jI^*, 0.015) - I^{**} - g\\right),
+
+    where :math:`A_j` are the amortizations of the unit schedule.
+
+    Parameters
+    ----------
+    target_payments: array_like, required
+        Maximum payment of each applicant, or a single one for all of them.
+    daily_interest_rates: array_like, required
+        Daily interest rate of each applicant, or a single one for all of
+        them.
+    return_days: list, required
+        List with the return days of each term.
+    amortization_schedule_type: AmortizationScheduleType, optional
+        Schedule type of the loans.
+        (default AmortizationScheduleType.progressive_price_schedule)
+    daily_iof_aliquot: float, optional
+        Reduced IOF tax aliquot, in which case the net principals are
+        returned. (default None)
+    complementary_iof_aliquot: float, optional
+        Complementary IOF tax aliquot. (default 0.0038)
+    service_fee_aliquot: float, optional
+        Aliquot of the service fee over the principal. (default 0.0)
+
+    Returns
+    -------
+    numpy.ndarray
+        Matrix with the principal of each applicant in a row and of each term
+        in a column.
+    """
+
+    target_payments = np.asarray(target_payments, dtype=float)
+    daily_interest_rates = np.asarray(daily_interest_rates, dtype=float)
+
+    num_applicants = np.broadcast(target_payments, daily_interest_rates).size
+    num_terms = len(return_days)
+
+    days, mask = pad_return_days(return_days)
+
+    unit_schedule = BatchSchedule(
+        np.ones(num_applicants * num_terms),
+        np.repeat(np.broadcast_to(daily_interest_rates, (num_applicants,)), num_terms),
+        np.tile(days, (num_applicants, 1)),
+        amortization_schedule_type,
+        mask=np.tile(mask, (num_applicants, 1)),
+    )
+
+    if AmortizationScheduleType(amortization_schedule_type) == (
+        AmortizationScheduleType.constant_amortization_schedule
+    ):
+        max_payments = unit_schedule.due_payments.max(axis=1)
+    else:
+        max_payments = unit_schedule.pmt
+
+    principals = np.broadcast_to(target_payments, (num_applicants,))[
+        :, None
+    ] / max_payments.reshape(num_applicants, num_terms)
+
+    if daily_iof_aliquot is None:
+        return principals
+
+    iof = (
+        unit_schedule.amortizations
+        * np.minimum(unit_schedule.return_days * daily_iof_aliquot, 0.015)
+    ).sum(axis=1)
+
+    return principals * (
+        1
+        - iof.reshape(num_applicants, num_terms)
+        - complementary_iof_aliquot
+        - service_fee_aliquot
+    )
@@ -0,0 +1,349 @@
+import numpy as np
+
+from loan_calculator.batch.accrual import BatchAccrual
+from loan_calculator.batch.schedule import BatchSchedule, schedule_type_values
+from loan_calculator.interest_rate import YearSizeType
+from loan_calculator.loan import Loan, RoundStrategy
+from loan_calculator.schedule.base import AmortizationScheduleType, memoized_property
+
+
+def ragged_offsets(ragged):
+    """Offsets of the rows of a ragged list of lists in its flattened values.
+
+    The values of the i-th row are at positions ``offsets[i]`` to
+    ``offsets[i+1]``, as in the compressed sparse row layout.
+    """
+
+    offsets = np.zeros(len(ragged) + 1, dtype=np.int64)
+    np.cumsum(
+        np.fromiter((len(row) for row in ragged), dtype=np.int64, count=len(ragged)),
+        out=offsets[1:],
+    )
+
+    return offsets
+
+
+class LoanBook(object):
+    """Columnar book of fixed rate loans.
+
+    The loans are held as a structure of NumPy arrays, with a column for
+    each parameter of the loans, instead of a list of Loan objects. The
+    ragged return days of the loans are held in the compressed sparse row
+    layout, i.e., the return days of all loans are concatenated in
+    ``return_days`` and the return days of the i-th loan are at positions
+    ``offsets[i]`` to ``offsets[i+1]``, and so are the return dates.
+
+    The schedules of the whole book are evaluated at once by a lazily built
+    BatchSchedule, whose padded columns are exposed by the book, and a Loan
+    for a single row is built on demand by indexing the book. As the batch
+    schedules, the columns of a book are not rounded.
+
+    Parameters
+    ----------
+    principals: array_like, required
+        Principal of each loan.
+    daily_interest_rates: array_like, required
+        Daily interest rate of each loan, or a single rate for all of them.
+    start_dates: array_like, required
+        Start date of each loan.
+    return_days: list or array_like, required
+        Either a list with the return days of each loan, counted from its
+        capitalization start date, or the concatenated return days of all
+        loans, in which case `offsets` must be given.
+    offsets: array_like, optional
+        Offsets of the return days of each loan in the concatenated return
+        days. (default None)
+    return_dates: list or array_like, optional
+        Return dates laid out as the return days. They are derived from the
+        return days by the loans counting calendar days if not given, while
+        the loans counting working days have no return dates. (default None)
+    amortization_schedule_type: AmortizationScheduleType or list, optional
+        Either the schedule type of all loans or a list with the schedule type
+        of each loan. (default AmortizationScheduleType.progressive_price_schedule)
+    grace_periods: array_like, optional
+        Grace period of each loan, or a single one for all of them.
+        (default 0)
+    year_sizes: array_like, optional
+        Year size of each loan, or a single one for all of them.
+        (default YearSizeType.commercial)
+    month_sizes: array_like, optional
+        Month size of each loan, or a single one for all of them, held as
+        given in an object array, since it may be None. (default None)
+    count_working_days: array_like, optional
+        Whether each loan counts only working days, or a single flag for all
+        of them. (default False)
+    include_end_date: array_like, optional
+        Whether each loan includes the end date when counting calendar days,
+        or a single flag for all of them. (default False)
+    """
+
+    def __init__(
+        self,
+        principals,
+        daily_interest_rates,
+        start_dates,
+        return_days,
+        offsets=None,
+        return_dates=None,
+        amortization_schedule_type=(
+            AmortizationScheduleType.progressive_price_schedule
+        ),
+        grace_periods=0,
+        year_sizes=YearSizeType.commercial,
+        month_sizes=None,
+        count_working_days=False,
+        include_end_date=False,
+    ):
+        """Initialize loan book."""
+
+        self.principals = np.asarray(principals, dtype=float)
+        shape = self.principals.shape
+
+        self.daily_interest_rates = np.broadcast_to(
+            np.asarray(daily_interest_rates, dtype=float), shape
+        )
+        self.start_dates = np.asarray(start_dates, dtype="datetime64[D]")
+
+        if offsets is None:
+            self.offsets = ragged_offsets(return_days)
+            self.return_days = np.fromiter(
+                (n for r_days in return_days for n in r_days),
+                dtype=np.int64,
+                count=int(self.offsets[-1]),
+            )
+            if return_dates is not None:
+                return_dates = [
+                    r_date for r_dates in return_dates for r_date in r_dates
+                ]
+        else:
+            self.offsets = np.asarray(offsets, dtype=np.int64)
+            self.return_days = np.asarray(return_days, dtype=np.int64)
+
+        self.return_dates = (
+            None
+            if return_dates is None
+            else np.asarray(return_dates, dtype="datetime64[D]")
+        )
+
+        self.schedule_types = schedule_type_values(
+            amortization_schedule_type, len(self)
+        )
+
+        self.grace_periods = np.broadcast_to(
+            np.asarray(grace_periods, dtype=np.int64), shape
+        )
+        self.year_sizes = np.broadcast_to(np.asarray(year_sizes, dtype=np.int64), shape)
+        self.month_sizes = np.broadcast_to(np.asarray(month_sizes, dtype=object), shape)
+        self.count_working_days = np.broadcast_to(
+            np.asarray(count_working_days, dtype=bool), shape
+        )
+        self.include_end_date = np.broadcast_to(
+            np.asarray(include_end_date, dtype=bool), shape
+        )
+
+        if len(self.offsets) != len(self) + 1:
+            raise ValueError("There must be an offset for each loan plus one.")
+
+    @classmethod
+    def from_loans(cls, loans):
+        """Build the book of the given loans.
+
+        Loans indexed to a rate or inflation index can not be held by a book,
+        nor can rounded loans, since the columns of a book are not rounded.
+        The return dates are kept only if every loan has them.
+        """
+
+        if any(
+            loan.rate_index is not None or loan.inflation_index is not None
+            for loan in loans
+        ):
+            raise ValueError("Indexed loans can not be held by a loan book.")
+
+        if any(loan.round_strategy != RoundStrategy.none for loan in loans):
+            raise ValueError("Rounded loans can not be held by a loan book.")
+
+        return cls(
+            [loan.principal for loan in loans],
+            [loan.daily_interest_rate for loan in loans],
+            [loan.start_date for loan in loans],
+            [loan.return_days for loan in loans],
+            return_dates=(
+                None
+                if any(loan.return_dates is None for loan in loans)
+                else [loan.return_dates for loan in loans]
+            ),
+            amortization_schedule_type=[
+                loan.amortization_schedule_type for loan in loans
+            ],
+            grace_periods=[loan.grace_period for loan in loans],
+            year_sizes=[loan.year_size for loan in loans],
+            month_sizes=[loan.month_size for loan in loans],
+            count_working_days=[loan.count_working_days for loan in loans],
+            include_end_date=[loan.include_end_date for loan in loans],
+        )
+
+    def __len__(self):
+        return len(self.principals)
+
+    def __getitem__(self, i):
+        """Loan in the i-th row of the book."""
+
+        i = range(len(self))[i]
+        start, stop = self.offsets[i], self.offsets[i + 1]
+
+        return Loan.from_return_days(
+            float(self.principals[i]),
+            float(self.daily_interest_rates[i]),
+            self.start_dates[i].item(),
+            self.return_days[start:stop].tolist(),
+            return_dates=(
+                None
+                if self.return_dates is None
+                else self.return_dates[start:stop].tolist()
+            ),
+            year_size=int(self.year_sizes[i]),
+            month_size=self.month_sizes[i],
+            grace_period=int(self.grace_periods[i]),
+            amortization_schedule_type=AmortizationScheduleType(
+                str(self.schedule_types[i])
+            ),
+            count_working_days=bool(self.count_working_days[i]),
+            include_end_date=bool(self.include_end_date[i]),
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def take(self, rows):
+        """Book with the loans in the given rows, e.g., a boolean mask."""
+
+        rows = np.arange(len(self))[rows]
+
+        lengths = self.num_instalments[rows]
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        # position of each return day of the selected loans in the book
+        positions = np.repeat(self.offsets[rows] - offsets[:-1], lengths) + np.arange(
+            offsets[-1]
+        )
+
+        return LoanBook(
+            self.principals[rows],
+            self.daily_interest_rates[rows],
+            self.start_dates[rows],
+            self.return_days[positions],
+            offsets=offsets,
+            return_dates=(
+                None if self.return_dates is None else self.return_dates[positions]
+            ),
+            amortization_schedule_type=self.schedule_types[rows],
+            grace_periods=self.grace_periods[rows],
+            year_sizes=self.year_sizes[rows],
+            month_sizes=self.month_sizes[rows],
+            count_working_days=self.count_working_days[rows],
+            include_end_date=self.include_end_date[rows],
+        )
+
+    @property
+    def num_instalments(self):
+        return np.diff(self.offsets)
+
+    @property
+    def annual_interest_rates(self):
+        return (1 + self.daily_interest_rates) ** self.year_sizes - 1
+
+    @property
+    def capitalization_start_dates(self):
+        return self.start_dates + self.grace_periods.astype("timedelta64[D]")
+
+    @memoized_property
+    def padded_return_days(self):
+        """Return days padded into a matrix and their mask, see pad_return_days."""
+
+        lengths = self.num_instalments
+        mask = np.arange(lengths.max(initial=0)) < lengths[:, None]
+
+        days = np.zeros(mask.shape, dtype=np.int64)
+        days[mask] = self.return_days
+
+        return days, mask
+
+    @memoized_property
+    def batch_schedule(self):
+        """BatchSchedule of the loans, whose rows are the loans of the book."""
+
+        days, mask = self.padded_return_days
+
+        return BatchSchedule(
+            self.principals,
+            self.daily_interest_rates,
+            days,
+            self.schedule_types,
+            mask=mask,
+        )
+
+    @memoized_property
+    def batch_accrual(self):
+        """BatchAccrual of the loans, whose rows are the loans of the book."""
+
+        return_dates = None
+
+        if self.return_dates is not None:
+            mask = self.padded_return_days[1]
+            return_dates = np.zeros(mask.shape, dtype="datetime64[D]")
+            return_dates[mask] = self.return_dates
+
+        return BatchAccrual(
+            self.batch_schedule,
+            self.capitalization_start_dates,
+            self.count_working_days,
+            self.include_end_date,
+            return_dates=return_dates,
+        )
+
+    def flatten(self, column):
+        """Values of a padded column laid out as the return days.
+
+        Parameters
+        ----------
+        column: array_like, required
+            Matrix with a row for each loan and a column for each return
+            day, such as the due payments.
+        """
+
+        return np.asarray(column)[self.padded_return_days[1]]
+
+    def accrue(self, reference_date):
+        """Balance and accrued interest of each loan at the reference date."""
+
+        return self.batch_accrual.accrue(reference_date)
+
+    @property
+    def balance(self):
+        return self.batch_schedule.balance
+
+    @property
+    def due_payments(self):
+        return self.batch_schedule.due_payments
+
+    @property
+    def interest_payments(self):
+        return self.batch_schedule.interest_payments
+
+    @property
+    def amortizations(self):
+        return self.batch_schedule.amortizations
+
+    @property
+    def total_paid(self):
+        return self.batch_schedule.total_paid
+
+    @property
+    def total_amortization(self):
+        return self.batch_schedule.total_amortization
+
+    @property
+    def total_interest(self):
+        return self.batch_schedule.total_interest
@@ -0,0 +1,182 @@
+import numpy as np
+
+from loan_calculator.batch.schedule import Accrual, BatchSchedule, pad_return_days
+from loan_calculator.schedule.base import memoized_property
+
+
+def inflation_index_numbers(inflation_index, month_offsets):
+    """Index numbers of an InflationIndex at an array of month offsets."""
+
+    index_numbers = np.array(inflation_index.index_numbers)
+    m = len(index_numbers) - 1
+
+    return np.where(
+        month_offsets <= m,
+        index_numbers[np.clip(month_offsets, 0, m)],
+        index_numbers[m]
+        * (1 + inflation_index.projected_rate) ** np.maximum(month_offsets - m, 0.0),
+    )
+
+
+class BatchInflationIndexedSchedule(object):
+    """Inflation indexed schedules of many loans at once.
+
+    Implement the same correction as InflationIndexedSchedule over the
+    columns of a BatchSchedule in real terms. All loans share the same
+    InflationIndex, whose index numbers are looked up by the precomputed
+    month offsets of each payment, so that revaluing the whole book after a
+    new print of the index is a vectorized pass.
+
+    Parameters
+    ----------
+    batch_schedule: BatchSchedule, required
+        Schedules of the loans in real terms.
+    inflation_index: InflationIndex, required
+        Inflation index shared by the loans.
+    month_offsets: list or array_like, required
+        Either a list with the month offset of each payment of each loan, or
+        a matrix padded as the return days of the batch schedule.
+    base_month_offsets: array_like, optional
+        Month at which the principal of each loan is given, or a single
+        month for all of them. (default 0)
+    """
+
+    columns = (
+        "correction_factors",
+        "balance",
+        "due_payments",
+        "interest_payments",
+        "amortizations",
+        "monetary_corrections",
+    )
+
+    def __init__(
+        self, batch_schedule, inflation_index, month_offsets, base_month_offsets=0
+    ):
+        """Initialize batch schedule."""
+
+        self.batch_schedule = batch_schedule
+        self.inflation_index = inflation_index
+
+        if isinstance(month_offsets, np.ndarray):
+            self.month_offsets = month_offsets.astype(np.int64)
+        else:
+            self.month_offsets, _ = pad_return_days(month_offsets)
+
+        self.base_month_offsets = np.broadcast_to(
+            np.asarray(base_month_offsets, dtype=np.int64),
+            batch_schedule.principals.shape,
+        )
+
+    @classmethod
+    def from_loans(cls, loans):
+        """Build the batch schedule of the given inflation indexed loans.
+
+        The loans must all share the same inflation index.
+        """
+
+        if len({id(loan.inflation_index) for loan in loans}) > 1:
+            raise ValueError(
+                "The loans of a batch must share the same inflation index."
+            )
+
+        return cls(
+            BatchSchedule.from_loans(loans),
+            loans[0].inflation_index,
+            [
+                [loan._inflation_month_offset(r_date) for r_date in loan.return_dates]
+                for loan in loans
+            ],
+            [loan._inflation_month_offset(loan.start_date) for loan in loans],
+        )
+
+    def __len__(self):
+        return len(self.batch_schedule)
+
+    def revalue(self):
+        """Discard every column after the inflation index was updated."""
+
+        for name in self.columns:
+            delattr(self, name)
+
+    def correction_factors_at(self, month_offsets):
+        """Correction factors of each loan at the given month offsets."""
+
+        base = self.base_month_offsets.reshape(
+            (-1,) + (1,) * (np.ndim(month_offsets) - 1)
+        )
+
+        return inflation_index_numbers(
+            self.inflation_index, np.asarray(month_offsets)
+        ) / inflation_index_numbers(self.inflation_index, base)
+
+    @memoized_property
+    def correction_factors(self):
+        return np.where(
+            self.batch_schedule.mask,
+            self.correction_factors_at(self.month_offsets),
+            0.0,
+        )
+
+    @memoized_property
+    def balance(self):
+
+        balance = self.batch_schedule.balance.copy()
+        balance[:, 1:] *= self.correction_factors
+
+        return balance
+
+    @memoized_property
+    def due_payments(self):
+        return self.batch_schedule.due_payments * self.correction_factors
+
+    @memoized_property
+    def interest_payments(self):
+        return self.batch_schedule.interest_payments * self.correction_factors
+
+    @memoized_property
+    def amortizations(self):
+        return self.batch_schedule.amortizations * self.correction_factors
+
+    @memoized_property
+    def monetary_corrections(self):
+
+        c = self.correction_factors
+        c_prev = np.concatenate([np.ones((len(self), 1)), c[:, :-1]], axis=1)
+
+        return np.where(
+            self.batch_schedule.mask,
+            self.batch_schedule.balance[:, :-1] * (c - c_prev),
+            0.0,
+        )
+
+    @property
+    def total_paid(self):
+        return self.due_payments.sum(axis=1)
+
+    @property
+    def total_amortization(self):
+        return self.amortizations.sum(axis=1)
+
+    @property
+    def total_interest(self):
+        return self.interest_payments.sum(axis=1)
+
+    @property
+    def total_monetary_correction(self):
+        return self.monetary_corrections.sum(axis=1)
+
+    def accrue_at_days(self, days, month_offsets):
+        """Corrected balance and accrued interest after the given days.
+
+        The real balance and accrued interest, as in
+        `BatchSchedule.accrue_at_days`, are corrected up to the given month
+        offset of each loan.
+        """
+
+        accrual = self.batch_schedule.accrue_at_days(days)
+        c = self.correction_factors_at(
+            np.broadcast_to(np.asarray(month_offsets, dtype=np.int64), (len(self),))
+        )
+
+        return Accrual(accrual.balance * c, accrual.accrued_interest * c)
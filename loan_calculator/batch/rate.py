@@ -0,0 +1,185 @@
+import numpy as np
+
+from loan_calculator.batch.schedule import pad_return_days, schedule_type_values
+from loan_calculator.interest_rate import (
+    convert_interest_rate,
+    InterestRateType,
+    YearSizeType,
+)
+from loan_calculator.schedule.base import AmortizationScheduleType
+
+
+def _price_daily_interest_rates(
+    payments, principals, days, mask, maximum_relative_error, max_iterations
+):
+    """Solve the PMT equation of Price schedules for the daily interest rates.
+
+    The root of :math:`f(d) = P\\sum_jv_j - s` is searched by Newton-Raphson
+    iterations safeguarded by bisection over a bracket of it. The function
+    :math:`f` is decreasing and convex, with :math:`f(0) = kP - s \\geq 0` and
+    :math:`f(\\bar d)\\leq 0` for :math:`\\bar d = (kP/s)^{1/n_1} - 1`, since
+    every discount factor is at most :math:`(1+\\bar d)^{-n_1}`. Each
+    iteration updates the bracket with the sign of :math:`f` and takes the
+    Newton step if it falls inside of it, or bisects it otherwise. Only the
+    rows yet to converge are evaluated.
+    """
+
+    num_instalments = mask.sum(axis=1)
+
+    lower = np.zeros(len(payments))
+    upper = (num_instalments * payments / principals) ** (1.0 / days[:, 0]) - 1
+    rates = lower.copy()
+
+    active = np.flatnonzero(num_instalments * payments >= principals)
+    days = days.astype(float)
+
+    for _ in range(max_iterations):
+
+        if not len(active):
+            break
+
+        d = rates[active]
+        v = np.where(mask[active], (1 + d[:, None]) ** -days[active], 0.0)
+
+        f = payments[active] * v.sum(axis=1) - principals[active]
+        df = -payments[active] * (days[active] * v).sum(axis=1) / (1 + d)
+
+        lower[active] = np.where(f > 0, d, lower[active])
+        upper[active] = np.where(f < 0, d, upper[active])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = d - f / df
+
+        bisection = (lower[active] + upper[active]) / 2
+        inside = (newton >= lower[active]) & (newton <= upper[active])
+        new_d = np.where(inside, newton, bisection)
+
+        rates[active] = new_d
+
+        converged = (f == 0) | (
+            np.abs(new_d - d) <= maximum_relative_error * np.abs(new_d)
+        )
+        active = active[~converged]
+
+    rates[num_instalments * payments < principals] = np.nan
+
+    return rates
+
+
+def implied_interest_rates(
+    payments,
+    principals,
+    return_days,
+    amortization_schedule_type=AmortizationScheduleType.progressive_price_schedule,
+    interest_rate_type=InterestRateType.daily,
+    year_size=YearSizeType.commercial,
+    month_size=None,
+    mask=None,
+    maximum_relative_error=1e-12,
+    max_iterations=100,
+):
+    """Interest rates implied by the instalments of many quotes at once.
+
+    For Price schedules, the instalment :math:`P` of a principal :math:`s`
+    and return days :math:`n_1,\\ldots,n_k` implies the daily interest rate
+    :math:`d` solving
+
+    .. math::
+
+        P\\sum_{j=1}^k\\frac{1}{(1+d)^{n_j}} = s,
+
+    which has no closed form and is solved for every quote at once by a
+    vectorized Newton-Raphson search safeguarded by bisection. For constant
+    amortization schedules, the instalment is taken to be the first due
+    payment, :math:`P_1 = s/k + s((1+d)^{n_1} - 1)`, which is solved in
+    closed form.
+
+    Quotes whose instalments do not pay off their principals at a
+    non-negative interest rate have NaN rates.
+
+    Parameters
+    ----------
+    payments: array_like, required
+        Instalment of each quote.
+    principals: array_like, required
+        Principal of each quote, or a single one for all of them.
+    return_days: list or array_like, required
+        Either a list with the return days of each quote, or an integer
+        matrix with the return days of each quote in a row, in which case
+        `mask` tells the actual return days.
+    amortization_schedule_type: AmortizationScheduleType or list, optional
+        Either the schedule type of all quotes or a list with the schedule
+        type of each quote.
+        (default AmortizationScheduleType.progressive_price_schedule)
+    interest_rate_type: InterestRateType, optional
+        Type of the returned interest rates. (default InterestRateType.daily)
+    year_size: int, optional
+        Year size for converting the daily interest rates.
+        (default YearSizeType.commercial)
+    month_size: int, optional
+        Month size for converting the daily interest rates. (default None)
+    mask: array_like, optional
+        Boolean matrix with the actual return days, when `return_days` is
+        already padded. (default None)
+    maximum_relative_error: float, optional
+        Relative change of the daily interest rates below which the search
+        stops. (default 1e-12)
+    max_iterations: int, optional
+        Maximum number of iterations of the search. (default 100)
+
+    Returns
+    -------
+    numpy.ndarray
+        Interest rate of each quote, of the given type.
+    """
+
+    if mask is None and not isinstance(return_days, np.ndarray):
+        days, mask = pad_return_days(return_days)
+    else:
+        days = np.asarray(return_days, dtype=np.int64)
+        mask = (
+            np.ones(days.shape, dtype=bool)
+            if mask is None
+            else np.asarray(mask, dtype=bool)
+        )
+
+    payments = np.broadcast_to(np.asarray(payments, dtype=float), (len(days),))
+    principals = np.broadcast_to(np.asarray(principals, dtype=float), (len(days),))
+
+    schedule_types = schedule_type_values(amortization_schedule_type, len(days))
+    constant_rows = (
+        schedule_types == AmortizationScheduleType.constant_amortization_schedule.value
+    )
+    price_rows = ~constant_rows
+
+    rates = np.full(len(days), np.nan)
+
+    rates[price_rows] = _price_daily_interest_rates(
+        payments[price_rows],
+        principals[price_rows],
+        days[price_rows],
+        mask[price_rows],
+        maximum_relative_error,
+        max_iterations,
+    )
+
+    # (1 + d)^{n_1} = 1 + P_1/s - 1/k
+    first_period_factors = (
+        1
+        + payments[constant_rows] / principals[constant_rows]
+        - 1 / mask[constant_rows].sum(axis=1)
+    )
+    with np.errstate(invalid="ignore"):
+        rates[constant_rows] = np.where(
+            first_period_factors >= 1,
+            first_period_factors ** (1.0 / days[constant_rows, 0]) - 1,
+            np.nan,
+        )
+
+    return convert_interest_rate(
+        rates,
+        InterestRateType.daily,
+        InterestRateType(interest_rate_type),
+        year_size,
+        month_size,
+    )
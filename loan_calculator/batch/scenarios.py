@@ -0,0 +1,130 @@
+import numpy as np
+
+from loan_calculator.batch.book import LoanBook
+from loan_calculator.batch.schedule import BatchSchedule
+from loan_calculator.schedule.base import memoized_property
+
+
+class RateShockScenarios(object):
+    """Book of loans repriced under shocks of their annual interest rates.
+
+    In the :math:`s`-th scenario, the annual interest rate :math:`i` of each
+    loan is shifted to :math:`i+\\Delta_s`, e.g., :math:`\\Delta_s=0.001` for
+    a shock of 10 basis points, and the daily interest rate is converted with
+    the loan's year size. The schedules of each scenario are a BatchSchedule
+    sharing the padded return days of the book, so only the discount factors
+    and the columns derived from them are recalculated, for all loans at
+    once. The schedules are built one scenario at a time and not kept. The
+    results are matrices with a row for each scenario and a column for each
+    loan.
+
+    The present value of a loan in a scenario is the value of its
+    contractual due payments discounted at the shocked rate, i.e.,
+    :math:`\\sum_j P_jv_j`, which is the principal if the shift is null.
+
+    Parameters
+    ----------
+    book: LoanBook, required
+        Book of loans, or a list of loans from which it is built.
+    rate_shifts: array_like, required
+        Shift of the annual interest rates in each scenario.
+    """
+
+    def __init__(self, book, rate_shifts):
+        """Initialize scenarios."""
+
+        if not isinstance(book, LoanBook):
+            book = LoanBook.from_loans(book)
+
+        self.book = book
+        self.rate_shifts = np.asarray(rate_shifts, dtype=float)
+
+        self.annual_interest_rates = (
+            book.annual_interest_rates[None, :] + self.rate_shifts[:, None]
+        )
+        self.daily_interest_rates = (1 + self.annual_interest_rates) ** (
+            1.0 / book.year_sizes
+        ) - 1
+
+    def __len__(self):
+        return len(self.rate_shifts)
+
+    def schedule(self, scenario):
+        """BatchSchedule of the loans in the given scenario."""
+
+        days, mask = self.book.padded_return_days
+
+        return BatchSchedule(
+            self.book.principals,
+            self.daily_interest_rates[scenario],
+            days,
+            self.book.schedule_types,
+            mask=mask,
+        )
+
+    @memoized_property
+    def summary(self):
+        """PMT, total paid, total interest and present value in each scenario.
+
+        The schedule of each scenario is built, reduced to these values and
+        discarded before the next one, so a single scenario's schedule is
+        held in memory at a time.
+        """
+
+        due_payments = self.book.due_payments
+        summary = np.empty((4, len(self), len(self.book)))
+
+        for s in range(len(self)):
+            schedule = self.schedule(s)
+
+            summary[0, s] = schedule.pmt
+            summary[1, s] = schedule.total_paid
+            summary[2, s] = schedule.total_interest
+            summary[3, s] = (schedule.discount_factors * due_payments).sum(axis=1)
+
+        return summary
+
+    @property
+    def pmt(self):
+        """PMT of each Price schedule, NaN for constant amortization ones."""
+
+        return self.summary[0]
+
+    @property
+    def total_paid(self):
+        return self.summary[1]
+
+    @property
+    def total_interest(self):
+        return self.summary[2]
+
+    @property
+    def present_values(self):
+        """Present value of the contractual due payments in each scenario."""
+
+        return self.summary[3]
+
+    def balances_at_days(self, days, num_paid=None):
+        """Balance of each loan after the given days in each scenario.
+
+        See `BatchSchedule.accrue_at_days`.
+        """
+
+        balances = np.empty((len(self), len(self.book)))
+
+        for s in range(len(self)):
+            balances[s] = self.schedule(s).accrue_at_days(days, num_paid).balance
+
+        return balances
+
+    def balances_at(self, reference_date):
+        """Balance of each loan at the reference date in each scenario.
+
+        See `BatchAccrual.accrue`.
+        """
+
+        accrual = self.book.batch_accrual
+
+        return self.balances_at_days(
+            accrual.count_days(reference_date), accrual.count_paid(reference_date)
+        )
@@ -0,0 +1,457 @@
+from collections import namedtuple
+
+import numpy as np
+
+from loan_calculator.schedule.base import AmortizationScheduleType, memoized_property
+
+Accrual = namedtuple("Accrual", ["balance", "accrued_interest"])
+
+
+def pad_return_days(return_days):
+    """Pad ragged return days vectors into a matrix.
+
+    Parameters
+    ----------
+    return_days: list, required
+        List with a list of return days for each loan.
+
+    Returns
+    -------
+    tuple
+        Integer matrix with the return days of each loan in a row, padded
+        with zeros, and the boolean mask of the actual return days.
+    """
+
+    lengths = np.fromiter((len(r_days) for r_days in return_days), dtype=np.intp)
+
+    mask = np.arange(lengths.max(initial=0)) < lengths[:, None]
+
+    days = np.zeros(mask.shape, dtype=np.int64)
+    days[mask] = np.fromiter(
+        (n for r_days in return_days for n in r_days),
+        dtype=np.int64,
+        count=int(lengths.sum()),
+    )
+
+    return days, mask
+
+
+def index_factors(rate_index, days):
+    """Cumulative factors of a CumulativeIndex at an array of days."""
+
+    factors = np.array(rate_index.factors)
+    m = len(factors) - 1
+
+    return np.where(
+        days <= m,
+        factors[np.clip(days, 0, m)],
+        factors[m] * (1 + rate_index.projected_rate) ** np.maximum(days - m, 0.0),
+    )
+
+
+def schedule_type_values(amortization_schedule_type, num_loans):
+    """Array with the schedule type value of each loan.
+
+    Parameters
+    ----------
+    amortization_schedule_type: AmortizationScheduleType or list, required
+        Either the schedule type of all loans or a list with the schedule type
+        of each loan.
+    num_loans: int, required
+        Number of loans.
+    """
+
+    if isinstance(amortization_schedule_type, (str, AmortizationScheduleType)):
+        return np.full(
+            num_loans, AmortizationScheduleType(amortization_schedule_type).value
+        )
+
+    if getattr(amortization_schedule_type, "dtype", None) is not None:
+        schedule_types = np.asarray(amortization_schedule_type, dtype=str)
+    else:
+        schedule_types = np.array(
+            [
+                getattr(schedule_type, "value", schedule_type)
+                for schedule_type in amortization_schedule_type
+            ]
+        )
+
+    # validate each distinct schedule type only once
+    for schedule_type in np.unique(schedule_types):
+        AmortizationScheduleType(schedule_type)
+
+    return schedule_types
+
+
+def search_keys(values, mask):
+    """Flatten padded rows of increasing values into a single sorted array.
+
+    The values of the i-th row are shifted by i times a span larger than any
+    value, and the padding is set to the end of the span, so that all rows
+    are searched at once with a single binary search by
+    `search_paid_instalments`. The values must not be negative.
+
+    Returns
+    -------
+    tuple
+        The span, the flattened keys and the number of columns.
+    """
+
+    span = int(values.max(initial=0)) + 2
+    keys = np.where(mask, values, span - 1)
+
+    return span, (keys + span * np.arange(len(values))[:, None]).ravel(), mask.shape[1]
+
+
+def search_paid_instalments(keys, days):
+    """Number of values of each row up to the given value of the row, inclusive.
+
+    Parameters
+    ----------
+    keys: tuple, required
+        Search keys of the rows, see `search_keys`.
+    days: array, required
+        Value of each row, e.g., its number of days.
+    """
+
+    span, keys, num_columns = keys
+    rows = np.arange(len(days))
+
+    return (
+        np.searchsorted(keys, span * rows + np.clip(days, 0, span - 2), "right")
+        - num_columns * rows
+    )
+
+
+class BatchSchedule(object):
+    """Amortization schedules of many loans at once.
+
+    Implement the same schedules as ProgressivePriceSchedule,
+    RegressivePriceSchedule and ConstantAmortizationSchedule with vectorized
+    NumPy operations over all loans. The return days vectors of the loans
+    may have different lengths, so the columns are matrices with a row for
+    each loan, padded with zeros where ``mask`` is false.
+
+    Every column is derived from the discount factors :math:`v_{ij} =
+    (1+d_i)^{-n_{ij}}` and their cumulative sums, as in the scalar
+    schedules, and is lazily evaluated.
+
+    A book of floating rate loans shares a CumulativeIndex, in which case
+    the daily interest rates are the spreads over the index and the
+    discount factors are :math:`v_{ij} = \\frac{F_{o_i}}{F_{o_i+n_{ij}}}
+    (1+d_i)^{-n_{ij}}`, where :math:`o_i` is the day of the index on which
+    the i-th loan starts. After the index is updated, `revalue` discards
+    every column and the whole book is recalculated in a vectorized pass.
+
+    Parameters
+    ----------
+    principals: array_like, required
+        Principal of each loan.
+    daily_interest_rates: array_like, required
+        Daily interest rate of each loan, or a single rate for all of them.
+    return_days: list or array_like, required
+        Either a list with the return days of each loan, or an integer
+        matrix with the return days of each loan in a row, in which case
+        `mask` tells the actual return days.
+    amortization_schedule_type: AmortizationScheduleType or list, optional
+        Either the schedule type of all loans or a list with the schedule type
+        of each loan. (default AmortizationScheduleType.progressive_price_schedule)
+    mask: array_like, optional
+        Boolean matrix with the actual return days, when `return_days` is
+        already padded. (default None)
+    rate_index: CumulativeIndex, optional
+        Floating rate index of all loans. (default None)
+    index_offsets: array_like, optional
+        Day of the index on which each loan starts, or a single day for all
+        of them. (default 0)
+    """
+
+    columns = (
+        "discount_factors",
+        "discount_sums",
+        "growth_factors",
+        "pmt",
+        "balance",
+        "interest_payments",
+        "amortizations",
+        "due_payments",
+        "total_paid",
+        "total_amortization",
+        "total_interest",
+    )
+
+    def __init__(
+        self,
+        principals,
+        daily_interest_rates,
+        return_days,
+        amortization_schedule_type=(
+            AmortizationScheduleType.progressive_price_schedule
+        ),
+        mask=None,
+        rate_index=None,
+        index_offsets=0,
+    ):
+        """Initialize batch schedule."""
+
+        self.principals = np.asarray(principals, dtype=float)
+
+        self.daily_interest_rates = np.broadcast_to(
+            np.asarray(daily_interest_rates, dtype=float), self.principals.shape
+        )
+
+        if mask is None and not isinstance(return_days, np.ndarray):
+            self.return_days, self.mask = pad_return_days(return_days)
+        else:
+            self.return_days = np.asarray(return_days, dtype=np.int64)
+            self.mask = (
+                np.ones(self.return_days.shape, dtype=bool)
+                if mask is None
+                else np.asarray(mask, dtype=bool)
+            )
+
+        self.schedule_types = schedule_type_values(
+            amortization_schedule_type, len(self.principals)
+        )
+
+        self.num_instalments = self.mask.sum(axis=1)
+
+        self.rate_index = rate_index
+        self.index_offsets = np.broadcast_to(
+            np.asarray(index_offsets, dtype=np.int64), self.principals.shape
+        )
+
+    @classmethod
+    def from_loans(cls, loans):
+        """Build the batch schedule of the given loans.
+
+        Floating rate loans must all share the same rate index and can not
+        be mixed with fixed rate loans. The loans may also be given as a
+        LoanBook, whose batch schedule is returned.
+        """
+
+        # imported here since the book module builds batch schedules
+        from loan_calculator.batch.book import LoanBook
+
+        if isinstance(loans, LoanBook):
+            return loans.batch_schedule
+
+        rate_indices = {id(loan.rate_index): loan.rate_index for loan in loans}
+
+        if len(rate_indices) > 1:
+            raise ValueError("The loans of a batch must share the same rate index.")
+
+        rate_index = next(iter(rate_indices.values()), None)
+
+        return cls(
+            [loan.principal for loan in loans],
+            [loan.daily_interest_rate for loan in loans],
+            [loan.return_days for loan in loans],
+            [loan.amortization_schedule_type for loan in loans],
+            rate_index=rate_index,
+            index_offsets=(
+                0
+                if rate_index is None
+                else [loan.amortization_schedule.index_offset for loan in loans]
+            ),
+        )
+
+    def __len__(self):
+        return len(self.principals)
+
+    def rows_of(self, schedule_type):
+        """Boolean array selecting the loans with the given schedule type."""
+
+        return self.schedule_types == AmortizationScheduleType(schedule_type).value
+
+    @property
+    def price_rows(self):
+        return ~self.rows_of(AmortizationScheduleType.constant_amortization_schedule)
+
+    def revalue(self):
+        """Discard every column, e.g., after the rate index was updated."""
+
+        for name in self.columns:
+            delattr(self, name)
+
+    def capitalization_factors(self, start_days, end_days):
+        """Capitalization factors of each loan from a day to another.
+
+        The days are arrays with a row for each loan. For fixed rate loans
+        the factors are :math:`(1+d_i)^{n-m}`, and for floating rate loans
+        they are further multiplied by the ratio of the cumulative factors
+        of the index.
+        """
+
+        d = self.daily_interest_rates.reshape((-1,) + (1,) * (start_days.ndim - 1))
+
+        factors = (1 + d) ** (end_days - start_days).astype(float)
+
+        if self.rate_index is not None:
+            o = self.index_offsets.reshape(d.shape)
+            factors *= index_factors(self.rate_index, o + end_days) / index_factors(
+                self.rate_index, o + start_days
+            )
+
+        return factors
+
+    @memoized_property
+    def discount_factors(self):
+        return np.where(
+            self.mask,
+            1.0
+            / self.capitalization_factors(
+                np.zeros_like(self.return_days), self.return_days
+            ),
+            0.0,
+        )
+
+    @memoized_property
+    def discount_sums(self):
+        return np.cumsum(self.discount_factors, axis=1)
+
+    @memoized_property
+    def growth_factors(self):
+        """Capitalization factors :math:`(1+d)^{n_j-n_{j-1}}` of each period."""
+
+        v = self.discount_factors
+        v_prev = np.concatenate([np.ones((len(self), 1)), v[:, :-1]], axis=1)
+
+        return np.divide(v_prev, v, out=np.zeros_like(v), where=self.mask)
+
+    @memoized_property
+    def pmt(self):
+        """PMT of each Price schedule, NaN for constant amortization ones."""
+
+        pmt = np.full(len(self), np.nan)
+
+        rows = self.price_rows
+        pmt[rows] = self.principals[rows] / self.discount_sums[rows, -1]
+
+        return pmt
+
+    @memoized_property
+    def balance(self):
+
+        p = self.principals[:, None]
+        balance = np.zeros((len(self), self.mask.shape[1] + 1))
+        balance[:, :1] = p
+
+        rows = self.price_rows
+        v = self.discount_factors[rows]
+        sums = self.discount_sums[rows]
+        balance[rows, 1:] = np.divide(
+            p[rows] * (1 - sums / sums[:, -1:]),
+            v,
+            out=np.zeros_like(v),
+            where=self.mask[rows],
+        )
+
+        rows = ~rows
+        k = self.num_instalments[rows, None]
+        i = np.arange(1, self.mask.shape[1] + 1)
+        balance[rows, 1:] = np.where(self.mask[rows], p[rows] * (1 - i / k), 0.0)
+
+        return balance
+
+    @memoized_property
+    def interest_payments(self):
+
+        # progressive Price and constant amortization schedules charge the
+        # interest accrued over the previous balance
+        interest = self.balance[:, :-1] * (self.growth_factors - 1)
+
+        rows = self.rows_of(AmortizationScheduleType.regressive_price_schedule)
+        interest[rows] = self.pmt[rows, None] * (1 - self.discount_factors[rows])
+
+        return np.where(self.mask, interest, 0.0)
+
+    @memoized_property
+    def amortizations(self):
+
+        amortizations = np.empty(self.mask.shape)
+
+        rows = self.rows_of(AmortizationScheduleType.progressive_price_schedule)
+        amortizations[rows] = self.pmt[rows, None] - self.interest_payments[rows]
+
+        rows = self.rows_of(AmortizationScheduleType.regressive_price_schedule)
+        amortizations[rows] = self.pmt[rows, None] * self.discount_factors[rows]
+
+        rows = ~self.price_rows
+        amortizations[rows] = (self.principals[rows] / self.num_instalments[rows])[
+            :, None
+        ]
+
+        return np.where(self.mask, amortizations, 0.0)
+
+    @memoized_property
+    def due_payments(self):
+
+        payments = self.amortizations + self.interest_payments
+
+        rows = self.price_rows
+        payments[rows] = self.pmt[rows, None]
+
+        return np.where(self.mask, payments, 0.0)
+
+    @memoized_property
+    def total_paid(self):
+        return self.due_payments.sum(axis=1)
+
+    @memoized_property
+    def total_amortization(self):
+        return self.amortizations.sum(axis=1)
+
+    @memoized_property
+    def total_interest(self):
+        return self.interest_payments.sum(axis=1)
+
+    @memoized_property
+    def _search_keys(self):
+        """Flattened return days made increasing across all loans.
+
+        See `search_keys`.
+        """
+
+        return search_keys(self.return_days, self.mask)
+
+    def accrue_at_days(self, days, num_paid=None):
+        """Balance and interest accrued after the given numbers of days.
+
+        The payments due up to the given day of each loan, inclusive, are
+        considered paid and the balance after the last of them is capitalized
+        up to the given day, as in `BaseSchedule.balance_at_day`. The accrued
+        interest is the interest capitalized since that last payment.
+
+        Parameters
+        ----------
+        days: array_like, required
+            Number of days of each loan, or a single number for all of them.
+        num_paid: array_like, optional
+            Number of payments made by each loan, which is otherwise found by
+            searching the given days in the return days. (default None)
+
+        Returns
+        -------
+        Accrual
+            Named tuple with the arrays of balances and accrued interest.
+        """
+
+        days = np.broadcast_to(np.asarray(days, dtype=np.int64), self.principals.shape)
+        rows = np.arange(len(self))
+
+        if num_paid is None:
+            num_paid = search_paid_instalments(self._search_keys, days)
+
+        previous_days = np.where(
+            num_paid > 0, self.return_days[rows, np.maximum(num_paid - 1, 0)], 0
+        )
+
+        paid_off = num_paid == self.num_instalments
+        base = np.where(paid_off, 0.0, self.balance[rows, num_paid])
+
+        balance = base * self.capitalization_factors(
+            previous_days, np.maximum(days, previous_days)
+        )
+
+        return Accrual(balance, balance - base)
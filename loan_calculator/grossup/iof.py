@@ -3,7 +3,6 @@ from tracemalloc import start
 
 
 from loan_calculator.grossup.iof_tax import amortization_iof
-from loan_calculator.loan import Loan
 from loan_calculator.grossup.base import BaseGrossup
 from loan_calculator.grossup.functions import (
     br_iof_regressive_price_grossup,
@@ -104,7 +103,7 @@ class IofGrossup(BaseGrossup):
                 ProgressivePriceSchedule: br_iof_progressive_price_grossup_presumed,
             },
         }
-        return Loan(
+        return loan.with_principal(
             dispatch_table[strategy][loan.amortization_schedule_cls](
                 loan.principal,
                 loan.daily_interest_rate,
@@ -130,13 +129,4 @@ class IofGrossup(BaseGrossup):
                 include_end_date=loan.include_end_date,
                 round_strategy=loan.round_strategy,
             ),
-            loan.annual_interest_rate,
-            loan.start_date,
-            loan.return_dates,
-            loan.year_size,
-            loan.grace_period,
-            loan.amortization_schedule_type,
-            count_working_days=loan.count_working_days,
-            include_end_date=loan.include_end_date,
-            round_strategy=loan.round_strategy,
         )
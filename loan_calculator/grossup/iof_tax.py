@@ -21,7 +21,7 @@ The IOF aliquot over the principal, called the complementary IOF aliquot, is
 a fixed aliquot with its value defined by law.
 """
 
-
+from loan_calculator import kernels
 from loan_calculator.rounds import round_no_rounding
 
 
@@ -61,7 +61,8 @@ def amortization_schedule_iof(
     r_days = return_days
     d = daily_iof_aliquot
 
-    round_function = round_function or round_no_rounding
+    if round_function in (None, round_no_rounding):
+        return kernels.amortization_iof_sum(amts, r_days, d)
 
     return sum(
         round_function(a * d * min(n, 365), round_digits) for a, n in zip(amts, r_days)
@@ -0,0 +1,147 @@
+from array import array
+
+
+class CumulativeIndex(object):
+    """Daily floating rate index with cumulative capitalization factors.
+
+    A floating rate index, such as the CDI, is given by the series of its
+    daily rates :math:`r_0,r_1,\\ldots,r_{m-1}`, where :math:`r_t` is the rate
+    from the :math:`t`-th day after the start date to the next. The
+    cumulative factors
+
+    .. math::
+
+        F_t = \\prod_{s=0}^{t-1}(1+r_s),\\ 0\\leq t\\leq m,
+
+    are computed once, so that the capitalization factor between any two
+    days :math:`t\\leq u` is given by a single division :math:`F_u/F_t`.
+
+    The rates beyond the last known one are assumed to be equal to the
+    projected rate, i.e., :math:`F_t = F_m(1+r^*)^{t-m}` for :math:`t > m`.
+    Days on which the index does not accrue, such as weekends and holidays,
+    must be included in the series with null rates.
+
+    Parameters
+    ----------
+    daily_rates: list, required
+        Daily rates of the index since the start date.
+    start_date: date, optional
+        Date of the first rate of the index. (default None)
+    projected_rate: float, optional
+        Daily rate assumed for the days after the last known rate.
+        (default 0.0)
+    """
+
+    __slots__ = ("start_date", "factors", "projected_rate")
+
+    def __init__(self, daily_rates, start_date=None, projected_rate=0.0):
+        """Initialize index."""
+
+        self.start_date = start_date
+        self.projected_rate = projected_rate
+
+        self.factors = array("d", [1.0])
+        for daily_rate in daily_rates:
+            self.append(daily_rate)
+
+    def __len__(self):
+        """Number of known daily rates."""
+
+        return len(self.factors) - 1
+
+    def append(self, daily_rate):
+        """Append the daily rate of the next day, e.g., after its print."""
+
+        self.factors.append(self.factors[-1] * (1 + daily_rate))
+
+    def factor(self, day):
+        """Cumulative factor :math:`F_t` of the given day."""
+
+        if day < 0:
+            raise ValueError("Index days must be non negative.")
+
+        m = len(self.factors) - 1
+
+        if day <= m:
+            return self.factors[day]
+
+        return self.factors[m] * (1 + self.projected_rate) ** (day - m)
+
+    def factor_between(self, start_day, end_day):
+        """Capitalization factor :math:`F_u/F_t` from day t to day u."""
+
+        return self.factor(end_day) / self.factor(start_day)
+
+
+class InflationIndex(object):
+    """Monthly inflation index, such as the IPCA, shared by indexed loans.
+
+    The index is given by its monthly index numbers
+    :math:`I_0,I_1,\\ldots,I_{m-1}`, where :math:`I_t` is the index number of
+    the :math:`t`-th month after the start month. The monetary correction
+    factor from a month to another is the ratio of their index numbers, so
+    that a table loaded once serves every loan, each one looking its factors
+    up by precomputed month offsets.
+
+    The index numbers beyond the last known one grow at the projected
+    monthly rate, i.e., :math:`I_t = I_{m-1}(1+r^*)^{t-m+1}` for
+    :math:`t \\geq m`.
+
+    Parameters
+    ----------
+    index_numbers: list, required
+        Monthly index numbers since the start month.
+    start_date: date, optional
+        Any date of the start month. (default None)
+    projected_rate: float, optional
+        Monthly rate assumed for the months after the last known index
+        number. (default 0.0)
+    """
+
+    __slots__ = ("start_date", "index_numbers", "projected_rate")
+
+    def __init__(self, index_numbers, start_date=None, projected_rate=0.0):
+        """Initialize index."""
+
+        if not index_numbers:
+            raise ValueError("An inflation index must have an index number.")
+
+        self.start_date = start_date
+        self.projected_rate = projected_rate
+
+        self.index_numbers = array("d", index_numbers)
+
+    def __len__(self):
+        """Number of known index numbers."""
+
+        return len(self.index_numbers)
+
+    def append(self, index_number):
+        """Append the index number of the next month, e.g., after its print."""
+
+        self.index_numbers.append(index_number)
+
+    def month_offset(self, reference_date):
+        """Number of months from the start month to the reference date's."""
+
+        return (reference_date.year - self.start_date.year) * 12 + (
+            reference_date.month - self.start_date.month
+        )
+
+    def index_number(self, month_offset):
+        """Index number of the given month."""
+
+        if month_offset < 0:
+            raise ValueError("Index months must be non negative.")
+
+        m = len(self.index_numbers) - 1
+
+        if month_offset <= m:
+            return self.index_numbers[month_offset]
+
+        return self.index_numbers[m] * (1 + self.projected_rate) ** (month_offset - m)
+
+    def correction_factor(self, base_month_offset, month_offset):
+        """Monetary correction factor from a month to another."""
+
+        return self.index_number(month_offset) / self.index_number(base_month_offset)
@@ -0,0 +1,110 @@
+"""Numerical kernels of the hot loops, with an optional JIT backend.
+
+The loops computing discount factors, periodic interest, return polynomials
+and IOF taxes are implemented by a backend, which is one of
+
+*   ``"python"``, implemented in pure Python, which is the default,
+*   ``"numba"``, compiled by Numba, which is an optional dependency and can
+    be installed with the extra ``jit``.
+
+The backend is selected at import from the environment variable
+``LOAN_CALCULATOR_BACKEND`` and can be changed at any time with
+`set_backend`. If Numba is not installed, the pure Python backend is used
+instead.
+"""
+
+import os
+
+from loan_calculator.kernels import python as _python_backend
+
+BACKENDS = ("python", "numba")
+
+_backend = _python_backend
+
+
+def get_backend():
+    """Name of the backend in use."""
+
+    return _backend.name
+
+
+def set_backend(name):
+    """Select the backend of the numerical kernels.
+
+    Falls back to the pure Python backend if the requested one can not be
+    imported. Returns the name of the backend in use.
+    """
+
+    global _backend
+
+    if name not in BACKENDS:
+        raise ValueError(
+            "Unknown backend {!r}, expected one of {}.".format(name, BACKENDS)
+        )
+
+    _backend = _python_backend
+
+    if name == "numba":
+        try:
+            from loan_calculator.kernels import jit
+        except ImportError:
+            pass
+        else:
+            _backend = jit
+
+    return get_backend()
+
+
+def vector(values):
+    """Store a vector of floats in the container used by the backend."""
+
+    return _backend.vector(values)
+
+
+def discount_factors(daily_interest_rate, return_days):
+    """Discount factors :math:`(1+d)^{-n_j}` of the given return days."""
+
+    return _backend.discount_factors(daily_interest_rate, return_days)
+
+
+def period_interest(balance, daily_interest_rate, return_days):
+    """Interest :math:`b_{j-1}((1+d)^{n_j-n_{j-1}}-1)` of each period."""
+
+    return _backend.period_interest(balance, daily_interest_rate, return_days)
+
+
+def evaluate_polynomial(coefficients, exponents, x):
+    """Evaluate :math:`\\sum_j c_j(1+x)^{e_j}`."""
+
+    return _backend.evaluate_polynomial(coefficients, exponents, x)
+
+
+def polynomial_root(
+    coefficients,
+    exponents,
+    derivative_coefficients,
+    derivative_exponents,
+    initial_point,
+    maximum_relative_error=0.0000000001,
+    max_iterations=100,
+):
+    """Approximate a root of :math:`\\sum_j c_j(1+x)^{e_j}` by Newton-Raphson."""
+
+    return _backend.polynomial_root(
+        coefficients,
+        exponents,
+        derivative_coefficients,
+        derivative_exponents,
+        initial_point,
+        maximum_relative_error,
+        max_iterations,
+    )
+
+
+def amortization_iof_sum(amortizations, return_days, daily_iof_aliquot):
+    """Sum of the IOF tax :math:`A_jI^*\\min(n_j, 365)` over amortizations."""
+
+    return _backend.amortization_iof_sum(amortizations, return_days, daily_iof_aliquot)
+
+
+set_backend(os.environ.get("LOAN_CALCULATOR_BACKEND", "python"))
@@ -0,0 +1,79 @@
+"""Numba backend of the numerical kernels.
+
+The loops in `loan_calculator.kernels.loops` are compiled in nopython mode
+on the first call of each kernel. Arguments are converted to NumPy arrays
+and vector results are returned as lists, as in the pure Python backend.
+Importing this module raises ImportError if Numba is not installed.
+"""
+
+import numba
+import numpy as np
+
+from loan_calculator.kernels import loops
+
+name = "numba"
+
+_jit = numba.njit(cache=True)
+
+_discount_factors = _jit(loops.discount_factors)
+_period_interest = _jit(loops.period_interest)
+_evaluate_polynomial = _jit(loops.evaluate_polynomial)
+_polynomial_root = _jit(loops.polynomial_root)
+_amortization_iof_sum = _jit(loops.amortization_iof_sum)
+
+
+def vector(values):
+    """Store a vector of floats in the container used by the kernels."""
+
+    return np.asarray(values, dtype=np.float64)
+
+
+def discount_factors(daily_interest_rate, return_days):
+
+    days = vector(return_days)
+
+    return _discount_factors(
+        float(daily_interest_rate), days, np.empty_like(days)
+    ).tolist()
+
+
+def period_interest(balance, daily_interest_rate, return_days):
+
+    days = vector(return_days)
+
+    return _period_interest(
+        vector(balance), float(daily_interest_rate), days, np.empty_like(days)
+    ).tolist()
+
+
+def evaluate_polynomial(coefficients, exponents, x):
+
+    return _evaluate_polynomial(vector(coefficients), vector(exponents), float(x))
+
+
+def polynomial_root(
+    coefficients,
+    exponents,
+    derivative_coefficients,
+    derivative_exponents,
+    initial_point,
+    maximum_relative_error,
+    max_iterations,
+):
+
+    return _polynomial_root(
+        vector(coefficients),
+        vector(exponents),
+        vector(derivative_coefficients),
+        vector(derivative_exponents),
+        float(initial_point),
+        float(maximum_relative_error),
+        int(max_iterations),
+    )
+
+
+def amortization_iof_sum(amortizations, return_days, daily_iof_aliquot):
+
+    return _amortization_iof_sum(
+        vector(amortizations), vector(return_days), float(daily_iof_aliquot)
+    )
@@ -0,0 +1,93 @@
+"""Numerical kernels written as explicit loops.
+
+These functions only index their arguments and do scalar arithmetic, so
+they run unchanged either on Python lists, by the pure Python backend, or
+compiled by Numba over NumPy arrays, by the JIT backend. The vector
+kernels write their results into a given output buffer.
+"""
+
+
+def discount_factors(daily_interest_rate, return_days, out):
+    """Discount factors :math:`(1+d)^{-n_j}` of the given return days."""
+
+    for i in range(len(return_days)):
+        out[i] = 1.0 / (1 + daily_interest_rate) ** return_days[i]
+
+    return out
+
+
+def period_interest(balance, daily_interest_rate, return_days, out):
+    """Interest :math:`b_{j-1}((1+d)^{n_j-n_{j-1}}-1)` of each period."""
+
+    previous_day = 0
+    for i in range(len(return_days)):
+        out[i] = balance[i] * (
+            (1 + daily_interest_rate) ** (return_days[i] - previous_day) - 1
+        )
+        previous_day = return_days[i]
+
+    return out
+
+
+def evaluate_polynomial(coefficients, exponents, x):
+    """Evaluate :math:`\\sum_j c_j(1+x)^{e_j}`."""
+
+    value = 0.0
+    for i in range(min(len(coefficients), len(exponents))):
+        value += coefficients[i] * (1 + x) ** exponents[i]
+
+    return value
+
+
+def polynomial_root(
+    coefficients,
+    exponents,
+    derivative_coefficients,
+    derivative_exponents,
+    initial_point,
+    maximum_relative_error,
+    max_iterations,
+):
+    """Approximate a root of :math:`\\sum_j c_j(1+x)^{e_j}` by Newton-Raphson.
+
+    The iterations stop once the relative error between two consecutive
+    points is below `maximum_relative_error` or after `max_iterations`, with
+    the derivative given by its own coefficients and exponents. The
+    polynomials are evaluated inline, since a compiled kernel can not call
+    back into Python functions.
+    """
+
+    iterating_point = initial_point
+    num_iterations = 0
+
+    while True:
+
+        past_point = iterating_point
+
+        value = 0.0
+        for i in range(min(len(coefficients), len(exponents))):
+            value += coefficients[i] * (1 + past_point) ** exponents[i]
+
+        derivative = 0.0
+        for i in range(min(len(derivative_coefficients), len(derivative_exponents))):
+            derivative += (
+                derivative_coefficients[i] * (1 + past_point) ** derivative_exponents[i]
+            )
+
+        iterating_point = past_point - value / derivative
+        num_iterations += 1
+
+        relative_error = abs((iterating_point - past_point) / past_point)
+
+        if relative_error < maximum_relative_error or num_iterations >= max_iterations:
+            return iterating_point
+
+
+def amortization_iof_sum(amortizations, return_days, daily_iof_aliquot):
+    """Sum of the IOF tax :math:`A_jI^*\\min(n_j, 365)` over amortizations."""
+
+    total = 0.0
+    for i in range(len(amortizations)):
+        total += amortizations[i] * daily_iof_aliquot * min(return_days[i], 365)
+
+    return total
@@ -0,0 +1,35 @@
+"""Pure Python backend of the numerical kernels."""
+
+from loan_calculator.kernels import loops
+
+name = "python"
+
+
+def vector(values):
+    """Store a vector of floats in the container used by the kernels."""
+
+    return list(values)
+
+
+def discount_factors(daily_interest_rate, return_days):
+
+    d = daily_interest_rate
+
+    return [1.0 / (1 + d) ** n for n in return_days]
+
+
+def period_interest(balance, daily_interest_rate, return_days):
+
+    d = daily_interest_rate
+
+    return [
+        b * ((1 + d) ** (n - m) - 1)
+        for b, n, m in zip(balance, return_days, [0] + list(return_days[:-1]))
+    ]
+
+
+evaluate_polynomial = loops.evaluate_polynomial
+
+polynomial_root = loops.polynomial_root
+
+amortization_iof_sum = loops.amortization_iof_sum
@@ -1,10 +1,22 @@
+from bisect import bisect_left, bisect_right
 from datetime import timedelta
 import decimal
+import hashlib
+import json
 from enum import Enum
 from decimal import Decimal, ROUND_05UP, ROUND_HALF_UP
-from loan_calculator.rounds import round_half_up
-from loan_calculator.schedule import SCHEDULE_TYPE_CLASS_MAP
-from loan_calculator.schedule.base import AmortizationScheduleType
+from loan_calculator.schedule import (
+    FLOATING_SCHEDULE_TYPE_CLASS_MAP,
+    SCHEDULE_TYPE_CLASS_MAP,
+    default_unit_schedule_cache,
+)
+from loan_calculator.schedule.base import (
+    AmortizationScheduleType,
+    count_paid_instalments,
+    memoized_property,
+)
+from loan_calculator.schedule.cents import CentsSchedule, SimpleCentsSchedule
+from loan_calculator.schedule.indexed import InflationIndexedSchedule
 from loan_calculator.interest_rate import (
     convert_interest_rate,
     convert_to_daily_interest_rate,
@@ -20,6 +32,11 @@ class RoundStrategy(Enum):
     by_diference = "by_diference"
 
 
+class PrepaymentType(Enum):
+    reduce_term = "reduce_term"
+    reduce_instalment = "reduce_instalment"
+
+
 class Loan(object):
     """Loan.
 
@@ -46,8 +63,47 @@ class Loan(object):
         adopted. The available schedules are progressive_price_schedule,
         regressive_price_schedule, constant_amortization_schedule.
         (default AmortizationScheduleType.progressive_price_schedule.value).
+    schedule_cache : UnitScheduleCache, optional
+        Cache of unit principal schedules from which the loan's schedule is
+        scaled. If None, the schedule is built from scratch.
+        (default default_unit_schedule_cache)
+    rate_index : CumulativeIndex, optional
+        Daily floating rate index to which the loan is indexed, in which case
+        the interest rate is the spread over the index. The index must start
+        on or before the capitalization start date and the loan must count
+        calendar days. (default None)
+    inflation_index : InflationIndex, optional
+        Monthly inflation index by which the balance is corrected, in which
+        case the interest rate is the real interest rate. The principal is
+        given at the start date's month. (default None)
+    inflation_lag : int, optional
+        Number of months by which the inflation index lags the dates.
+        (default 0)
     """
 
+    __slots__ = (
+        "principal",
+        "annual_interest_rate",
+        "daily_interest_rate",
+        "start_date",
+        "capitalization_start_date",
+        "return_dates",
+        "year_size",
+        "month_size",
+        "grace_period",
+        "round_strategy",
+        "amortization_schedule_type",
+        "amortization_schedule_cls",
+        "amortization_schedule",
+        "count_working_days",
+        "include_end_date",
+        "rate_index",
+        "inflation_index",
+        "inflation_lag",
+        "_rounded_schedule",
+        "_fingerprint",
+    )
+
     def __init__(
         self,
         principal,
@@ -64,6 +120,10 @@ class Loan(object):
         interest_rate_type=InterestRateType.annual,
         month_size=None,
         round_strategy=RoundStrategy.none,
+        schedule_cache=default_unit_schedule_cache,
+        rate_index=None,
+        inflation_index=None,
+        inflation_lag=0,
     ):
         """Initialize loan."""
 
@@ -108,23 +168,637 @@ class Loan(object):
         ):
             raise ValueError("Grace period can not exceed loan start.")
 
-        self.amortization_schedule = self.amortization_schedule_cls(
-            principal,
-            self.daily_interest_rate,
-            [
-                count_days_between_dates(
-                    self.capitalization_start_date,
-                    r_date,
-                    count_working_days=count_working_days,
-                    include_end_date=include_end_date,
-                )
-                for r_date in return_dates
-            ],
-        )
+        return_days = [
+            count_days_between_dates(
+                self.capitalization_start_date,
+                r_date,
+                count_working_days=count_working_days,
+                include_end_date=include_end_date,
+            )
+            for r_date in return_dates
+        ]
+
+        self.rate_index = rate_index
+        self.inflation_index = inflation_index
+        self.inflation_lag = inflation_lag
+
+        if inflation_index is not None and round_strategy == RoundStrategy.by_diference:
+            raise ValueError(
+                "Inflation indexed loans can not be rounded by difference."
+            )
+
+        if rate_index is not None:
+            self.amortization_schedule_cls = FLOATING_SCHEDULE_TYPE_CLASS_MAP[
+                self.amortization_schedule_type
+            ]
+            self.amortization_schedule = self.amortization_schedule_cls(
+                principal,
+                self.daily_interest_rate,
+                return_days,
+                rate_index,
+                index_offset=self._count_index_offset(count_working_days),
+            )
+        elif schedule_cache is None:
+            self.amortization_schedule = self.amortization_schedule_cls(
+                principal, self.daily_interest_rate, return_days
+            )
+        else:
+            self.amortization_schedule = schedule_cache.schedule(
+                self.amortization_schedule_cls,
+                principal,
+                self.daily_interest_rate,
+                return_days,
+            )
 
         self.count_working_days = count_working_days
         self.include_end_date = include_end_date
 
+    @classmethod
+    def from_return_days(
+        cls,
+        principal,
+        daily_interest_rate,
+        start_date,
+        return_days,
+        return_dates=None,
+        year_size=YearSizeType.commercial,
+        grace_period=0,
+        amortization_schedule_type=(
+            AmortizationScheduleType.progressive_price_schedule
+        ),
+        count_working_days=False,
+        include_end_date=False,
+        month_size=None,
+        round_strategy=RoundStrategy.none,
+        schedule_cache=default_unit_schedule_cache,
+    ):
+        """Build a loan from its return days and daily interest rate.
+
+        This constructor is meant for callers which already have the number
+        of days since the capitalization start date until each return date,
+        counted as in `__init__`, and the daily interest rate. It skips the
+        interest rate conversions, the day counting and the validation of the
+        return dates, which are trusted to be increasing and after the grace
+        period, while the loan behaves exactly as if built by `__init__`.
+        The schedule type must be an AmortizationScheduleType member and the
+        list of return days is used without being copied.
+
+        The return dates are derived from the return days when counting
+        calendar days, if not given. When counting working days they must be
+        given, otherwise the methods taking dates are not available.
+        """
+
+        loan = cls.__new__(cls)
+
+        loan.principal = principal
+        loan.daily_interest_rate = daily_interest_rate
+        loan.annual_interest_rate = (1 + daily_interest_rate) ** year_size - 1
+
+        loan.start_date = start_date
+        loan.capitalization_start_date = start_date + timedelta(grace_period)
+
+        if return_dates is None and not count_working_days:
+            return_dates = [
+                loan.capitalization_start_date + timedelta(n - include_end_date)
+                for n in return_days
+            ]
+
+        loan.return_dates = return_dates
+
+        loan.year_size = year_size
+        loan.month_size = month_size
+        loan.grace_period = grace_period
+        loan.round_strategy = round_strategy
+        loan.count_working_days = count_working_days
+        loan.include_end_date = include_end_date
+        loan.rate_index = None
+        loan.inflation_index = None
+        loan.inflation_lag = 0
+
+        loan.amortization_schedule_type = amortization_schedule_type
+        loan.amortization_schedule_cls = SCHEDULE_TYPE_CLASS_MAP[
+            amortization_schedule_type
+        ]
+
+        if schedule_cache is None:
+            loan.amortization_schedule = loan.amortization_schedule_cls(
+                principal, daily_interest_rate, return_days
+            )
+        else:
+            loan.amortization_schedule = schedule_cache.schedule(
+                loan.amortization_schedule_cls,
+                principal,
+                daily_interest_rate,
+                return_days,
+            )
+
+        return loan
+
+    def with_principal(self, principal):
+        """Derive a loan which differs from this one only by the principal.
+
+        The derived loan shares the converted interest rates, the return
+        dates and days and the unit schedule of this loan, so that nothing
+        but the scaling of the columns is recalculated. It is meant for
+        grossups and what-if analysis, which build many loans differing by a
+        single parameter.
+        """
+
+        loan = self._derive()
+        loan.principal = principal
+        loan.amortization_schedule = loan._derive_schedule(
+            self.amortization_schedule.unit_schedule
+        )
+
+        return loan._derived_from(self)
+
+    def with_rate(
+        self,
+        interest_rate,
+        interest_rate_type=InterestRateType.annual,
+        schedule_cache=default_unit_schedule_cache,
+    ):
+        """Derive a loan which differs from this one only by the interest rate.
+
+        The interest rate is converted with this loan's year and month sizes,
+        while the return dates and days are shared with this loan, so that
+        they are neither counted nor validated again.
+        """
+
+        loan = self._derive()
+
+        loan.annual_interest_rate = convert_interest_rate(
+            interest_rate,
+            interest_rate_type,
+            InterestRateType.annual,
+            self.year_size,
+            self.month_size,
+        )
+        loan.daily_interest_rate = convert_interest_rate(
+            interest_rate,
+            interest_rate_type,
+            InterestRateType.daily,
+            self.year_size,
+            self.month_size,
+        )
+
+        loan.amortization_schedule = loan._derive_schedule(
+            loan._cached_unit_schedule(schedule_cache, self.return_days)
+        )
+
+        return loan._derived_from(self)
+
+    def with_return_dates(
+        self, return_dates, schedule_cache=default_unit_schedule_cache
+    ):
+        """Derive a loan which differs from this one only by the return dates.
+
+        Only the new return days are counted, while the converted interest
+        rates and the schedule class are shared with this loan.
+        """
+
+        loan = self._derive()
+        loan.return_dates = return_dates
+
+        return_days = [self._count_return_days(r_date) for r_date in return_dates]
+
+        loan.amortization_schedule = loan._derive_schedule(
+            loan._cached_unit_schedule(schedule_cache, return_days), return_days
+        )
+
+        return loan._derived_from(self)
+
+    def with_prepayment(
+        self, prepayment_date, amount, prepayment_type=PrepaymentType.reduce_term
+    ):
+        """Derive the loan left by a partial prepayment on the given date.
+
+        The payments due up to the prepayment date, inclusive, are considered
+        paid, as in `balance_at`, and the prepayment is deducted from the
+        balance at that date. The derived loan starts on the prepayment date
+        with the remaining balance as principal, which is amortized over the
+        remaining return dates with reduced instalments, or over the fewest
+        of them which do not increase the instalments, depending on the
+        prepayment type. Only the remaining schedule is calculated, from the
+        discount factors of this loan's schedule, see
+        `BaseSchedule.prepaid_schedule`.
+
+        The return days of the derived loan are counted from the prepayment
+        date with this loan's day count, as for a loan built on that date.
+        The payments made are found by bisecting the return dates, if the
+        loan has them, as in `balance_at`.
+        """
+
+        if self.inflation_index is not None:
+            raise ValueError("Inflation indexed loans can not be prepaid.")
+
+        if prepayment_date < self.start_date:
+            raise ValueError("The prepayment can not precede the loan start.")
+
+        day = start_day = self._count_days_until(prepayment_date)
+
+        if prepayment_date > self.capitalization_start_date:
+            # day counts including the prepayment date count it again for the
+            # remaining return days, which shifts all of them by a day
+            start_day -= count_days_between_dates(
+                prepayment_date,
+                prepayment_date,
+                count_working_days=self.count_working_days,
+                include_end_date=self.include_end_date,
+            )
+
+        num_paid = None
+
+        if self.return_dates is not None:
+            num_paid = bisect_right(self.return_dates, prepayment_date)
+
+        num_paid, schedule = self.amortization_schedule.prepaid_schedule(
+            day,
+            amount,
+            reduce_term=(PrepaymentType(prepayment_type) == PrepaymentType.reduce_term),
+            start_day=start_day,
+            num_paid=num_paid,
+        )
+
+        loan = self._derive()
+        loan.principal = schedule.principal
+        loan.start_date = prepayment_date
+        loan.capitalization_start_date = max(
+            prepayment_date, self.capitalization_start_date
+        )
+        loan.grace_period = (loan.capitalization_start_date - prepayment_date).days
+        loan.amortization_schedule = schedule
+
+        if self.return_dates is not None:
+            loan.return_dates = list(
+                self.return_dates[num_paid : num_paid + len(schedule.return_days)]
+            )
+
+        return loan._derived_from(self)
+
+    def with_prepayments(self, prepayments, prepayment_type=PrepaymentType.reduce_term):
+        """Derive the loan left by a sequence of partial prepayments.
+
+        The prepayments are pairs of a date and an amount, in chronological
+        order, which are applied one after the other as in
+        `with_prepayment`. Each one reuses the discount factors of the
+        schedule left by the previous one.
+        """
+
+        loan = self
+
+        for prepayment_date, amount in prepayments:
+            loan = loan.with_prepayment(prepayment_date, amount, prepayment_type)
+
+        return loan
+
+    def _derive(self):
+
+        loan = Loan.__new__(Loan)
+
+        # the memoized rounded schedule and the fingerprint are not shared
+        for name in Loan.__slots__:
+            if not name.startswith("_"):
+                setattr(loan, name, getattr(self, name))
+
+        return loan
+
+    def _derived_from(self, base_loan):
+        return self.freeze() if isinstance(base_loan, FrozenLoan) else self
+
+    def _cached_unit_schedule(self, schedule_cache, return_days):
+
+        if schedule_cache is None or self.rate_index is not None:
+            return None
+
+        return schedule_cache.unit_schedule(
+            self.amortization_schedule_cls, self.daily_interest_rate, return_days
+        )
+
+    def _derive_schedule(self, unit_schedule, return_days=None):
+
+        if unit_schedule is not None:
+            # unit schedules are never edited, so their return days are shared
+            return_days = unit_schedule.return_days
+        elif return_days is None:
+            return_days = list(self.amortization_schedule.return_days)
+
+        if self.rate_index is not None:
+            return self.amortization_schedule_cls(
+                self.principal,
+                self.daily_interest_rate,
+                return_days,
+                self.rate_index,
+                index_offset=self.amortization_schedule.index_offset,
+            )
+
+        return self.amortization_schedule_cls(
+            self.principal,
+            self.daily_interest_rate,
+            return_days,
+            unit_schedule=unit_schedule,
+        )
+
+    @property
+    def fingerprint(self):
+        """Canonical fingerprint of the loan.
+
+        It is the SHA-256 hex digest of a canonical serialization of the
+        principal, daily interest rate, start date, grace period, return
+        dates and days, schedule type, day count flags, year and month sizes
+        and round strategy. Therefore, it is stable across processes and
+        versions of Python and identifies loans with the same schedule, e.g.,
+        for caching results on disk. Loans indexed to a rate or inflation
+        index have no fingerprint, since their indices may change.
+        """
+
+        if self.rate_index is not None or self.inflation_index is not None:
+            raise ValueError("Indexed loans have no fingerprint.")
+
+        payload = [
+            "loan",
+            1,  # version of the serialization
+            repr(float(self.principal)),
+            repr(float(self.daily_interest_rate)),
+            self.start_date.isoformat(),
+            self.grace_period,
+            (
+                None
+                if self.return_dates is None
+                else [r_date.isoformat() for r_date in self.return_dates]
+            ),
+            [int(n) for n in self.return_days],
+            self.amortization_schedule_type.value,
+            bool(self.count_working_days),
+            bool(self.include_end_date),
+            int(self.year_size),
+            self.month_size,
+            getattr(self.round_strategy, "value", self.round_strategy),
+        ]
+
+        return hashlib.sha256(
+            json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        ).hexdigest()
+
+    def freeze(self):
+        """Make the loan immutable, hashable and comparable by value.
+
+        The loan becomes a FrozenLoan, whose attributes can not be assigned
+        and whose return dates can not be edited. Frozen loans are equal if
+        and only if their fingerprints are equal, so they can be used as dict
+        keys, e.g., to memoize results computed from them. Returns the loan
+        itself.
+        """
+
+        self._fingerprint = self.fingerprint
+        self.return_dates = (
+            None if self.return_dates is None else tuple(self.return_dates)
+        )
+        self.__class__ = FrozenLoan
+
+        return self
+
+    def _count_index_offset(self, count_working_days):
+
+        if count_working_days:
+            raise ValueError("Floating rate loans must count calendar days.")
+
+        index_offset = (
+            self.capitalization_start_date - self.rate_index.start_date
+        ).days
+
+        if index_offset < 0:
+            raise ValueError(
+                "The rate index must start on or before the capitalization start date."
+            )
+
+        return index_offset
+
+    def revalue(self):
+        """Recalculate the loan after its rate or inflation index was updated."""
+
+        if self.rate_index is not None:
+            self.amortization_schedule.revalue()
+
+        del self.rounded_schedule
+
+    def compact(self):
+        """Store the schedule columns in compact ``array('d')`` buffers.
+
+        Meant for holding many loans in memory. The columns are still
+        returned as lists. The rounded schedule, when the loan is rounded to
+        cents, has its cents moved to ``array('q')`` buffers as well.
+        Returns the loan itself.
+        """
+
+        if isinstance(self.rounded_schedule, CentsSchedule):
+            self.rounded_schedule.compact()
+
+        self.amortization_schedule.compact()
+
+        return self
+
+    def replace_return_date(self, index, return_date):
+        """Replace the return date at the given position.
+
+        Only the affected part of the amortization schedule is recalculated.
+        The return dates must remain increasing.
+        """
+
+        return_dates = self._editable_return_dates()
+
+        self.amortization_schedule.replace_return_day(
+            index, self._count_return_days(return_date)
+        )
+
+        return_dates[index] = return_date
+        self.return_dates = return_dates
+
+        del self.rounded_schedule
+
+    def insert_return_date(self, return_date):
+        """Insert a return date, keeping the return dates increasing.
+
+        Only the affected part of the amortization schedule is recalculated.
+        Returns the position of the inserted return date.
+        """
+
+        return_dates = self._editable_return_dates()
+
+        index = self.amortization_schedule.insert_return_day(
+            self._count_return_days(return_date)
+        )
+
+        return_dates.insert(index, return_date)
+        self.return_dates = return_dates
+
+        del self.rounded_schedule
+
+        return index
+
+    def delete_return_date(self, index):
+        """Delete the return date at the given position.
+
+        Only the affected part of the amortization schedule is recalculated.
+        """
+
+        return_dates = self._editable_return_dates()
+
+        self.amortization_schedule.delete_return_day(index)
+
+        del return_dates[index]
+        self.return_dates = return_dates
+
+        del self.rounded_schedule
+
+    def _editable_return_dates(self):
+
+        # checked before the schedule is edited, so a loan without return
+        # dates is left untouched
+        if self.return_dates is None:
+            raise ValueError("Loans without return dates can not be edited.")
+
+        return list(self.return_dates)
+
+    def _count_return_days(self, return_date):
+
+        if self.capitalization_start_date >= return_date:
+            raise ValueError("Grace period can not exceed loan start.")
+
+        return self._count_days_until(return_date)
+
+    def balance_at(self, reference_date):
+        """Balance at the given date.
+
+        The payments due up to the given date, inclusive, are considered
+        paid and the balance after the last of them is capitalized at the
+        daily interest rate up to the given date. During the grace period,
+        the balance is the principal. See `BaseSchedule.balance_at_day`.
+        The balance of an inflation indexed loan is corrected up to the
+        reference date's month.
+
+        The payments made are found by bisecting the return dates, if the
+        loan has them, since a return date on a weekend counts as many
+        working days as the Friday before it.
+        """
+
+        num_paid = None
+
+        if self.return_dates is not None:
+            num_paid = bisect_right(self.return_dates, reference_date)
+
+        return self._correction_factor(
+            reference_date
+        ) * self.amortization_schedule.balance_at_day(
+            self._count_days_until(reference_date), num_paid
+        )
+
+    def payoff_at(self, reference_date):
+        """Amount which pays the loan off at the given date.
+
+        Same as `balance_at`, except that the payment due on the given date,
+        if any, is not considered paid yet.
+        """
+
+        num_paid = None
+
+        if self.return_dates is not None:
+            num_paid = bisect_left(self.return_dates, reference_date)
+
+        return self._correction_factor(
+            reference_date
+        ) * self.amortization_schedule.payoff_at_day(
+            self._count_days_until(reference_date), num_paid
+        )
+
+    def balances_at(self, reference_dates):
+        """Balance at each one of the given dates.
+
+        See `balance_at`.
+        """
+
+        return [
+            self._correction_factor(r_date) * b
+            for r_date, b in zip(
+                reference_dates,
+                self.amortization_schedule.balances_at_days(
+                    [self._count_days_until(r_date) for r_date in reference_dates],
+                    self._count_paid_instalments(reference_dates, paid_on_day=True),
+                ),
+            )
+        ]
+
+    def payoffs_at(self, reference_dates):
+        """Payoff amount at each one of the given dates.
+
+        See `payoff_at`.
+        """
+
+        return [
+            self._correction_factor(r_date) * b
+            for r_date, b in zip(
+                reference_dates,
+                self.amortization_schedule.payoffs_at_days(
+                    [self._count_days_until(r_date) for r_date in reference_dates],
+                    self._count_paid_instalments(reference_dates, paid_on_day=False),
+                ),
+            )
+        ]
+
+    def _count_paid_instalments(self, reference_dates, paid_on_day):
+
+        if self.return_dates is None:
+            return None
+
+        return count_paid_instalments(
+            self.return_dates, reference_dates, paid_on_day=paid_on_day
+        )
+
+    def _correction_factor(self, reference_date):
+
+        if self.inflation_index is None:
+            return 1.0
+
+        return self.inflation_index.correction_factor(
+            self._inflation_month_offset(self.start_date),
+            self._inflation_month_offset(reference_date),
+        )
+
+    def _inflation_month_offset(self, reference_date):
+        return self.inflation_index.month_offset(reference_date) - self.inflation_lag
+
+    def _count_days_until(self, reference_date):
+
+        if reference_date <= self.capitalization_start_date:
+            return 0
+
+        return count_days_between_dates(
+            self.capitalization_start_date,
+            reference_date,
+            count_working_days=self.count_working_days,
+            include_end_date=self.include_end_date,
+        )
+
+    def iter_rows(self):
+        """Iterate over the rows of the loan's amortization schedule.
+
+        Each row is a tuple with the return date, the return day, the balance
+        after the payment, the amortization, the interest and the due
+        payment. The rows are streamed from the schedule one at a time,
+        without materializing its columns. The return dates are None when the
+        loan has none, as when built by `from_return_days` counting working
+        days without them.
+        """
+
+        rows = self.rounded_schedule.iter_rows()
+
+        if self.return_dates is None:
+            for row in rows:
+                yield (None,) + row
+        else:
+            for r_date, row in zip(self.return_dates, rows):
+                yield (r_date,) + row
+
     @property
     def amortization_function(self):
 
@@ -136,41 +810,123 @@ class Loan(object):
 
         return f_
 
+    @memoized_property
+    def rounded_schedule(self):
+        """Schedule from which the loan's columns are read.
+
+        It is the amortization schedule, corrected by the inflation index for
+        inflation indexed loans, and rounded to cents by difference when the
+        round strategy is RoundStrategy.by_diference or with every value
+        rounded half up to cents when it is RoundStrategy.simple.
+        """
+
+        schedule = self.amortization_schedule
+
+        if self.inflation_index is not None:
+            schedule = InflationIndexedSchedule(
+                schedule,
+                self.inflation_index,
+                [self._inflation_month_offset(r_date) for r_date in self.return_dates],
+                self._inflation_month_offset(self.start_date),
+            )
+
+        if self.round_strategy == RoundStrategy.by_diference:
+            return CentsSchedule(schedule)
+
+        if self.round_strategy == RoundStrategy.simple:
+            return SimpleCentsSchedule(schedule)
+
+        return schedule
+
     @property
     def return_days(self):
         return self.amortization_schedule.return_days  # pragma: no cover
 
     @property
     def balance(self):
-        return self.amortization_schedule.balance  # pragma: no cover
+        return self.rounded_schedule.balance  # pragma: no cover
 
     @property
     def due_payments(self):
-        return self.amortization_schedule.due_payments  # pragma: no cover
+        return self.rounded_schedule.due_payments  # pragma: no cover
 
     @property
     def interest_payments(self):
-        return self.amortization_schedule.interest_payments  # pragma: no cover
+        return self.rounded_schedule.interest_payments  # pragma: no cover
 
     @property
     def amortizations(self):
-        if self.round_strategy == RoundStrategy.simple:
-            return [
-                round_half_up(amortization, 2)
-                for amortization in self.amortization_schedule.amortizations
-            ]
-        return self.amortization_schedule.amortizations  # pragma: no cover
+        return self.rounded_schedule.amortizations  # pragma: no cover
 
     @property
     def total_amortization(self):
-        return self.amortization_schedule.total_amortization  # pragma: no cover
+        return self.rounded_schedule.total_amortization  # pragma: no cover
 
     @property
     def total_interest(self):
-        return self.amortization_schedule.total_interest  # pragma: no cover
+        return self.rounded_schedule.total_interest  # pragma: no cover
 
     @property
     def total_paid(self):
-        return self.amortization_schedule.total_paid  # pragma: no cover
+        return self.rounded_schedule.total_paid  # pragma: no cover
+
+
+class FrozenLoanError(AttributeError):
+    """Raised when modifying a frozen loan."""
+
+
+class FrozenLoan(Loan):
+    """Immutable and hashable loan.
+
+    Frozen loans are obtained by calling `Loan.freeze`. Their memoized
+    columns are still lazily evaluated, but their attributes can not be
+    assigned and their return dates can not be edited. They are equal if and
+    only if their fingerprints are equal and are hashed by their
+    fingerprints.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+
+        # memoized values are still set on first access
+        if not name.startswith("_"):
+            raise FrozenLoanError("Frozen loans can not be modified.")
+
+        super(FrozenLoan, self).__setattr__(name, value)
+
+    def __delattr__(self, name):
+        raise FrozenLoanError("Frozen loans can not be modified.")
+
+    def __setstate__(self, state):
+
+        _, slots = state
+
+        for name, value in slots.items():
+            object.__setattr__(self, name, value)
+
+    def __eq__(self, other):
+
+        if not isinstance(other, FrozenLoan):
+            return NotImplemented
+
+        return self.fingerprint == other.fingerprint
+
+    def __hash__(self):
+        return hash(self.fingerprint)
+
+    @property
+    def fingerprint(self):
+        return self._fingerprint
+
+    def freeze(self):
+        return self
+
+    def replace_return_date(self, index, return_date):
+        raise FrozenLoanError("Frozen loans can not be modified.")
 
+    def insert_return_date(self, return_date):
+        raise FrozenLoanError("Frozen loans can not be modified.")
 
+    def delete_return_date(self, index):
+        raise FrozenLoanError("Frozen loans can not be modified.")
@@ -1,3 +1,37 @@
+from loan_calculator import kernels
+
+
+def discount_factors(daily_interest_rate, return_days):
+    """Calculate the discount factors for the given return days.
+
+    If :math:`d` is the daily interest rate and :math:`(n_1,\\ldots,n_k)` is
+    the vector with the number of days since the start reference date, then
+    the discount factors are given by
+
+    .. math::
+
+        v_j = \\frac{1}{(1+d)^{n_j}},
+
+    for :math:`j,1\\leq j\\leq k`. Every column of a Price schedule can be
+    derived from these factors, so they are meant to be computed only once
+    per schedule.
+
+    Parameters
+    ----------
+    daily_interest_rate : float, required
+        The daily rate at which the principal grows over time.
+    return_days : list, required
+        List of integers representing the numbers of days since the start
+        reference date.
+
+    Returns
+    -------
+    List with the discount factor for each return day.
+    """
+
+    return kernels.discount_factors(daily_interest_rate, return_days)
+
+
 def constant_return_pmt(principal, daily_interest_rate, return_days):
     """Calculate the PMT (payment value) for the given parameters.
 
@@ -28,8 +62,4 @@ def constant_return_pmt(principal, daily_interest_rate, return_days):
     The required payment value for the given parameters.
     """
 
-    # variables are renamed in order to make the math more explicit
-    p = principal
-    d = daily_interest_rate
-
-    return p / sum(1.0 / (1 + d) ** n for n in return_days)
+    return principal / sum(discount_factors(daily_interest_rate, return_days))
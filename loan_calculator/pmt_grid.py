@@ -0,0 +1,251 @@
+import json
+import mmap
+import sys
+from array import array
+from itertools import accumulate
+
+from loan_calculator import kernels
+from loan_calculator.interest_rate import (
+    convert_interest_rate,
+    InterestRateType,
+    YearSizeType,
+)
+from loan_calculator.pmt import constant_return_pmt
+
+MAGIC = b"PMTGRID1"
+
+
+class PmtFactorGrid(object):
+    """Table of unit principal PMT factors over a grid of quotes.
+
+    A quote is given by an interest rate, a number of instalments
+    :math:`k` and the number of days :math:`f` until the first payment, the
+    following ones being due every :math:`p` days, so that the return days
+    are :math:`n_j = f + (j-1)p`. The PMT of a principal :math:`s` is
+    :math:`s` times the factor
+
+    .. math::
+
+        \\frac{1}{\\sum_{j=1}^k\\frac{1}{(1+d)^{n_j}}},
+
+    where :math:`d` is the daily interest rate, see `constant_return_pmt`.
+    The factors are computed once for every quote of the grid, so that
+    quoting a PMT on the grid is a lookup and a multiplication. Quotes
+    outside the grid are computed exactly.
+
+    The factors are held in a flat ``array('d')`` and the grid can be saved
+    to a file, with a JSON header followed by the raw factors, and loaded
+    back memory mapped, so that many processes share a single copy of the
+    table.
+
+    Parameters
+    ----------
+    interest_rates: list, required
+        Interest rates of the grid.
+    terms: list, required
+        Numbers of instalments of the grid.
+    first_payment_days: list, required
+        Numbers of days until the first payment of the grid.
+    period_days: int, optional
+        Number of days between consecutive payments. (default 30)
+    interest_rate_type: InterestRateType, optional
+        Type of the interest rates. (default InterestRateType.annual)
+    year_size: int, optional
+        Year size for converting the interest rates to daily ones.
+        (default YearSizeType.commercial)
+    month_size: int, optional
+        Month size for converting the interest rates to daily ones.
+        (default None)
+    factors: buffer, optional
+        Precomputed factors laid out as the grid, e.g., when loading a grid.
+        They are computed if not given. (default None)
+    """
+
+    def __init__(
+        self,
+        interest_rates,
+        terms,
+        first_payment_days,
+        period_days=30,
+        interest_rate_type=InterestRateType.annual,
+        year_size=YearSizeType.commercial,
+        month_size=None,
+        factors=None,
+    ):
+        """Initialize grid."""
+
+        self.interest_rates = [float(rate) for rate in interest_rates]
+        self.terms = [int(term) for term in terms]
+        self.first_payment_days = [int(f) for f in first_payment_days]
+        self.period_days = int(period_days)
+        self.interest_rate_type = InterestRateType(interest_rate_type)
+        self.year_size = int(year_size)
+        self.month_size = month_size
+
+        self._rate_positions = {r: i for i, r in enumerate(self.interest_rates)}
+        self._term_positions = {k: i for i, k in enumerate(self.terms)}
+        self._first_day_positions = {
+            f: i for i, f in enumerate(self.first_payment_days)
+        }
+
+        self._mmap = None
+        self.factors = self.calculate_factors() if factors is None else factors
+
+        if len(self.factors) != len(self):
+            raise ValueError("The factors do not match the grid.")
+
+    def __len__(self):
+        return len(self.interest_rates) * len(self.terms) * len(self.first_payment_days)
+
+    def daily_interest_rate(self, interest_rate):
+        return convert_interest_rate(
+            interest_rate,
+            self.interest_rate_type,
+            InterestRateType.daily,
+            self.year_size,
+            self.month_size,
+        )
+
+    def return_days(self, term, first_payment_day):
+        return [first_payment_day + j * self.period_days for j in range(term)]
+
+    def calculate_factors(self):
+        """Calculate the factors of every quote of the grid."""
+
+        factors = array("d")
+        max_term = max(self.terms, default=0)
+
+        for rate in self.interest_rates:
+            d = self.daily_interest_rate(rate)
+
+            for f in self.first_payment_days:
+                # the sums of the discount factors of every term at once
+                sums = list(
+                    accumulate(
+                        kernels.discount_factors(d, self.return_days(max_term, f))
+                    )
+                )
+                factors.extend(1.0 / sums[k - 1] for k in self.terms)
+
+        return factors
+
+    def _position(self, interest_rate, term, first_payment_day):
+
+        try:
+            r = self._rate_positions[interest_rate]
+            f = self._first_day_positions[first_payment_day]
+            k = self._term_positions[term]
+        except KeyError:
+            return None
+
+        return (r * len(self.first_payment_days) + f) * len(self.terms) + k
+
+    def factor(self, interest_rate, term, first_payment_day):
+        """Unit principal PMT factor of the given quote."""
+
+        position = self._position(interest_rate, term, first_payment_day)
+
+        if position is None:
+            return constant_return_pmt(
+                1.0,
+                self.daily_interest_rate(interest_rate),
+                self.return_days(term, first_payment_day),
+            )
+
+        return self.factors[position]
+
+    def pmt(self, principal, interest_rate, term, first_payment_day):
+        """PMT of the given principal and quote."""
+
+        position = self._position(interest_rate, term, first_payment_day)
+
+        if position is None:
+            return constant_return_pmt(
+                principal,
+                self.daily_interest_rate(interest_rate),
+                self.return_days(term, first_payment_day),
+            )
+
+        return principal * self.factors[position]
+
+    def _header(self):
+        return {
+            "interest_rates": self.interest_rates,
+            "terms": self.terms,
+            "first_payment_days": self.first_payment_days,
+            "period_days": self.period_days,
+            "interest_rate_type": self.interest_rate_type.value,
+            "year_size": self.year_size,
+            "month_size": self.month_size,
+            "byteorder": sys.byteorder,
+        }
+
+    def to_bytes(self):
+        """Serialize the grid, with its header padded to 8 bytes."""
+
+        header = json.dumps(self._header(), separators=(",", ":")).encode("utf-8")
+        header += b" " * (-(len(MAGIC) + 8 + len(header)) % 8)
+
+        return (
+            MAGIC
+            + len(header).to_bytes(8, "little")
+            + header
+            + memoryview(self.factors).cast("B").tobytes()
+        )
+
+    def save(self, path):
+        """Save the grid to a file, which can be memory mapped by `load`."""
+
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def from_bytes(cls, buffer):
+        """Deserialize a grid, whose factors are a view of the buffer."""
+
+        buffer = memoryview(buffer)
+
+        if bytes(buffer[: len(MAGIC)]) != MAGIC:
+            raise ValueError("The buffer does not hold a PMT factor grid.")
+
+        start = len(MAGIC) + 8
+        header_size = int.from_bytes(buffer[len(MAGIC) : start], "little")
+        header = json.loads(bytes(buffer[start : start + header_size]))
+
+        if header.pop("byteorder") != sys.byteorder:
+            raise ValueError("The grid was saved with another byte order.")
+
+        return cls(
+            header.pop("interest_rates"),
+            header.pop("terms"),
+            header.pop("first_payment_days"),
+            factors=buffer[start + header_size :].cast("d"),
+            **header,
+        )
+
+    @classmethod
+    def load(cls, path, memory_map=True):
+        """Load a grid from a file, memory mapped by default.
+
+        A memory mapped grid reads its factors from the operating system's
+        page cache, which is shared by every process mapping the file.
+        """
+
+        with open(path, "rb") as f:
+            if not memory_map:
+                return cls.from_bytes(f.read())
+
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        grid = cls.from_bytes(buffer)
+        grid._mmap = buffer
+
+        return grid
+
+    def close(self):
+        """Release the memory map of a loaded grid, if any."""
+
+        if self._mmap is not None:
+            self.factors.release()
+            self._mmap.close()
+            self._mmap = None
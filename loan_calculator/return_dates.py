@@ -0,0 +1,226 @@
+import calendar
+from collections import namedtuple
+from datetime import date, timedelta
+from enum import Enum
+from functools import lru_cache
+
+ReturnDates = namedtuple("ReturnDates", ["return_dates", "return_days"])
+
+
+class PaymentFrequency(Enum):
+
+    monthly = "monthly"
+    biweekly = "biweekly"
+    weekly = "weekly"
+
+
+def add_months(reference_date, months, day=None):
+    """Add a number of months to a date.
+
+    The day of the month is the given one, or the reference date's, and it
+    is clamped to the last day of the resulting month, e.g., a month after
+    January 31st is February 28th or 29th.
+    """
+
+    year, month = divmod(reference_date.month - 1 + months, 12)
+    year += reference_date.year
+    month += 1
+
+    day = reference_date.day if day is None else day
+
+    return date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
+def roll_to_business_day(reference_date, holidays=()):
+    """First date on or after the reference date which is a business day.
+
+    Saturdays, Sundays and the given holidays are not business days.
+    """
+
+    while reference_date.weekday() >= 5 or reference_date in holidays:
+        reference_date += timedelta(1)
+
+    return reference_date
+
+
+def count_weekdays(start_date, end_date):
+    """Number of weekdays from the start date up to the end date, inclusive.
+
+    It is the same as `count_days_between_dates` counting working days
+    without excluding holidays, but it does not iterate over the days.
+    """
+
+    if end_date < start_date:
+        return 0
+
+    weeks, remaining_days = divmod((end_date - start_date).days + 1, 7)
+    weekday = start_date.weekday()
+
+    return 5 * weeks + sum((weekday + i) % 7 < 5 for i in range(remaining_days))
+
+
+def _first_return_date(start_date, frequency, payment_day, min_days):
+
+    if frequency == PaymentFrequency.monthly:
+
+        if min_days is None:
+            min_days = 1
+
+        months = 0
+        first_return_date = add_months(start_date, months, payment_day)
+        while (first_return_date - start_date).days < min_days:
+            months += 1
+            first_return_date = add_months(start_date, months, payment_day)
+
+        return first_return_date
+
+    if min_days is None:
+        min_days = 7 if frequency == PaymentFrequency.weekly else 14
+
+    first_return_date = start_date + timedelta(max(min_days, 1))
+
+    return first_return_date + timedelta(
+        (payment_day - first_return_date.weekday()) % 7
+    )
+
+
+@lru_cache(maxsize=4096)
+def _generate_return_dates(
+    start_date,
+    num_instalments,
+    frequency,
+    payment_day,
+    min_days,
+    holidays,
+    business_day_rolling,
+    grace_period,
+    count_working_days,
+    include_end_date,
+):
+
+    if payment_day is None:
+        payment_day = (
+            start_date.day
+            if frequency == PaymentFrequency.monthly
+            else start_date.weekday()
+        )
+
+    first_return_date = _first_return_date(start_date, frequency, payment_day, min_days)
+
+    if frequency == PaymentFrequency.monthly:
+        return_dates = [
+            add_months(first_return_date, i, payment_day)
+            for i in range(num_instalments)
+        ]
+    else:
+        step = 7 if frequency == PaymentFrequency.weekly else 14
+        return_dates = [
+            first_return_date + timedelta(step * i) for i in range(num_instalments)
+        ]
+
+    if business_day_rolling:
+        return_dates = [
+            roll_to_business_day(r_date, holidays) for r_date in return_dates
+        ]
+
+    capitalization_start_date = start_date + timedelta(grace_period)
+
+    if any(capitalization_start_date >= r_date for r_date in return_dates):
+        raise ValueError("Grace period can not exceed loan start.")
+
+    if count_working_days:
+        return_days = [
+            count_weekdays(capitalization_start_date, r_date) for r_date in return_dates
+        ]
+    else:
+        return_days = [
+            (r_date - capitalization_start_date).days + include_end_date
+            for r_date in return_dates
+        ]
+
+    return tuple(return_dates), tuple(return_days)
+
+
+def generate_return_dates(
+    start_date,
+    num_instalments,
+    frequency=PaymentFrequency.monthly,
+    payment_day=None,
+    min_days=None,
+    business_day_rolling=False,
+    holidays=(),
+    grace_period=0,
+    count_working_days=False,
+    include_end_date=False,
+):
+    """Generate the return dates of a loan and their return days.
+
+    The return dates are a monthly, biweekly or weekly grid starting at the
+    first date on the payment day which is at least `min_days` days after
+    the start date. Each monthly return date is on the payment day of its
+    month, or on the last day of the month if it is shorter. If
+    `business_day_rolling` is true, each return date falling on a weekend or
+    holiday is rolled to the next business day.
+
+    The return days are counted from the capitalization start date as in
+    `Loan`, so that a loan can be built with `Loan.from_return_days` without
+    counting the days again. Working days are counted without excluding the
+    holidays, as `Loan` does.
+
+    The results are memoized by the parameters, since portfolios usually
+    share a few grids. New lists are returned on each call, so that they can
+    be edited.
+
+    Parameters
+    ----------
+    start_date: date, required
+        The loan's start date.
+    num_instalments: int, required
+        Number of return dates.
+    frequency: PaymentFrequency, optional
+        Frequency of the return dates. (default PaymentFrequency.monthly)
+    payment_day: int, optional
+        Day of the month of monthly return dates, or weekday of weekly and
+        biweekly ones, with Monday being 0. (default None, the start date's)
+    min_days: int, optional
+        Minimum number of days from the start date to the first return date.
+        (default None, which is 1 for monthly return dates and the number of
+        days of a period otherwise)
+    business_day_rolling: bool, optional
+        Whether to roll the return dates to the next business day.
+        (default False)
+    holidays: iterable, optional
+        Dates which are not business days. (default ())
+    grace_period: int, optional
+        The loan's grace period. (default 0)
+    count_working_days: bool, optional
+        Whether the loan counts only working days. (default False)
+    include_end_date: bool, optional
+        Whether the loan includes the end date when counting calendar days.
+        (default False)
+
+    Returns
+    -------
+    ReturnDates
+        Named tuple with the list of return dates and the list of return
+        days.
+    """
+
+    return_dates, return_days = _generate_return_dates(
+        start_date,
+        num_instalments,
+        PaymentFrequency(frequency),
+        payment_day,
+        min_days,
+        frozenset(holidays),
+        business_day_rolling,
+        grace_period,
+        count_working_days,
+        include_end_date,
+    )
+
+    return ReturnDates(list(return_dates), list(return_days))
+
+
+generate_return_dates.cache_info = _generate_return_dates.cache_info
+generate_return_dates.cache_clear = _generate_return_dates.cache_clear
@@ -1,6 +1,13 @@
 from .base import AmortizationScheduleType
 from .price import ProgressivePriceSchedule, RegressivePriceSchedule
 from .constant import ConstantAmortizationSchedule
+from .cache import UnitScheduleCache, default_unit_schedule_cache
+from .floating import (
+    FLOATING_SCHEDULE_TYPE_CLASS_MAP,
+    FloatingConstantAmortizationSchedule,
+    FloatingProgressivePriceSchedule,
+    FloatingRegressivePriceSchedule,
+)
 
 
 SCHEDULE_TYPE_CLASS_MAP = {
@@ -13,5 +20,11 @@ __all__ = [
     "ProgressivePriceSchedule",
     "RegressivePriceSchedule",
     "ConstantAmortizationSchedule",
+    "FloatingProgressivePriceSchedule",
+    "FloatingRegressivePriceSchedule",
+    "FloatingConstantAmortizationSchedule",
+    "FLOATING_SCHEDULE_TYPE_CLASS_MAP",
     "SCHEDULE_TYPE_CLASS_MAP",
+    "UnitScheduleCache",
+    "default_unit_schedule_cache",
 ]
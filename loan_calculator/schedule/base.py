@@ -1,3 +1,5 @@
+from array import array
+from bisect import bisect_left, bisect_right
 from enum import Enum
 
 
@@ -8,6 +10,85 @@ class AmortizationScheduleType(Enum):
     constant_amortization_schedule = "constant-amortization-schedule"
 
 
+def count_paid_instalments(return_days, days, paid_on_day=True):
+    """Count the payments made up to each one of the given days.
+
+    The payments due on a given day are considered made if `paid_on_day` is
+    true. The given days are sorted once and walked along with the return
+    days, which must be increasing, in linear time on the number of
+    instalments and days, apart from the sorting. Any ordered values can be
+    counted, e.g., return dates and reference dates.
+    """
+
+    days = list(days)
+    num_instalments = len(return_days)
+
+    counts = [None] * len(days)
+    num_paid = 0
+
+    for i in sorted(range(len(days)), key=days.__getitem__):
+        day = days[i]
+
+        while num_paid < num_instalments and (
+            return_days[num_paid] < day
+            or (paid_on_day and return_days[num_paid] == day)
+        ):
+            num_paid += 1
+
+        counts[i] = num_paid
+
+    return counts
+
+
+class memoized_property(object):
+    """Read-only attribute computed on first access and memoized.
+
+    The decorated method is evaluated once and its value is stored in an
+    instance attribute named after it and prefixed by an underscore.
+    Deleting the attribute discards the memoized value, so it is evaluated
+    again on the next access.
+    """
+
+    def __init__(self, method):
+        self.method = method
+        self.attribute_name = "_" + method.__name__
+        self.__doc__ = method.__doc__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        value = getattr(instance, self.attribute_name, None)
+
+        if value is None:
+            value = self.method(instance)
+            setattr(instance, self.attribute_name, value)
+
+        return value
+
+    def __set__(self, instance, value):
+        setattr(instance, self.attribute_name, value)
+
+    def __delete__(self, instance):
+        setattr(instance, self.attribute_name, None)
+
+
+class memoized_column(memoized_property):
+    """Memoized schedule column.
+
+    A column may be stored in a compact ``array('d')`` buffer, in which case
+    it is still returned as a list.
+    """
+
+    def __get__(self, instance, owner):
+        value = super(memoized_column, self).__get__(instance, owner)
+
+        if isinstance(value, array):
+            return value.tolist()
+
+        return value
+
+
 class BaseSchedule(object):
     """Base amortization schedule.
 
@@ -16,12 +97,22 @@ class BaseSchedule(object):
 
     *   `calculate_due_payments`
     *   `calculate_balance`
-    *   `calculate_interest_payments`
+    *   `calculate_interest`
     *   `calculate_amortizations`
 
     These methods do not receive any parameters and should be able to return
     based only on principal, daily_interest_rate and return_days.
 
+    Since the schedules are linear on the principal, a schedule can also be
+    initialized with a unit principal schedule of the same class, daily
+    interest rate and return days. Its columns are then obtained by scaling
+    the columns of the unit schedule instead of calling the methods above.
+
+    The columns are lazily evaluated: each one is calculated on its first
+    access and memoized, as well as the totals derived from them. Therefore,
+    callers only pay for the columns they actually use. Memoized columns can
+    be moved to compact ``array('d')`` buffers by calling `compact`.
+
     Parameters
     ----------
     principal: float, required
@@ -31,32 +122,38 @@ class BaseSchedule(object):
     return_days: list, required
         List of integers representing the number of days since the loan
         was granted until the payments' due dates.
+    unit_schedule: BaseSchedule, optional
+        Schedule with unit principal from which the columns are scaled.
+        (default None)
     """
 
     schedule_type = None
 
-    def __init__(self, principal, daily_interest_rate, return_days):
+    columns = ("balance", "due_payments", "interest_payments", "amortizations")
+
+    totals = ("total_paid", "total_amortization", "total_interest")
+
+    __slots__ = (
+        "principal",
+        "daily_interest_rate",
+        "return_days",
+        "unit_schedule",
+        "_balance",
+        "_due_payments",
+        "_interest_payments",
+        "_amortizations",
+        "_total_paid",
+        "_total_amortization",
+        "_total_interest",
+    )
+
+    def __init__(self, principal, daily_interest_rate, return_days, unit_schedule=None):
         """Initialize schedule."""
 
         self.principal = principal
         self.daily_interest_rate = daily_interest_rate
         self.return_days = return_days
-
-        self.balance = getattr(
-            self, "calculate_balance", (len(return_days) + 1) * [0]
-        )()
-
-        self.due_payments = getattr(
-            self, "calculate_due_payments", len(return_days) * [0]
-        )()
-
-        self.interest_payments = getattr(
-            self, "calculate_interest", len(return_days) * [0]
-        )()
-
-        self.amortizations = getattr(
-            self, "calculate_amortizations", len(return_days) * [0]
-        )()
+        self.unit_schedule = unit_schedule
 
     def calculate_due_payments(self):
         raise NotImplementedError  # pragma: nocover
@@ -64,20 +161,351 @@ class BaseSchedule(object):
     def calculate_balance(self):
         raise NotImplementedError  # pragma: nocover
 
-    def calculate_interest_payments(self):
+    def calculate_interest(self):
         raise NotImplementedError  # pragma: nocover
 
     def calculate_amortizations(self):
         raise NotImplementedError  # pragma: nocover
 
-    @property
+    def calculate_rows(self):
+        raise NotImplementedError  # pragma: nocover
+
+    def iter_rows(self):
+        """Iterate over the rows of the schedule.
+
+        Each row is a tuple with the return day, the balance after the
+        payment, the amortization, the interest and the due payment. The rows
+        are calculated one at a time from the recurrences defining the
+        schedule, without materializing any column, which is meant for very
+        long schedules. The return days are assumed to be increasing.
+        """
+
+        if self.unit_schedule is None:
+            return self.calculate_rows()
+
+        return self._scaled_rows()
+
+    def _scaled_rows(self):
+
+        p = self.principal
+
+        for n, b, a, j, pmt in self.unit_schedule.iter_rows():
+            yield n, p * b, p * a, p * j, p * pmt
+
+    def replace_return_day(self, index, return_day):
+        """Replace the return day at the given position.
+
+        Only the quantities affected by the edit are recalculated, as
+        implemented by `recalculate_suffix`. The return days are edited in
+        place and must remain increasing.
+        """
+
+        self._edit_return_days(index, index + 1, [return_day])
+
+    def insert_return_day(self, return_day):
+        """Insert a return day, keeping the return days increasing.
+
+        Returns the position of the inserted return day.
+        """
+
+        index = bisect_left(self.return_days, return_day)
+
+        self._edit_return_days(index, index, [return_day])
+
+        return index
+
+    def delete_return_day(self, index):
+        """Delete the return day at the given position."""
+
+        self._edit_return_days(index, index + 1, [])
+
+    def _edit_return_days(self, start, stop, new_days):
+
+        if not 0 <= start <= len(self.return_days) or stop > len(self.return_days):
+            raise IndexError("Return day index out of range.")
+
+        if len(self.return_days) - (stop - start) + len(new_days) == 0:
+            raise ValueError("A schedule must have at least one return day.")
+
+        edited_days = (
+            ([self.return_days[start - 1]] if start > 0 else [0])
+            + new_days
+            + self.return_days[stop : stop + 1]
+        )
+
+        if any(m >= n for m, n in zip(edited_days[:-1], edited_days[1:])):
+            raise ValueError("Return days must be positive and increasing.")
+
+        if self.unit_schedule is not None:
+            # do not edit the return days shared with the unit schedule
+            self.return_days = list(self.return_days)
+
+        self.return_days[start:stop] = new_days
+
+        self.recalculate_suffix(start, stop, len(new_days))
+
+        self.unit_schedule = None
+
+    def recalculate_suffix(self, start, stop, num_new_days):
+        """Recalculate the schedule after its return days were edited.
+
+        The return days in positions `start` to `stop` were replaced by
+        `num_new_days` return days. By default, every column is discarded and
+        recalculated on its next access. Subclasses override this in order to
+        recalculate only the quantities affected by the edit.
+        """
+
+        self.discard_columns()
+
+    def discard_columns(self, column_names=None):
+        """Discard memoized columns and totals, which are lazily recalculated."""
+
+        for name in column_names or self.columns + self.totals:
+            delattr(self, name)
+
+    def balance_at_day(self, day, num_paid=None):
+        """Balance after the given number of days.
+
+        The payments due up to the given day, inclusive, are considered
+        paid. The balance after the last of them is then capitalized up to
+        the given day, i.e., if :math:`n_{i-1}\\leq n < n_i`, then the
+        balance after :math:`n` days is
+
+        .. math::
+
+            b_{i-1}(1+d)^{n-n_{i-1}}.
+
+        The last payment is found by bisecting the return days, which are
+        assumed to be increasing, so each query takes logarithmic time on
+        the number of instalments. Callers which tell the payments made
+        apart otherwise, e.g., by their dates when several return dates
+        share a count of working days, give their number as `num_paid`.
+        """
+
+        if num_paid is None:
+            num_paid = bisect_right(self.return_days, day)
+
+        return self._capitalized_balance(day, num_paid)
+
+    def payoff_at_day(self, day, num_paid=None):
+        """Amount which pays the loan off after the given number of days.
+
+        This is the balance after the given number of days, as in
+        `balance_at_day`, except that the payment due on the given day, if
+        any, is not considered paid yet. See `balance_at_day` for
+        `num_paid`.
+        """
+
+        if num_paid is None:
+            num_paid = bisect_left(self.return_days, day)
+
+        return self._capitalized_balance(day, num_paid)
+
+    def balances_at_days(self, days, num_paid=None):
+        """Balance after each one of the given numbers of days.
+
+        See `balance_at_day`. The given days are sorted once and walked
+        along with the return days by `count_paid_instalments`, so the
+        queries take linear time on the number of instalments and days,
+        apart from the sorting. The numbers of payments made may be given
+        instead, as `num_paid`.
+        """
+
+        days = list(days)
+
+        if num_paid is None:
+            num_paid = count_paid_instalments(self.return_days, days)
+
+        return [self._capitalized_balance(n, i) for n, i in zip(days, num_paid)]
+
+    def payoffs_at_days(self, days, num_paid=None):
+        """Payoff amount after each one of the given numbers of days.
+
+        See `payoff_at_day` and `balances_at_days`.
+        """
+
+        days = list(days)
+
+        if num_paid is None:
+            num_paid = count_paid_instalments(self.return_days, days, paid_on_day=False)
+
+        return [self._capitalized_balance(n, i) for n, i in zip(days, num_paid)]
+
+    def prepaid_schedule(
+        self, day, amount, reduce_term=False, start_day=None, num_paid=None
+    ):
+        """Schedule of the balance left by a prepayment after the given days.
+
+        The payments due up to the given day, inclusive, are considered
+        paid, as in `balance_at_day`, and the prepayment is deducted from the
+        balance after the given day. The remaining balance is amortized over
+        the remaining return days, which reduces the instalments, or over the
+        fewest of them found by `remaining_term`, which reduces the term, if
+        `reduce_term` is true. The return days of the new schedule are
+        counted from the start day, which is the given day by default, see
+        `remaining_schedule`. Day counts which include both ends of a period
+        count the day of the prepayment again, in which case the start day
+        precedes it. The number of payments made may be given as
+        `num_paid`, see `balance_at_day`.
+
+        Returns
+        -------
+        tuple
+            Number of payments made before the prepayment and the schedule
+            of the remaining balance.
+        """
+
+        if start_day is None:
+            start_day = day
+
+        if num_paid is None:
+            num_paid = bisect_right(self.return_days, day)
+
+        if num_paid == len(self.return_days):
+            raise ValueError("There are no payments due after the prepayment.")
+
+        balance = self._capitalized_balance(day, num_paid)
+
+        if not 0 < amount < balance:
+            raise ValueError(
+                "The prepayment must be positive and less than the balance."
+            )
+
+        balance -= amount
+
+        if reduce_term:
+            num_instalments = self.remaining_term(start_day, num_paid, balance)
+        else:
+            num_instalments = len(self.return_days) - num_paid
+
+        return num_paid, self.remaining_schedule(
+            balance, start_day, num_paid, num_paid + num_instalments
+        )
+
+    def remaining_term(self, day, num_paid, balance):
+        """Fewest remaining instalments which amortize the given balance.
+
+        The balance after the given day must be amortized by the return days
+        following the paid ones without increasing the instalments.
+        """
+
+        raise NotImplementedError  # pragma: nocover
+
+    def remaining_schedule(self, principal, day, start, stop):
+        """Schedule of the same type over the given slice of return days.
+
+        The schedule starts after the given number of days, from which its
+        return days are counted, so that it continues this schedule with a
+        new principal.
+        """
+
+        return self.shifted_schedule(
+            principal, day, [n - day for n in self.return_days[start:stop]]
+        )
+
+    def shifted_schedule(self, principal, day, return_days):
+        """Schedule of the same type starting after the given number of days.
+
+        The return days are counted from the given day. Schedules with other
+        interest rate models override this method in order to start their
+        models on the given day.
+        """
+
+        return type(self)(principal, self.daily_interest_rate, return_days)
+
+    def _capitalized_balance(self, day, num_paid):
+
+        balance = self.column_buffer("balance")
+
+        if day <= 0:
+            return balance[0]
+
+        if num_paid == len(self.return_days):
+            return 0.0
+
+        previous_day = self.return_days[num_paid - 1] if num_paid > 0 else 0
+
+        return balance[num_paid] * self.capitalization_factor(previous_day, day)
+
+    def capitalization_factor(self, start_day, end_day):
+        """Factor by which the balance grows from a day to another.
+
+        For a fixed daily interest rate :math:`d`, it is
+        :math:`(1+d)^{n-m}` from the :math:`m`-th to the :math:`n`-th day.
+        Schedules with other interest rate models override this method.
+        """
+
+        return (1 + self.daily_interest_rate) ** (end_day - start_day)
+
+    def column_buffer(self, column_name):
+        """Get a column without copying it into a list if it is compact."""
+
+        buffer = getattr(self, "_" + column_name, None)
+
+        return getattr(self, column_name) if buffer is None else buffer
+
+    def scale_unit_column(self, column_name):
+        """Scale a column of the unit schedule by the principal."""
+
+        p = self.principal
+
+        return [p * value for value in getattr(self.unit_schedule, column_name)]
+
+    def compact(self):
+        """Store every column in a compact ``array('d')`` buffer.
+
+        The columns are calculated if they were not yet and are still
+        returned as lists, although a new list is built on each access. The
+        return days are shared with the unit schedule, if there is one.
+        Returns the schedule itself.
+        """
+
+        for column_name in self.columns:
+            setattr(self, "_" + column_name, array("d", getattr(self, column_name)))
+
+        if self.unit_schedule is not None:
+            self.return_days = self.unit_schedule.return_days
+
+        return self
+
+    @memoized_column
+    def balance(self):
+        if self.unit_schedule is not None:
+            return self.scale_unit_column("balance")
+        return self.calculate_balance()
+
+    @memoized_column
+    def due_payments(self):
+        if self.unit_schedule is not None:
+            return self.scale_unit_column("due_payments")
+        return self.calculate_due_payments()
+
+    @memoized_column
+    def interest_payments(self):
+        if self.unit_schedule is not None:
+            return self.scale_unit_column("interest_payments")
+        return self.calculate_interest()
+
+    @memoized_column
+    def amortizations(self):
+        if self.unit_schedule is not None:
+            return self.scale_unit_column("amortizations")
+        return self.calculate_amortizations()
+
+    @memoized_property
     def total_paid(self):
-        return sum(getattr(self, "due_payments", 0.0))
+        if self.unit_schedule is not None:
+            return self.principal * self.unit_schedule.total_paid
+        return sum(self.due_payments)
 
-    @property
+    @memoized_property
     def total_amortization(self):
-        return sum(getattr(self, "amortizations", 0.0))
+        if self.unit_schedule is not None:
+            return self.principal * self.unit_schedule.total_amortization
+        return sum(self.amortizations)
 
-    @property
+    @memoized_property
     def total_interest(self):
-        return sum(getattr(self, "interest_payments", 0.0))
+        if self.unit_schedule is not None:
+            return self.principal * self.unit_schedule.total_interest
+        return sum(self.interest_payments)
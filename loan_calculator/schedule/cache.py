@@ -0,0 +1,122 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class UnitScheduleCache(object):
+    """Bounded cache of unit principal amortization schedules.
+
+    All the amortization schedules are linear on the principal, i.e., each
+    column of a schedule with principal :math:`s` is :math:`s` times the
+    respective column of the schedule with the same daily interest rate and
+    return days and principal :math:`1`. This cache stores such unit
+    schedules, keyed by schedule class, daily interest rate and return days,
+    so that schedules for any principal can be obtained by scaling them.
+
+    The least recently used unit schedule is evicted once the cache holds
+    more than `maxsize` schedules. The cache is shared by the loans built in
+    every thread, so its bookkeeping is guarded by a lock, while the unit
+    schedules are built outside of it.
+
+    Parameters
+    ----------
+    maxsize: int, optional
+        Maximum number of unit schedules held by the cache. (default 256)
+    """
+
+    def __init__(self, maxsize=256):
+        """Initialize cache."""
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        self._unit_schedules = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._unit_schedules)
+
+    def unit_schedule(self, schedule_cls, daily_interest_rate, return_days):
+        """Get the unit principal schedule for the given parameters.
+
+        The unit schedule is built and stored on a cache miss.
+
+        Parameters
+        ----------
+        schedule_cls: type, required
+            A subclass of BaseSchedule.
+        daily_interest_rate: float, required
+            Schedule's daily interest rate.
+        return_days: list, required
+            List of integers representing the number of days since the loan
+            was granted until the payments' due dates.
+        """
+
+        key = (schedule_cls, daily_interest_rate, tuple(return_days))
+
+        with self._lock:
+            unit_schedule = self._unit_schedules.get(key)
+
+            if unit_schedule is not None:
+                self.hits += 1
+                self._unit_schedules.move_to_end(key)
+
+                return unit_schedule
+
+            self.misses += 1
+
+        unit_schedule = schedule_cls(1.0, daily_interest_rate, list(return_days))
+
+        with self._lock:
+            # another thread may have stored the same unit schedule meanwhile
+            unit_schedule = self._unit_schedules.setdefault(key, unit_schedule)
+            self._unit_schedules.move_to_end(key)
+
+            if len(self._unit_schedules) > self.maxsize:
+                self._unit_schedules.popitem(last=False)
+
+        return unit_schedule
+
+    def schedule(self, schedule_cls, principal, daily_interest_rate, return_days):
+        """Get a schedule whose columns are scaled from a cached unit schedule.
+
+        Parameters
+        ----------
+        schedule_cls: type, required
+            A subclass of BaseSchedule.
+        principal: float, required
+            Loan's principal.
+        daily_interest_rate: float, required
+            Loan's daily interest rate.
+        return_days: list, required
+            List of integers representing the number of days since the loan
+            was granted until the payments' due dates.
+        """
+
+        return schedule_cls(
+            principal,
+            daily_interest_rate,
+            return_days,
+            unit_schedule=self.unit_schedule(
+                schedule_cls, daily_interest_rate, return_days
+            ),
+        )
+
+    def info(self):
+        """Report the cache statistics, as in functools.lru_cache."""
+
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+    def clear(self):
+        """Clear the cache and its statistics."""
+
+        with self._lock:
+            self._unit_schedules.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+default_unit_schedule_cache = UnitScheduleCache()
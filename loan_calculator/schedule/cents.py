@@ -0,0 +1,229 @@
+from array import array
+
+from loan_calculator.rounds import round_half_up_scaled
+from loan_calculator.schedule.base import (
+    AmortizationScheduleType,
+    memoized_column,
+    memoized_property,
+)
+from loan_calculator.schedule.price import BasePriceSchedule
+
+
+class CentsSchedule(object):
+    """Amortization schedule rounded to integer cents by difference.
+
+    Every value of the given schedule is rounded half up to cents, except
+    for the last amortization, which is the difference between the principal
+    and the previous rounded amortizations. Therefore, the rounded
+    amortizations sum up exactly to the rounded principal. Moreover,
+
+    - the balance is the principal minus the amortizations paid so far, so
+      that the last balance is zero (the balance of a regressive Price
+      schedule is not amortized by its payments, so it is rounded instead,
+      except for the last one, which is zero),
+    - in Price schedules, all due payments but the last one are the rounded
+      PMT and the interest is the payment minus the amortization,
+    - the last due payment, as well as the due payments of constant
+      amortization schedules, is the amortization plus the rounded interest.
+
+    The arithmetic is done with integers, so the schedule is exact and ready
+    for accounting. The columns in cents are suffixed with ``_cents``, while
+    the columns without suffix are the same values as floats. Both are
+    memoized and may be moved to compact buffers by calling `compact`.
+
+    Parameters
+    ----------
+    schedule: BaseSchedule, required
+        Schedule to be rounded.
+    """
+
+    __slots__ = (
+        "schedule",
+        "_cents_columns",
+        "_balance",
+        "_amortizations",
+        "_interest_payments",
+        "_due_payments",
+    )
+
+    columns = ("balance", "amortizations", "interest_payments", "due_payments")
+
+    def __init__(self, schedule):
+        """Initialize schedule."""
+
+        self.schedule = schedule
+
+        self._cents_columns = None
+        for column_name in self.columns:
+            setattr(self, "_" + column_name, None)
+
+    @property
+    def return_days(self):
+        return self.schedule.return_days
+
+    def _rows_in_cents(self, rows):
+
+        r = round_half_up_scaled
+
+        schedule = self.schedule
+        principal = r(schedule.principal)
+        num_instalments = len(schedule.return_days)
+
+        is_price = isinstance(schedule, BasePriceSchedule)
+        is_amortized = (
+            schedule.schedule_type != AmortizationScheduleType.regressive_price_schedule
+        )
+
+        pmt = r(schedule.pmt) if is_price else None
+        amortized = 0
+
+        for i, (n, b, a, j, _) in enumerate(rows, 1):
+
+            is_last = i == num_instalments
+
+            a = principal - amortized if is_last else r(a)
+            amortized += a
+
+            if is_price and not is_last:
+                j, p = pmt - a, pmt
+            else:
+                j = r(j)
+                p = a + j
+
+            if is_amortized:
+                b = principal - amortized
+            else:
+                b = 0 if is_last else r(b)
+
+            yield n, b, a, j, p
+
+    @memoized_property
+    def cents_columns(self):
+        """Balance, amortizations, interest and due payments in cents."""
+
+        s = self.schedule
+
+        rows = list(
+            self._rows_in_cents(
+                zip(
+                    s.return_days,
+                    s.balance[1:],
+                    s.amortizations,
+                    s.interest_payments,
+                    s.due_payments,
+                )
+            )
+        )
+
+        balance = [round_half_up_scaled(s.principal)] + [row[1] for row in rows]
+
+        return (
+            balance,
+            [row[2] for row in rows],
+            [row[3] for row in rows],
+            [row[4] for row in rows],
+        )
+
+    def compact(self):
+        """Store the columns in compact ``array('q')`` and ``array('d')`` buffers.
+
+        The columns in cents and as floats are calculated if they were not
+        yet and are still returned as lists, although a new list is built on
+        each access. The rounded schedule is compacted as well, if it can be.
+        Returns the schedule itself.
+        """
+
+        self.cents_columns = tuple(array("q", column) for column in self.cents_columns)
+
+        for column_name in self.columns:
+            setattr(self, "_" + column_name, array("d", getattr(self, column_name)))
+
+        if hasattr(self.schedule, "compact"):
+            self.schedule.compact()
+
+        return self
+
+    def _cents_column(self, index):
+
+        column = self.cents_columns[index]
+
+        if isinstance(column, array):
+            return column.tolist()
+
+        return column
+
+    @property
+    def balance_cents(self):
+        return self._cents_column(0)
+
+    @property
+    def amortizations_cents(self):
+        return self._cents_column(1)
+
+    @property
+    def interest_payments_cents(self):
+        return self._cents_column(2)
+
+    @property
+    def due_payments_cents(self):
+        return self._cents_column(3)
+
+    @memoized_column
+    def balance(self):
+        return [c / 100 for c in self.cents_columns[0]]
+
+    @memoized_column
+    def amortizations(self):
+        return [c / 100 for c in self.cents_columns[1]]
+
+    @memoized_column
+    def interest_payments(self):
+        return [c / 100 for c in self.cents_columns[2]]
+
+    @memoized_column
+    def due_payments(self):
+        return [c / 100 for c in self.cents_columns[3]]
+
+    @property
+    def total_paid(self):
+        return sum(self.cents_columns[3]) / 100
+
+    @property
+    def total_amortization(self):
+        return sum(self.cents_columns[1]) / 100
+
+    @property
+    def total_interest(self):
+        return sum(self.cents_columns[2]) / 100
+
+    def iter_rows(self):
+        """Iterate over the rows of the schedule, as floats.
+
+        The rows are streamed from the rounded schedule's rows.
+        """
+
+        for n, b, a, j, p in self._rows_in_cents(self.schedule.iter_rows()):
+            yield n, b / 100, a / 100, j / 100, p / 100
+
+
+class SimpleCentsSchedule(CentsSchedule):
+    """Amortization schedule with every value rounded half up to cents.
+
+    Unlike CentsSchedule, each value of the given schedule is rounded on its
+    own, so the rounded amortizations may not sum up to the principal. The
+    rounding is exact and computed once for all columns, which are memoized.
+
+    Parameters
+    ----------
+    schedule: BaseSchedule, required
+        Schedule to be rounded.
+    """
+
+    __slots__ = ()
+
+    def _rows_in_cents(self, rows):
+
+        r = round_half_up_scaled
+
+        for n, b, a, j, p in rows:
+            yield n, r(b), r(a), r(j), r(p)
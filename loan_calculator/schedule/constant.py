@@ -1,3 +1,6 @@
+import math
+
+from loan_calculator import kernels
 from loan_calculator.schedule.base import BaseSchedule, AmortizationScheduleType
 
 
@@ -24,6 +27,8 @@ class ConstantAmortizationSchedule(BaseSchedule):
 
     schedule_type = AmortizationScheduleType.constant_amortization_schedule
 
+    __slots__ = ()
+
     def calculate_balance(self):
         """Calculate the balance after each payment.
 
@@ -58,6 +63,21 @@ class ConstantAmortizationSchedule(BaseSchedule):
 
         return [self.principal / len(self.return_days) for _ in self.return_days]
 
+    def remaining_term(self, day, num_paid, balance):
+        """Fewest remaining instalments which amortize the given balance.
+
+        The amortizations of the remaining schedule must not exceed the
+        current ones, :math:`s/k`, so the balance :math:`b` is amortized by
+        :math:`\\lceil bk/s\\rceil` instalments.
+        """
+
+        k = len(self.return_days)
+
+        # tolerate rounding errors on balances amortized by whole instalments
+        num_instalments = math.ceil(balance * k / self.principal * (1 - 1e-12))
+
+        return min(max(num_instalments, 1), k - num_paid)
+
     def calculate_interest(self):
         """Calculate the interest in each payment.
 
@@ -72,15 +92,9 @@ class ConstantAmortizationSchedule(BaseSchedule):
         daily interest rate and :math:`n_1,\\ldots,n_k` are the return days.
         """
 
-        # rename variable to make the math more explicit
-        d = self.daily_interest_rate
-
-        return [
-            b * ((1 + d) ** (n - m) - 1)
-            for b, n, m in zip(
-                self.balance[:-1], self.return_days, [0] + self.return_days[:-1]
-            )
-        ]
+        return kernels.period_interest(
+            self.balance[:-1], self.daily_interest_rate, self.return_days
+        )
 
     def calculate_due_payments(self):
         """Calculate the due payments.
@@ -102,12 +116,69 @@ class ConstantAmortizationSchedule(BaseSchedule):
 
         # variables are renamed to make the math more explicit
         p = self.principal
-        d = self.daily_interest_rate
         k = len(self.return_days)
 
         return [
-            b * ((1 + d) ** (n - m) - 1) + p / k
-            for b, n, m in zip(
-                self.balance[:-1], self.return_days, [0] + self.return_days[:-1]
+            j + p / k
+            for j in kernels.period_interest(
+                self.balance[:-1], self.daily_interest_rate, self.return_days
             )
         ]
+
+    def recalculate_suffix(self, start, stop, num_new_days):
+        """Recalculate the schedule after its return days were edited.
+
+        Replacing a return day keeps the balance and the amortizations and
+        only changes the interest and the due payments of the edited period
+        and of the following one, which are recalculated in place. Inserting
+        or deleting return days changes the amortization of every payment, so
+        the whole schedule is lazily recalculated.
+        """
+
+        interest = getattr(self, "_interest_payments", None)
+        payments = getattr(self, "_due_payments", None)
+
+        if (
+            self.unit_schedule is not None
+            or stop - start != 1
+            or num_new_days != 1
+            or interest is None
+            or payments is None
+        ):
+            return super(ConstantAmortizationSchedule, self).recalculate_suffix(
+                start, stop, num_new_days
+            )
+
+        # variables are renamed to make the math more explicit
+        p = self.principal
+        r_days = self.return_days
+        k = len(r_days)
+
+        for i in range(start, min(start + 2, k)):
+            m = r_days[i - 1] if i > 0 else 0
+            j = p * (1 - float(i) / k) * (self.capitalization_factor(m, r_days[i]) - 1)
+            interest[i] = j
+            payments[i] = j + p / k
+
+        self.discard_columns(("total_interest", "total_paid"))
+
+    def calculate_rows(self):
+        """Calculate the rows of the schedule one at a time.
+
+        Each row is given by the same expressions as the columns, with the
+        previous balance and return day carried along the iteration.
+        """
+
+        # variables are renamed to make the math more explicit
+        p = self.principal
+        k = len(self.return_days)
+
+        a = p / k
+        m = 0
+
+        for i, n in enumerate(self.return_days, 1):
+            j = p * (1 - float(i - 1) / k) * (self.capitalization_factor(m, n) - 1)
+
+            yield n, p * (1 - float(i) / k), a, j, j + a
+
+            m = n
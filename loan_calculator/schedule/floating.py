@@ -0,0 +1,136 @@
+from loan_calculator.schedule.base import AmortizationScheduleType
+from loan_calculator.schedule.constant import ConstantAmortizationSchedule
+from loan_calculator.schedule.price import (
+    ProgressivePriceSchedule,
+    RegressivePriceSchedule,
+)
+
+
+class FloatingRateSchedule(object):
+    """Mixin for schedules indexed to a daily floating rate.
+
+    The balance is capitalized by a floating rate index, given as a
+    CumulativeIndex, plus a fixed daily spread :math:`d`. If the schedule
+    starts at day :math:`o` of the index and :math:`F` are its cumulative
+    factors, the capitalization factor from the :math:`m`-th to the
+    :math:`n`-th day of the schedule is
+
+    .. math::
+
+        \\frac{F_{o+n}}{F_{o+m}}(1+d)^{n-m},
+
+    which costs a single division. The discount factors of Price schedules
+    are the inverses of the capitalization factors from the start, and every
+    column is derived from them as for a fixed rate.
+
+    Parameters
+    ----------
+    principal: float, required
+        Loan's principal.
+    daily_interest_rate: float, required
+        Daily spread over the index.
+    return_days: list, required
+        List of integers representing the number of days since the loan
+        was granted until the payments' due dates.
+    rate_index: CumulativeIndex, required
+        Floating rate index.
+    index_offset: int, optional
+        Day of the index on which the schedule starts. (default 0)
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self, principal, daily_interest_rate, return_days, rate_index, index_offset=0
+    ):
+        """Initialize schedule."""
+
+        super(FloatingRateSchedule, self).__init__(
+            principal, daily_interest_rate, return_days
+        )
+
+        self.rate_index = rate_index
+        self.index_offset = index_offset
+
+    def capitalization_factor(self, start_day, end_day):
+
+        # variables are renamed to make the math more explicit
+        o = self.index_offset
+        d = self.daily_interest_rate
+
+        return self.rate_index.factor_between(o + start_day, o + end_day) * (
+            (1 + d) ** (end_day - start_day)
+        )
+
+    def calculate_discount_factors(self, return_days):
+
+        g = self.capitalization_factor
+
+        return [1.0 / g(0, n) for n in return_days]
+
+    def shifted_schedule(self, principal, day, return_days):
+
+        return type(self)(
+            principal,
+            self.daily_interest_rate,
+            return_days,
+            self.rate_index,
+            index_offset=self.index_offset + day,
+        )
+
+    def revalue(self):
+        """Discard every memoized quantity after the index was updated."""
+
+        self.discard_columns()
+
+        if getattr(type(self), "discount_factors", None) is not None:
+            self.discard_columns(("discount_factors", "discount_sums", "pmt"))
+
+
+class FloatingProgressivePriceSchedule(FloatingRateSchedule, ProgressivePriceSchedule):
+    """Progressive Price schedule indexed to a daily floating rate."""
+
+    __slots__ = ("rate_index", "index_offset")
+
+
+class FloatingRegressivePriceSchedule(FloatingRateSchedule, RegressivePriceSchedule):
+    """Regressive Price schedule indexed to a daily floating rate."""
+
+    __slots__ = ("rate_index", "index_offset")
+
+
+class FloatingConstantAmortizationSchedule(
+    FloatingRateSchedule, ConstantAmortizationSchedule
+):
+    """Constant amortization schedule indexed to a daily floating rate.
+
+    The interest of each payment is the capitalization of the previous
+    balance over the period, i.e.,
+    :math:`J_i = b_{i-1}(\\frac{F_{o+n_i}}{F_{o+n_{i-1}}}(1+d)^{n_i-n_{i-1}}-1)`.
+    """
+
+    __slots__ = ("rate_index", "index_offset")
+
+    def calculate_interest(self):
+
+        g = self.capitalization_factor
+
+        return [
+            b * (g(m, n) - 1)
+            for b, n, m in zip(
+                self.balance[:-1], self.return_days, [0] + self.return_days[:-1]
+            )
+        ]
+
+    def calculate_due_payments(self):
+
+        a = self.principal / len(self.return_days)
+
+        return [j + a for j in self.calculate_interest()]
+
+
+FLOATING_SCHEDULE_TYPE_CLASS_MAP = {
+    AmortizationScheduleType.constant_amortization_schedule: FloatingConstantAmortizationSchedule,  # noqa
+    AmortizationScheduleType.regressive_price_schedule: FloatingRegressivePriceSchedule,  # noqa
+    AmortizationScheduleType.progressive_price_schedule: FloatingProgressivePriceSchedule,  # noqa
+}
@@ -0,0 +1,143 @@
+from loan_calculator.schedule.base import memoized_property
+
+
+class InflationIndexedSchedule(object):
+    """Amortization schedule with principal corrected by an inflation index.
+
+    The given schedule is the schedule in real terms, i.e., built with the
+    real interest rate over the principal at the base month. Before interest
+    applies, the outstanding balance is corrected by the inflation index, so
+    that every value of the :math:`i`-th row is multiplied by the correction
+    factor
+
+    .. math::
+
+        c_i = \\frac{I_{m_i}}{I_{m_0}},
+
+    where :math:`I` are the index numbers, :math:`m_i` is the month offset of
+    the :math:`i`-th return day and :math:`m_0` the one of the base month.
+    In particular, the interest :math:`J_ic_i` is the real interest over the
+    corrected balance :math:`b_{i-1}c_i`, and the monetary correction of the
+    :math:`i`-th period is
+
+    .. math::
+
+        b_{i-1}(c_i - c_{i-1}),\\ c_0 = 1,
+
+    so that :math:`b_ic_i = b_{i-1}c_{i-1} + b_{i-1}(c_i - c_{i-1}) + J_ic_i
+    - P_ic_i`.
+
+    Parameters
+    ----------
+    schedule: BaseSchedule, required
+        Schedule in real terms.
+    inflation_index: InflationIndex, required
+        Inflation index shared by the indexed schedules.
+    month_offsets: list, required
+        Month of the index at which each payment is corrected.
+    base_month_offset: int, optional
+        Month of the index at which the principal is given. (default 0)
+    """
+
+    columns = (
+        "balance",
+        "due_payments",
+        "interest_payments",
+        "amortizations",
+        "monetary_corrections",
+        "correction_factors",
+    )
+
+    def __init__(self, schedule, inflation_index, month_offsets, base_month_offset=0):
+        """Initialize schedule."""
+
+        if len(month_offsets) != len(schedule.return_days):
+            raise ValueError("There must be a month offset for each return day.")
+
+        self.schedule = schedule
+        self.inflation_index = inflation_index
+        self.month_offsets = month_offsets
+        self.base_month_offset = base_month_offset
+
+    @property
+    def principal(self):
+        return self.schedule.principal
+
+    @property
+    def return_days(self):
+        return self.schedule.return_days
+
+    def revalue(self):
+        """Discard every column after the inflation index was updated."""
+
+        for name in self.columns:
+            delattr(self, name)
+
+    def _corrected(self, column):
+        return [x * c for x, c in zip(column, self.correction_factors)]
+
+    @memoized_property
+    def correction_factors(self):
+        """Correction factor :math:`c_i` of each payment."""
+
+        index_number = self.inflation_index.index_number
+        base = index_number(self.base_month_offset)
+
+        return [index_number(m) / base for m in self.month_offsets]
+
+    @memoized_property
+    def balance(self):
+        return [self.schedule.principal] + self._corrected(self.schedule.balance[1:])
+
+    @memoized_property
+    def due_payments(self):
+        return self._corrected(self.schedule.due_payments)
+
+    @memoized_property
+    def interest_payments(self):
+        return self._corrected(self.schedule.interest_payments)
+
+    @memoized_property
+    def amortizations(self):
+        return self._corrected(self.schedule.amortizations)
+
+    @memoized_property
+    def monetary_corrections(self):
+        """Monetary correction of the balance in each period."""
+
+        c = self.correction_factors
+
+        return [
+            b * (c_n - c_m)
+            for b, c_n, c_m in zip(self.schedule.balance[:-1], c, [1.0] + c[:-1])
+        ]
+
+    @property
+    def total_paid(self):
+        return sum(self.due_payments)
+
+    @property
+    def total_amortization(self):
+        return sum(self.amortizations)
+
+    @property
+    def total_interest(self):
+        return sum(self.interest_payments)
+
+    @property
+    def total_monetary_correction(self):
+        return sum(self.monetary_corrections)
+
+    def iter_rows(self):
+        """Iterate over the rows of the schedule.
+
+        The rows of the real schedule are streamed and corrected one at a
+        time.
+        """
+
+        index_number = self.inflation_index.index_number
+        base = index_number(self.base_month_offset)
+
+        for (n, b, a, j, p), m in zip(self.schedule.iter_rows(), self.month_offsets):
+            c = index_number(m) / base
+            yield n, b * c, a * c, j * c, p * c
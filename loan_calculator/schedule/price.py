@@ -1,5 +1,12 @@
-from loan_calculator.pmt import constant_return_pmt
-from loan_calculator.schedule.base import BaseSchedule, AmortizationScheduleType
+from bisect import bisect_left
+
+from loan_calculator.pmt import discount_factors
+from loan_calculator.schedule.base import (
+    AmortizationScheduleType,
+    BaseSchedule,
+    memoized_column,
+    memoized_property,
+)
 
 
 class BasePriceSchedule(BaseSchedule):
@@ -9,16 +16,73 @@ class BasePriceSchedule(BaseSchedule):
     is the same for all instalments. The distributions of amortization and
     interest in each payment are given by either a increasing or decreasing
     rule over the amortizations. Both are implemented as subclasses of this.
+
+    All the columns of a Price schedule are derived from the discount factors
+    :math:`v_j = (1+d)^{-n_j}`, which are computed once per schedule, so that
+    building the whole schedule takes time linear on the number of
+    instalments.
     """
 
-    def __init__(self, principal, daily_interest_rate, return_days):
+    __slots__ = ("_discount_factors", "_discount_sums", "_pmt")
+
+    def __init__(self, principal, daily_interest_rate, return_days, unit_schedule=None):
+        """Initialize schedule.
+
+        The return days must be increasing, since the columns are derived
+        from the running sums of the discount factors. The return days of a
+        unit schedule were checked when it was built.
+        """
 
-        self.pmt = constant_return_pmt(principal, daily_interest_rate, return_days)
+        if unit_schedule is None and any(
+            m >= n for m, n in zip(return_days, return_days[1:])
+        ):
+            raise ValueError("Return days must be increasing.")
 
         super(BasePriceSchedule, self).__init__(
-            principal, daily_interest_rate, return_days
+            principal, daily_interest_rate, return_days, unit_schedule
         )
 
+    @memoized_property
+    def discount_factors(self):
+        if self.unit_schedule is not None:
+            return self.unit_schedule.discount_factors
+        return self.calculate_discount_factors(self.return_days)
+
+    def calculate_discount_factors(self, return_days):
+        """Calculate the discount factors of the given return days.
+
+        The discount factor of a return day is the inverse of the
+        capitalization factor from the start of the schedule up to it, i.e.,
+        :math:`v_j = (1+d)^{-n_j}` for a fixed daily interest rate.
+        """
+
+        return discount_factors(self.daily_interest_rate, return_days)
+
+    @memoized_property
+    def discount_sums(self):
+        """Sums of the discount factors up to each return day.
+
+        The sums are accumulated in a single pass over the discount factors,
+        in the order of the return days, which are increasing.
+        """
+
+        if self.unit_schedule is not None:
+            return self.unit_schedule.discount_sums
+
+        partial_sums = []
+        running_sum = 0.0
+        for v_n in self.discount_factors:
+            running_sum += v_n
+            partial_sums.append(running_sum)
+
+        return partial_sums
+
+    @memoized_property
+    def pmt(self):
+        if self.unit_schedule is not None:
+            return self.principal * self.unit_schedule.pmt
+        return self.principal / sum(self.discount_factors)
+
     def calculate_balance(self):
         """Calculate the balance after each payment.
 
@@ -48,26 +112,144 @@ class BasePriceSchedule(BaseSchedule):
             \\right.,
 
         where :math:`P = \\mathrm{PMT}(s,d,(n_1,\\ldots,n_k))`.
+
+        The sums on the numerator are given by `discount_sums`.
         """
 
         # variables are renamed to make the math more explicit
         p = self.principal
-        d = self.daily_interest_rate
-        r_days = self.return_days
+        v = self.discount_factors
+        total = sum(v)
 
-        return [
-            (
-                p
-                * ((1 + d) ** n)
-                * (
-                    1
-                    - sum(1 / (1 + d) ** m for m in r_days if m <= n)
-                    / sum(1 / (1 + d) ** m for m in r_days)
-                )
-            )
-            for n in [0] + r_days
+        return [p] + [
+            p / v_n * (1 - s_n / total) for v_n, s_n in zip(v, self.discount_sums)
+        ]
+
+    def recalculate_suffix(self, start, stop, num_new_days):
+        """Recalculate the schedule after its return days were edited.
+
+        Only the discount factors of the new return days are calculated and
+        only the discount sums from the first edited position onwards are
+        accumulated again, so that no power is evaluated for the remaining
+        return days. The PMT is updated from the last discount sum. Every
+        column depends on the PMT, so they are discarded and lazily
+        recalculated from the updated discount factors and sums.
+        """
+
+        if self.unit_schedule is not None:
+            v = self.unit_schedule.discount_factors
+            sums = self.unit_schedule.discount_sums
+        else:
+            v = getattr(self, "_discount_factors", None)
+            sums = getattr(self, "_discount_sums", None)
+
+        self.discard_columns(self.columns + self.totals + ("pmt", "discount_sums"))
+
+        if v is None:
+            # nothing was calculated for the previous return days
+            del self.discount_factors
+            return
+
+        new_days = self.return_days[start : start + num_new_days]
+
+        v = list(v)
+        v[start:stop] = self.calculate_discount_factors(new_days)
+
+        self.discount_factors = v
+
+        if sums is None:
+            return
+
+        sums = sums[:start]
+        running_sum = sums[-1] if sums else 0.0
+        for v_n in v[start:]:
+            running_sum += v_n
+            sums.append(running_sum)
+
+        self.discount_sums = sums
+        self.pmt = self.principal / running_sum
+
+    def remaining_term(self, day, num_paid, balance):
+        """Fewest remaining instalments which amortize the given balance.
+
+        If :math:`v_m` is the discount factor of the given day and
+        :math:`S_j` are the discount sums, :math:`r` instalments of the
+        current PMT :math:`P` amortize the balance :math:`b` if
+        :math:`P(S_{i+r} - S_i) \\geq bv_m`, where :math:`i` is the number of
+        paid instalments. The discount sums are increasing, so the least
+        such :math:`r` is found by bisecting them.
+        """
+
+        sums = self.discount_sums
+        previous_sum = sums[num_paid - 1] if num_paid > 0 else 0.0
+
+        target = previous_sum + balance / self.capitalization_factor(0, day) / self.pmt
+
+        # tolerate rounding errors on balances amortized by whole instalments
+        index = bisect_left(sums, target * (1 - 1e-12), num_paid)
+
+        return min(index + 1, len(sums)) - num_paid
+
+    def remaining_schedule(self, principal, day, start, stop):
+        """Schedule of the same type over the given slice of return days.
+
+        The discount factors of the remaining schedule are those of this one
+        divided by the discount factor :math:`v_m` of the given day, since
+        :math:`(1+d)^{-(n_j-m)} = v_j/v_m`, so that no power is evaluated
+        again.
+        """
+
+        schedule = super(BasePriceSchedule, self).remaining_schedule(
+            principal, day, start, stop
+        )
+
+        g_m = self.capitalization_factor(0, day)
+        schedule.discount_factors = [
+            v_n * g_m for v_n in self.discount_factors[start:stop]
         ]
 
+        return schedule
+
+    def calculate_rows(self):
+        """Calculate the rows of the schedule one at a time.
+
+        The balance is given by the same closed formula as in
+        `calculate_balance`, with the sum on the numerator accumulated along
+        the iteration. Only the split of each payment between amortization
+        and interest, given by `split_payment`, differs between Price
+        schedules.
+        """
+
+        # variables are renamed to make the math more explicit
+        p = self.principal
+        g = self.capitalization_factor
+
+        total = sum(1.0 / g(0, n) for n in self.return_days)
+        pmt = p / total
+
+        partial_sum = 0.0
+        b_prev, v_prev = p, 1.0
+
+        for n in self.return_days:
+            v_n = 1.0 / g(0, n)
+            partial_sum += v_n
+
+            b = p / v_n * (1 - partial_sum / total)
+            a, j = self.split_payment(pmt, b_prev, v_prev, v_n)
+
+            yield n, b, a, j, pmt
+
+            b_prev, v_prev = b, v_n
+
+    def split_payment(self, pmt, previous_balance, previous_factor, factor):
+        raise NotImplementedError  # pragma: nocover
+
+    @memoized_column
+    def due_payments(self):
+        # a single float object is shared among all the due payments, which
+        # is cheaper than scaling the unit schedule's column
+        return self.calculate_due_payments()
+
     def calculate_due_payments(self):
         """Calculate due payments.
 
@@ -106,6 +288,8 @@ class ProgressivePriceSchedule(BasePriceSchedule):
 
     schedule_type = AmortizationScheduleType.progressive_price_schedule
 
+    __slots__ = ()
+
     def calculate_interest(self):
         """Calculate interest in each payment.
 
@@ -120,19 +304,14 @@ class ProgressivePriceSchedule(BasePriceSchedule):
         and :math:`n_1,\\ldots,n_k` are the return days.
         """
 
-        ret = []
-
-        for i, n in enumerate(self.return_days):
-
-            if i > 0:
-                n = self.return_days[i] - self.return_days[i - 1]
+        # the capitalization factor of each period is the ratio between
+        # consecutive discount factors
+        v = self.discount_factors
 
-            ret.append(
-                (self.balance[i] * (1 + self.daily_interest_rate) ** n)
-                - self.balance[i]
-            )
-
-        return ret
+        return [
+            b * (v_prev / v_n) - b
+            for b, v_prev, v_n in zip(self.balance, [1.0] + v[:-1], v)
+        ]
 
     def calculate_amortizations(self):
         """Calculate the principal amortization due to each payment.
@@ -148,7 +327,21 @@ class ProgressivePriceSchedule(BasePriceSchedule):
         are the return days and :math:`P=\\mathrm{PMT}(s,d,(n_1,\\ldots,n_k))`.
         """
 
-        return [self.pmt - c for c in self.calculate_interest()]
+        return [self.pmt - c for c in self.interest_payments]
+
+    def split_payment(self, pmt, previous_balance, previous_factor, factor):
+        """Split a payment into amortization and interest.
+
+        The interest is the capitalization of the previous balance over the
+        period, i.e., :math:`J_i = b_{i-1}(\\frac{v_{i-1}}{v_i} - 1)`, where
+        :math:`v_i` are the discount factors, and the amortization is the
+        remaining payment.
+        """
+
+        b = previous_balance
+        j = b * (previous_factor / factor) - b
+
+        return pmt - j, j
 
 
 class RegressivePriceSchedule(BasePriceSchedule):
@@ -180,6 +373,8 @@ class RegressivePriceSchedule(BasePriceSchedule):
 
     schedule_type = AmortizationScheduleType.regressive_price_schedule
 
+    __slots__ = ()
+
     def calculate_amortizations(self):
         """Calculate the amortization due to each payment.
 
@@ -196,9 +391,7 @@ class RegressivePriceSchedule(BasePriceSchedule):
         :math:`P = \\mathrm{PMT}(s,d,(n_1,\\ldots,n_k))`
         """
 
-        return [
-            self.pmt / (1 + self.daily_interest_rate) ** n for n in self.return_days
-        ]
+        return [self.pmt * v_n for v_n in self.discount_factors]
 
     def calculate_interest(self):
         """Calculate the interest in each payment.
@@ -216,7 +409,14 @@ class RegressivePriceSchedule(BasePriceSchedule):
         :math:`P = \\mathrm{PMT}(s,d,(n_1,\\ldots,n_k))`
         """
 
-        return [
-            self.pmt * (1 - 1.0 / (1 + self.daily_interest_rate) ** n)
-            for n in self.return_days
-        ]
+        return [self.pmt * (1 - v_n) for v_n in self.discount_factors]
+
+    def split_payment(self, pmt, previous_balance, previous_factor, factor):
+        """Split a payment into amortization and interest.
+
+        The amortization is the present value of the payment, i.e.,
+        :math:`A_i = Pv_i`, where :math:`v_i` is the discount factor, and the
+        interest is the remaining payment.
+        """
+
+        return pmt * factor, pmt * (1 - factor)
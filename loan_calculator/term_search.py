@@ -0,0 +1,150 @@
+from collections import deque, namedtuple
+
+from loan_calculator.pmt import discount_factors
+from loan_calculator.schedule import SCHEDULE_TYPE_CLASS_MAP
+from loan_calculator.schedule.base import AmortizationScheduleType
+
+TermSearch = namedtuple("TermSearch", ["term", "schedule"])
+
+
+def _price_terms(principal, daily_interest_rate, return_days):
+    """Yield the PMT and the total interest of each term of Price schedules.
+
+    If :math:`S_k=\\sum_{j=1}^k v_j` are the running sums of the discount
+    factors, the PMT of the term :math:`k` is :math:`s/S_k` and the total
+    interest is :math:`k\\,s/S_k - s`.
+    """
+
+    s = principal
+
+    discount_sum = 0.0
+    for k, v_n in enumerate(discount_factors(daily_interest_rate, return_days), 1):
+        discount_sum += v_n
+        pmt = s / discount_sum
+
+        yield pmt, k * pmt - s
+
+
+def _constant_amortization_terms(principal, daily_interest_rate, return_days):
+    """Yield the largest due payment and total interest of each term.
+
+    If :math:`h_j = (1+d)^{n_j-n_{j-1}}-1`, the interest of the :math:`j`-th
+    payment of the term :math:`k` is :math:`s(1-\\frac{j-1}{k})h_j`, so the
+    total interest is :math:`s(\\sum_{j=1}^kh_j-\\frac{1}{k}
+    \\sum_{j=1}^k(j-1)h_j)`, which is updated in constant time from the
+    running sums. The :math:`j`-th due payment is
+    :math:`\\frac{s}{k}(1+h_j(k-j+1))`, so the largest one is given by the
+    maximum of the lines :math:`h_j(k-j+1)` on :math:`k`. A line whose slope
+    is not larger than the ones before it never exceeds them, given that the
+    daily interest rate is not negative, so the slopes of the remaining
+    lines increase and, as :math:`k` increases too, their upper envelope is
+    walked in amortized constant time per term.
+    """
+
+    s = principal
+    d = daily_interest_rate
+
+    h_sum = weighted_h_sum = 0.0
+    previous_day = 0
+
+    # lines h_j * k - (j - 1) * h_j on the upper envelope, by increasing slope
+    lines = deque()
+
+    for k, n in enumerate(return_days, 1):
+        h = (1 + d) ** (n - previous_day) - 1
+        h_sum += h
+        weighted_h_sum += (k - 1) * h
+        previous_day = n
+
+        if not lines or h > lines[-1][0]:
+            m3, c3 = h, -(k - 1) * h
+
+            while len(lines) > 1:
+                (m1, c1), (m2, c2) = lines[-2], lines[-1]
+                # the last line is below the others from the intersection of
+                # the first and the new one on
+                if (c1 - c3) * (m2 - m1) > (c1 - c2) * (m3 - m1):
+                    break
+                lines.pop()
+
+            lines.append((m3, c3))
+
+        while len(lines) > 1 and (
+            lines[1][0] * k + lines[1][1] >= lines[0][0] * k + lines[0][1]
+        ):
+            lines.popleft()
+
+        m, c = lines[0]
+        largest_payment = s * (1 + m * k + c) / k
+
+        yield largest_payment, s * (h_sum - weighted_h_sum / k)
+
+
+def minimal_term(
+    principal,
+    daily_interest_rate,
+    return_days,
+    max_payment=None,
+    max_total_interest=None,
+    amortization_schedule_type=AmortizationScheduleType.progressive_price_schedule,
+):
+    """Find the shortest term whose schedule satisfies the constraints.
+
+    The candidate terms are the prefixes of the given return days, which are
+    walked from the shortest one. Adding a return day to a Price schedule
+    adds a single discount factor to the PMT's denominator, so each candidate
+    is evaluated in constant time from the running sums, instead of building
+    its schedule. Only the schedule of the term found is built.
+
+    Parameters
+    ----------
+    principal: float, required
+        Loan's principal.
+    daily_interest_rate: float, required
+        Loan's daily interest rate.
+    return_days: list, required
+        Return days of the longest candidate term.
+    max_payment: float, optional
+        Largest due payment allowed. (default None)
+    max_total_interest: float, optional
+        Largest total interest allowed. (default None)
+    amortization_schedule_type: AmortizationScheduleType, optional
+        Schedule type of the loan.
+        (default AmortizationScheduleType.progressive_price_schedule)
+
+    Returns
+    -------
+    TermSearch
+        Named tuple with the number of instalments of the shortest term
+        satisfying the constraints and its schedule, or None if no candidate
+        term satisfies them.
+    """
+
+    amortization_schedule_type = AmortizationScheduleType(amortization_schedule_type)
+
+    if (
+        amortization_schedule_type
+        == AmortizationScheduleType.constant_amortization_schedule
+    ):
+        terms = _constant_amortization_terms(
+            principal, daily_interest_rate, return_days
+        )
+    else:
+        terms = _price_terms(principal, daily_interest_rate, return_days)
+
+    for term, (largest_payment, total_interest) in enumerate(terms, 1):
+
+        if max_payment is not None and largest_payment > max_payment:
+            continue
+
+        if max_total_interest is not None and total_interest > max_total_interest:
+            continue
+
+        return TermSearch(
+            term,
+            SCHEDULE_TYPE_CLASS_MAP[amortization_schedule_type](
+                principal, daily_interest_rate, list(return_days[:term])
+            ),
+        )
+
+    return None
@@ -12,23 +12,13 @@ def display_summary(loan, reference_date=None):
     reference_date : date, optional
         Date object with the date to consider as reference when calculating
         the values of the column `day` in the function's output. (default None)
+
+    The rows of a loan without return dates are displayed without dates and
+    with the loan's own return days.
     """
 
     reference_date = reference_date or loan.start_date
 
-    dates = [reference_date] + loan.return_dates
-
-    lines = list(
-        zip(
-            dates,
-            map(lambda d: (d - reference_date).days, dates),
-            loan.balance,
-            [""] + loan.amortizations,
-            [""] + loan.interest_payments,
-            [""] + loan.due_payments,
-        )
-    )
-
     separator = (
         "+------------+----------+--------------"
         "+--------------+--------------+--------------+"
@@ -42,49 +32,40 @@ def display_summary(loan, reference_date=None):
     trailing_line = (
         "| {:>8} | {:>8d} | {:>12.2f} |              "
         "|              |              |".format(
-            *[lines[0][0].isoformat()] + list(lines[0][1:3])
+            reference_date.isoformat(), 0, loan.principal
         )
     )
 
-    body_line = "| {:>8} | {:>8d} | {:>12.2f} " "| {:>12.2f} | {:>12.2f} | {:>12.2f} |"
+    body_line = "| {:>10} | {:>8d} | {:>12.2f} " "| {:>12.2f} | {:>12.2f} | {:>12.2f} |"
 
-    footer_line = (
-        "|            |          |              "
-        "| {:>12.2f} | {:>12.2f} | {:>12.2f} |".format(
-            loan.total_amortization, loan.total_interest, loan.total_paid
-        )
-    )
+    for line in [separator, header, separator, trailing_line]:
+        print(line)
+
+    # the rows are streamed from the loan instead of buffering the table, so
+    # the totals are accumulated along with them
+    totals = [0, 0, 0]
 
-    summary = "\n".join(
-        [
-            separator,
-            header,
-            separator,
-            trailing_line,
-        ]
-        + [
+    for r_date, n, *values in loan.iter_rows():
+        totals = [total + value for total, value in zip(totals, values[1:])]
+
+        print(
             body_line.format(
-                line[0].isoformat(),
-                line[1],
-                *list(
-                    map(
-                        lambda n: Decimal(n).quantize(
-                            Decimal("0.01"), rounding=ROUND_HALF_UP
-                        ),
-                        line[2:],
-                    )
-                )
+                "" if r_date is None else r_date.isoformat(),
+                n if r_date is None else (r_date - reference_date).days,
+                *[
+                    Decimal(n).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+                    for n in values
+                ]
             )
-            for line in lines[1:]
-        ]
-        + [
-            separator,
-            footer_line,
-            separator,
-        ]
+        )
+
+    footer_line = (
+        "|            |          |              "
+        "| {:>12.2f} | {:>12.2f} | {:>12.2f} |".format(*totals)
     )
 
-    print(summary)
+    for line in [separator, footer_line, separator]:
+        print(line)
 
 
 def count_days_between_dates(
@@ -42,6 +42,10 @@ setup(
     ],
     description="Loan Calculator",
     install_requires=[],
+    extras_require={
+        "batch": ["numpy"],
+        "jit": ["numba"],
+    },
     license="MIT license",
     long_description=readme + "\n\n" + history + "\n\n" + license_,
     include_package_data=True,
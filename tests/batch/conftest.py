@@ -0,0 +1,41 @@
+import random
+from datetime import date, timedelta
+
+from pytest import fixture
+
+from loan_calculator.loan import Loan
+from loan_calculator.schedule.base import AmortizationScheduleType
+
+
+@fixture()
+def random_loans():
+
+    def inner(num_loans, seed=0):
+
+        rnd = random.Random(seed)
+        schedule_types = list(AmortizationScheduleType)
+
+        loans = []
+        for _ in range(num_loans):
+            start_date = date(2020, 1, 1) + timedelta(rnd.randint(0, 60))
+            first_day = rnd.randint(15, 45)
+            loans.append(
+                Loan(
+                    rnd.uniform(1000, 50000),
+                    rnd.uniform(0.1, 1.0),
+                    start_date,
+                    [
+                        start_date + timedelta(first_day + 30 * i)
+                        for i in range(rnd.randint(1, 12))
+                    ],
+                    grace_period=rnd.choice([0, 0, 10]),
+                    year_size=rnd.choice([360, 365]),
+                    amortization_schedule_type=rnd.choice(schedule_types),
+                    count_working_days=rnd.random() < 0.2,
+                    include_end_date=rnd.random() < 0.2,
+                )
+            )
+
+        return loans
+
+    return inner
@@ -0,0 +1,88 @@
+from datetime import date
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from loan_calculator import Loan  # noqa: E402
+from loan_calculator.batch import BatchAccrual, BatchSchedule, LoanBook  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "reference_date",
+    [date(2019, 12, 1), date(2020, 2, 14), date(2020, 6, 30), date(2022, 1, 1)],
+)
+def test_batch_accrual_matches_loans(reference_date, random_loans):
+
+    loans = random_loans(100)
+
+    accrual = BatchAccrual.from_loans(loans).accrue(reference_date)
+
+    for i, loan in enumerate(loans):
+
+        balance = loan.balance_at(reference_date)
+        num_paid = sum(r_date <= reference_date for r_date in loan.return_dates)
+        last_balance = (
+            0.0 if num_paid == len(loan.return_days) else loan.balance[num_paid]
+        )
+
+        assert accrual.balance[i] == pytest.approx(balance, rel=1e-9, abs=1e-6)
+        assert accrual.accrued_interest[i] == pytest.approx(
+            balance - last_balance, rel=1e-9, abs=1e-6
+        )
+
+
+def test_batch_accrual_before_a_return_date_on_a_weekend():
+
+    # 2020-11-14 is a Saturday, which counts as many working days as the
+    # Friday before it
+    loans = [
+        Loan(
+            1000.0,
+            0.3,
+            date(2020, 10, 1),
+            [date(2020, 11, 14), date(2020, 12, 14)],
+            count_working_days=True,
+        ),
+        Loan(1000.0, 0.3, date(2020, 10, 1), [date(2020, 11, 13)]),
+    ]
+
+    for r_date in [date(2020, 11, 13), date(2020, 11, 14), date(2020, 11, 16)]:
+        expected = [loan.balance_at(r_date) for loan in loans]
+
+        assert BatchAccrual.from_loans(loans).accrue(r_date).balance == (
+            pytest.approx(expected)
+        )
+        assert LoanBook.from_loans(loans).accrue(r_date).balance == pytest.approx(
+            expected
+        )
+
+    # the instalment on Saturday is not paid on Friday yet
+    assert loans[0].balance_at(date(2020, 11, 13)) > loans[0].principal
+
+
+def test_batch_accrual_on_due_date():
+
+    batch = BatchSchedule([1000.0, 2000.0], 0.001, [[30, 60], [30]])
+
+    accrual = batch.accrue_at_days([30, 45])
+
+    assert accrual.balance == pytest.approx([batch.balance[0, 1], 0.0])
+    assert accrual.accrued_interest == pytest.approx([0.0, 0.0])
+
+
+def test_batch_accrual_between_dates(random_loans):
+
+    loans = random_loans(20)
+    accrual = BatchAccrual.from_loans(loans)
+
+    dates, accruals = accrual.accrue_between(
+        date(2020, 3, 1), date(2020, 3, 14), working_days_only=True
+    )
+
+    assert len(dates) == 10
+    assert all(r_date.weekday() < 5 for r_date in dates)
+    assert accruals.balance.shape == (10, 20)
+
+    for r_date, balance in zip(dates, accruals.balance):
+        assert balance == pytest.approx(accrual.accrue(r_date).balance)
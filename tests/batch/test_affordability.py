@@ -0,0 +1,76 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from loan_calculator.batch import max_principals  # noqa: E402
+from loan_calculator.schedule import SCHEDULE_TYPE_CLASS_MAP  # noqa: E402
+from loan_calculator.schedule.base import AmortizationScheduleType  # noqa: E402
+
+TERMS = [[30 * (j + 1) for j in range(k)] for k in (1, 6, 12, 24)]
+TARGET_PAYMENTS = [300.0, 550.0, 1200.0]
+DAILY_INTEREST_RATES = [0.0005, 0.001, 0.002]
+
+
+@pytest.mark.parametrize("schedule_type", list(AmortizationScheduleType))
+def test_max_principals_pay_the_target_payments(schedule_type):
+
+    principals = max_principals(
+        TARGET_PAYMENTS, DAILY_INTEREST_RATES, TERMS, schedule_type
+    )
+
+    assert principals.shape == (len(TARGET_PAYMENTS), len(TERMS))
+
+    schedule_cls = SCHEDULE_TYPE_CLASS_MAP[schedule_type]
+
+    for i, (target, d) in enumerate(zip(TARGET_PAYMENTS, DAILY_INTEREST_RATES)):
+        for j, return_days in enumerate(TERMS):
+            schedule = schedule_cls(principals[i, j], d, return_days)
+
+            assert max(schedule.due_payments) == pytest.approx(target)
+
+
+def test_max_principals_broadcast_scalars():
+
+    principals = max_principals(500.0, DAILY_INTEREST_RATES, TERMS)
+
+    assert principals.shape == (len(DAILY_INTEREST_RATES), len(TERMS))
+    assert principals[:, 0] == pytest.approx(
+        [500.0 * (1 + d) ** -30 for d in DAILY_INTEREST_RATES]
+    )
+    assert max_principals(500.0, 0.001, TERMS).shape == (1, len(TERMS))
+
+
+@pytest.mark.parametrize("schedule_type", list(AmortizationScheduleType))
+def test_max_net_principals_follow_the_iof_grossup_model(schedule_type):
+
+    i_star, i_star_star, g = 0.000082, 0.0038, 0.01
+
+    principals = max_principals(
+        TARGET_PAYMENTS, DAILY_INTEREST_RATES, TERMS, schedule_type
+    )
+    net_principals = max_principals(
+        TARGET_PAYMENTS,
+        DAILY_INTEREST_RATES,
+        TERMS,
+        schedule_type,
+        daily_iof_aliquot=i_star,
+        complementary_iof_aliquot=i_star_star,
+        service_fee_aliquot=g,
+    )
+
+    schedule_cls = SCHEDULE_TYPE_CLASS_MAP[schedule_type]
+
+    for i, d in enumerate(DAILY_INTEREST_RATES):
+        for j, return_days in enumerate(TERMS):
+            s = principals[i, j]
+            schedule = schedule_cls(s, d, return_days)
+
+            assert net_principals[i, j] == pytest.approx(
+                s
+                - sum(
+                    a * min(n * i_star, 0.015)
+                    for a, n in zip(schedule.amortizations, return_days)
+                )
+                - s * i_star_star
+                - g * s
+            )
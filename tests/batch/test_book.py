@@ -0,0 +1,133 @@
+from datetime import date
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from loan_calculator import Loan  # noqa: E402
+from loan_calculator.batch import (  # noqa: E402
+    BatchAccrual,
+    BatchSchedule,
+    LoanBook,
+    ragged_offsets,
+)
+from loan_calculator.index import CumulativeIndex  # noqa: E402
+from loan_calculator.loan import RoundStrategy  # noqa: E402
+
+
+def test_ragged_offsets():
+
+    assert ragged_offsets([[1, 2], [], [3]]).tolist() == [0, 2, 2, 3]
+
+
+def test_book_rows_match_loans(random_loans):
+
+    loans = random_loans(50)
+    book = LoanBook.from_loans(loans)
+
+    assert len(book) == len(loans)
+    assert book.num_instalments.tolist() == [len(loan.return_days) for loan in loans]
+
+    for loan, book_loan in zip(loans, book):
+        assert book_loan.return_days == loan.return_days
+        assert book_loan.return_dates == loan.return_dates
+        assert book_loan.capitalization_start_date == loan.capitalization_start_date
+        assert book_loan.annual_interest_rate == pytest.approx(
+            loan.annual_interest_rate
+        )
+        assert book_loan.due_payments == pytest.approx(loan.due_payments)
+
+    assert book[-1].principal == loans[-1].principal
+    assert book.annual_interest_rates == pytest.approx(
+        [loan.annual_interest_rate for loan in loans]
+    )
+
+
+def test_book_columns_match_batch_schedule(random_loans):
+
+    loans = random_loans(50)
+    book = LoanBook.from_loans(loans)
+    batch_schedule = BatchSchedule.from_loans(loans)
+
+    assert BatchSchedule.from_loans(book) is book.batch_schedule
+    assert book.balance == pytest.approx(batch_schedule.balance)
+    assert book.due_payments == pytest.approx(batch_schedule.due_payments)
+    assert book.total_interest == pytest.approx(batch_schedule.total_interest)
+    assert book.flatten(book.amortizations) == pytest.approx(
+        [a for loan in loans for a in loan.amortizations]
+    )
+
+    reference_date = date(2020, 6, 15)
+    accrual = BatchAccrual.from_loans(book).accrue(reference_date)
+
+    assert accrual.balance == pytest.approx(
+        BatchAccrual.from_loans(loans).accrue(reference_date).balance
+    )
+    assert book.accrue(reference_date).balance == pytest.approx(
+        [loan.balance_at(reference_date) for loan in loans]
+    )
+
+
+def test_book_from_columns_and_take():
+
+    book = LoanBook(
+        [1000.0, 2000.0, 3000.0],
+        0.001,
+        ["2020-01-01", "2020-01-05", "2020-01-10"],
+        [30, 60, 30, 31, 60, 90],
+        offsets=[0, 2, 3, 6],
+    )
+
+    assert book[2].return_dates == [
+        date(2020, 2, 10),
+        date(2020, 3, 10),
+        date(2020, 4, 9),
+    ]
+
+    subset = book.take([2, 0])
+
+    assert subset.principals.tolist() == [3000.0, 1000.0]
+    assert subset.offsets.tolist() == [0, 3, 5]
+    assert subset.return_days.tolist() == [31, 60, 90, 30, 60]
+    assert subset.due_payments == pytest.approx(
+        book.due_payments[[2, 0]][:, : subset.due_payments.shape[1]]
+    )
+    assert len(book.take(book.principals > 1500.0)) == 2
+
+    with pytest.raises(ValueError):
+        LoanBook([1000.0], 0.001, ["2020-01-01"], [30, 60], offsets=[0, 1, 2])
+
+
+def test_book_rows_keep_month_sizes():
+
+    loans = [
+        Loan(1000.0, 0.2, date(2020, 1, 1), [date(2020, 2, 1)], month_size=30),
+        Loan(2000.0, 0.3, date(2020, 1, 1), [date(2020, 2, 1), date(2020, 3, 1)]),
+    ]
+    book = LoanBook.from_loans(loans)
+
+    assert [loan.month_size for loan in book] == [30, None]
+    assert [loan.fingerprint for loan in book] == [loan.fingerprint for loan in loans]
+    assert book.take([0])[0].fingerprint == loans[0].fingerprint
+
+
+@pytest.mark.parametrize(
+    "round_strategy", [RoundStrategy.simple, RoundStrategy.by_diference]
+)
+def test_rounded_loans_can_not_be_held_by_a_book(round_strategy):
+
+    loan = Loan(
+        1000.0, 0.1, date(2020, 1, 1), [date(2020, 2, 1)], round_strategy=round_strategy
+    )
+
+    with pytest.raises(ValueError):
+        LoanBook.from_loans([loan])
+
+
+def test_indexed_loans_can_not_be_held_by_a_book():
+
+    index = CumulativeIndex([0.0004] * 10, start_date=date(2019, 12, 1))
+    loan = Loan(1000.0, 0.1, date(2020, 1, 1), [date(2020, 2, 1)], rate_index=index)
+
+    with pytest.raises(ValueError):
+        LoanBook.from_loans([loan])
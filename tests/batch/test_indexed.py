@@ -0,0 +1,66 @@
+from datetime import date, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from loan_calculator import Loan  # noqa: E402
+from loan_calculator.batch import BatchInflationIndexedSchedule  # noqa: E402
+from loan_calculator.index import InflationIndex  # noqa: E402
+from loan_calculator.schedule.base import AmortizationScheduleType  # noqa: E402
+
+
+def _indexed_loans(index):
+
+    schedule_types = list(AmortizationScheduleType)
+
+    return [
+        Loan(
+            1000.0 * (i + 1),
+            0.05,
+            date(2020, 1, 1) + timedelta(17 * i),
+            [date(2020, 1, 1) + timedelta(17 * i + 30 * (j + 1)) for j in range(i + 1)],
+            amortization_schedule_type=schedule_types[i % 3],
+            inflation_index=index,
+            inflation_lag=i % 2,
+        )
+        for i in range(12)
+    ]
+
+
+def test_batch_inflation_indexed_schedule_matches_loans():
+
+    index = InflationIndex(
+        [100.0, 100.4, 101.1, 101.3], start_date=date(2019, 12, 1), projected_rate=0.003
+    )
+    loans = _indexed_loans(index)
+
+    batch = BatchInflationIndexedSchedule.from_loans(loans)
+
+    def check():
+        for i, loan in enumerate(loans):
+            k = len(loan.return_dates)
+
+            assert batch.balance[i, : k + 1] == pytest.approx(loan.balance)
+            assert batch.due_payments[i, :k] == pytest.approx(loan.due_payments)
+            assert batch.monetary_corrections[i, :k] == pytest.approx(
+                loan.rounded_schedule.monetary_corrections
+            )
+            assert batch.total_interest[i] == pytest.approx(loan.total_interest)
+
+            reference_date = date(2020, 4, 20)
+            accrual = batch.accrue_at_days(
+                [lo._count_days_until(reference_date) for lo in loans],
+                [lo._inflation_month_offset(reference_date) for lo in loans],
+            )
+            assert accrual.balance[i] == pytest.approx(loan.balance_at(reference_date))
+
+    check()
+
+    # a new print of the index revalues the whole book at once
+    index.append(102.0)
+    batch.revalue()
+    for loan in loans:
+        loan.revalue()
+
+    check()
@@ -0,0 +1,117 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from loan_calculator.batch import implied_interest_rates  # noqa: E402
+from loan_calculator.interest_rate import (  # noqa: E402
+    convert_interest_rate,
+    InterestRateType,
+    YearSizeType,
+)
+from loan_calculator.schedule import SCHEDULE_TYPE_CLASS_MAP  # noqa: E402
+from loan_calculator.schedule.base import AmortizationScheduleType  # noqa: E402
+
+RETURN_DAYS = [
+    [30],
+    [31, 59, 90, 120, 151, 181],
+    [30 * (j + 1) + 3 * (j % 2) for j in range(12)],
+    [45 + 30 * j for j in range(48)],
+]
+DAILY_INTEREST_RATES = [0.00001, 0.0005, 0.001, 0.005]
+PRINCIPALS = [1000.0, 2500.0, 10000.0, 50000.0]
+
+
+def _first_payments(schedule_type):
+    schedule_cls = SCHEDULE_TYPE_CLASS_MAP[schedule_type]
+
+    return [
+        schedule_cls(s, d, r_days).due_payments[0]
+        for s, d, r_days in zip(PRINCIPALS, DAILY_INTEREST_RATES, RETURN_DAYS)
+    ]
+
+
+@pytest.mark.parametrize("schedule_type", list(AmortizationScheduleType))
+def test_implied_interest_rates_recover_daily_interest_rates(schedule_type):
+
+    rates = implied_interest_rates(
+        _first_payments(schedule_type), PRINCIPALS, RETURN_DAYS, schedule_type
+    )
+
+    assert rates == pytest.approx(DAILY_INTEREST_RATES, rel=1e-9)
+
+
+def test_implied_interest_rates_of_mixed_schedule_types():
+
+    schedule_types = list(AmortizationScheduleType) + [
+        AmortizationScheduleType.progressive_price_schedule
+    ]
+    payments = [
+        _first_payments(schedule_type)[i]
+        for i, schedule_type in enumerate(schedule_types)
+    ]
+
+    rates = implied_interest_rates(payments, PRINCIPALS, RETURN_DAYS, schedule_types)
+
+    assert rates == pytest.approx(DAILY_INTEREST_RATES, rel=1e-9)
+
+
+@pytest.mark.parametrize(
+    "interest_rate_type",
+    [InterestRateType.annual, InterestRateType.monthly, InterestRateType.daily],
+)
+def test_implied_interest_rates_are_converted(interest_rate_type):
+
+    rates = implied_interest_rates(
+        _first_payments(AmortizationScheduleType.progressive_price_schedule),
+        PRINCIPALS,
+        RETURN_DAYS,
+        interest_rate_type=interest_rate_type,
+        year_size=YearSizeType.banker,
+    )
+
+    assert rates == pytest.approx(
+        [
+            convert_interest_rate(
+                d, InterestRateType.daily, interest_rate_type, YearSizeType.banker
+            )
+            for d in DAILY_INTEREST_RATES
+        ],
+        rel=1e-9,
+    )
+
+
+def test_implied_interest_rates_of_padded_return_days():
+
+    days = np.array([[30, 60, 90], [30, 60, 0]])
+    mask = days > 0
+    pmt = SCHEDULE_TYPE_CLASS_MAP[AmortizationScheduleType.progressive_price_schedule](
+        1000.0, 0.002, [30, 60]
+    ).pmt
+
+    rates = implied_interest_rates([pmt, pmt], 1000.0, days, mask=mask)
+
+    assert rates[1] == pytest.approx(0.002, rel=1e-9)
+    assert rates[0] > rates[1]
+
+
+def test_implied_interest_rates_of_payments_at_par():
+
+    assert implied_interest_rates([100.0], 1200.0, [[30 * (j + 1) for j in range(12)]])[
+        0
+    ] == pytest.approx(0.0, abs=1e-15)
+
+
+@pytest.mark.parametrize("schedule_type", list(AmortizationScheduleType))
+def test_implied_interest_rates_of_payments_not_paying_off_principals(
+    schedule_type,
+):
+
+    rates = implied_interest_rates(
+        [100.0, 200.0],
+        1000.0,
+        [[30 * (j + 1) for j in range(6)]] * 2,
+        schedule_type,
+    )
+
+    assert np.isnan(rates[0])
+    assert rates[1] > 0
@@ -0,0 +1,77 @@
+from datetime import date
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from loan_calculator.batch import LoanBook, RateShockScenarios  # noqa: E402
+from loan_calculator.batch.schedule import BatchSchedule  # noqa: E402
+from loan_calculator.schedule.base import AmortizationScheduleType  # noqa: E402
+
+RATE_SHIFTS = [-0.01, -0.005, -0.001, 0.0, 0.001, 0.005, 0.01]
+
+
+def test_scenarios_match_repriced_loans(random_loans):
+
+    loans = random_loans(30)
+    scenarios = RateShockScenarios(LoanBook.from_loans(loans), RATE_SHIFTS)
+
+    assert len(scenarios) == len(RATE_SHIFTS)
+    assert scenarios.pmt.shape == (len(RATE_SHIFTS), len(loans))
+
+    reference_date = date(2020, 6, 15)
+    balances = scenarios.balances_at(reference_date)
+
+    for s, shift in enumerate(RATE_SHIFTS):
+        for i, loan in enumerate(loans):
+            repriced = loan.with_rate(loan.annual_interest_rate + shift)
+
+            assert scenarios.total_paid[s, i] == pytest.approx(repriced.total_paid)
+            assert scenarios.total_interest[s, i] == pytest.approx(
+                repriced.total_interest
+            )
+            assert balances[s, i] == pytest.approx(repriced.balance_at(reference_date))
+
+            if loan.amortization_schedule_type != (
+                AmortizationScheduleType.constant_amortization_schedule
+            ):
+                assert scenarios.pmt[s, i] == pytest.approx(
+                    repriced.amortization_schedule.pmt
+                )
+
+
+def test_present_values(random_loans):
+
+    loans = random_loans(30)
+    scenarios = RateShockScenarios(loans, RATE_SHIFTS)
+    pv = scenarios.present_values
+
+    # the contractual payments are worth the principal at the contract rate
+    assert pv[RATE_SHIFTS.index(0.0)] == pytest.approx(
+        [loan.principal for loan in loans]
+    )
+    # and less the higher the rate
+    assert (np.diff(pv, axis=0) < 0).all()
+
+    loan = loans[0]
+    shocked_rate = (1 + loan.annual_interest_rate + 0.01) ** (1 / loan.year_size) - 1
+
+    assert pv[-1, 0] == pytest.approx(
+        sum(
+            p / (1 + shocked_rate) ** n
+            for p, n in zip(loan.due_payments, loan.return_days)
+        )
+    )
+
+
+def test_scenarios_do_not_keep_their_schedules(random_loans):
+
+    scenarios = RateShockScenarios(random_loans(10), RATE_SHIFTS)
+
+    scenarios.pmt, scenarios.present_values
+    scenarios.balances_at(date(2020, 6, 15))
+
+    assert not any(
+        isinstance(value, (BatchSchedule, tuple)) for value in vars(scenarios).values()
+    )
+    assert scenarios.summary.shape == (4, len(RATE_SHIFTS), 10)
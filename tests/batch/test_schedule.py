@@ -0,0 +1,118 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from loan_calculator.batch import BatchSchedule  # noqa: E402
+from loan_calculator.schedule import SCHEDULE_TYPE_CLASS_MAP  # noqa: E402
+from loan_calculator.schedule.base import AmortizationScheduleType  # noqa: E402
+
+
+def _random_loans(num_loans, seed=0):
+
+    rnd = random.Random(seed)
+    schedule_types = list(AmortizationScheduleType)
+
+    loans = []
+    for _ in range(num_loans):
+        k = rnd.randint(1, 24)
+        first_day = rnd.randint(1, 60)
+        loans.append(
+            (
+                rnd.uniform(100, 100000),
+                rnd.uniform(0.0, 0.003),
+                [first_day + 30 * i for i in range(k)],
+                rnd.choice(schedule_types),
+            )
+        )
+
+    return loans
+
+
+def test_batch_schedule_matches_scalar_schedules():
+
+    loans = _random_loans(200)
+
+    batch = BatchSchedule(*zip(*loans))
+
+    for i, (principal, rate, return_days, schedule_type) in enumerate(loans):
+
+        schedule = SCHEDULE_TYPE_CLASS_MAP[schedule_type](principal, rate, return_days)
+        k = len(return_days)
+
+        assert batch.balance[i, : k + 1] == pytest.approx(
+            schedule.balance, rel=1e-9, abs=1e-6
+        )
+        assert batch.amortizations[i, :k] == pytest.approx(schedule.amortizations)
+        assert batch.interest_payments[i, :k] == pytest.approx(
+            schedule.interest_payments, rel=1e-9, abs=1e-9
+        )
+        assert batch.due_payments[i, :k] == pytest.approx(schedule.due_payments)
+        assert batch.total_interest[i] == pytest.approx(schedule.total_interest)
+
+        assert not batch.due_payments[i, k:].any()
+        assert not batch.balance[i, k + 1 :].any()
+
+
+def test_batch_schedule_with_padded_return_days():
+
+    batch = BatchSchedule(
+        [1000.0, 1000.0],
+        0.001,
+        np.array([[30, 60, 90], [30, 60, 0]]),
+        AmortizationScheduleType.regressive_price_schedule,
+        mask=np.array([[True, True, True], [True, True, False]]),
+    )
+
+    assert batch.total_amortization == pytest.approx([1000.0, 1000.0])
+    assert batch.pmt[1] > batch.pmt[0]
+    assert list(batch.num_instalments) == [3, 2]
+
+
+def test_batch_schedule_from_loans(loan):
+
+    batch = BatchSchedule.from_loans([loan, loan])
+
+    assert len(batch) == 2
+    assert batch.due_payments[1] == pytest.approx(loan.due_payments)
+
+
+def test_floating_batch_schedule_matches_scalar_schedules():
+
+    from loan_calculator.index import CumulativeIndex
+    from loan_calculator.schedule import FLOATING_SCHEDULE_TYPE_CLASS_MAP
+
+    rnd = random.Random(1)
+    index = CumulativeIndex(
+        [rnd.uniform(0.0, 0.0006) for _ in range(400)], projected_rate=0.0004
+    )
+
+    loans = _random_loans(50)
+    offsets = [rnd.randint(0, 300) for _ in loans]
+
+    batch = BatchSchedule(*zip(*loans), rate_index=index, index_offsets=offsets)
+
+    def check():
+        for i, (principal, rate, return_days, schedule_type) in enumerate(loans):
+
+            schedule = FLOATING_SCHEDULE_TYPE_CLASS_MAP[schedule_type](
+                principal, rate, return_days, index, index_offset=offsets[i]
+            )
+            k = len(return_days)
+
+            assert batch.balance[i, : k + 1] == pytest.approx(
+                schedule.balance, rel=1e-9, abs=1e-6
+            )
+            assert batch.due_payments[i, :k] == pytest.approx(schedule.due_payments)
+            assert batch.accrue_at_days(45).balance[i] == pytest.approx(
+                schedule.balance_at_day(45)
+            )
+
+    check()
+
+    # a new print of the index changes the projected factors of every loan
+    index.append(0.001)
+    batch.revalue()
+
+    check()
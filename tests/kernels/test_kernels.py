@@ -0,0 +1,115 @@
+import random
+import sys
+
+import pytest
+
+from loan_calculator import kernels
+from loan_calculator.grossup.iof_tax import amortization_schedule_iof
+from loan_calculator.irr import approximate_irr
+from loan_calculator.kernels import loops
+from loan_calculator.kernels import python as python_backend
+from loan_calculator.schedule import SCHEDULE_TYPE_CLASS_MAP
+
+
+def _random_inputs(num_instalments, seed=0):
+
+    rnd = random.Random(seed)
+
+    return_days = [rnd.randint(20, 40) + 30 * i for i in range(num_instalments)]
+    values = [rnd.uniform(10, 1000) for _ in return_days]
+
+    return rnd.uniform(0.0, 0.003), return_days, values
+
+
+@pytest.fixture
+def backend():
+
+    previous_backend = kernels.get_backend()
+
+    yield kernels.set_backend
+
+    kernels.set_backend(previous_backend)
+
+
+def test_unknown_backend(backend):
+
+    with pytest.raises(ValueError):
+        backend("fortran")
+
+
+def test_backend_falls_back_to_python(backend, monkeypatch):
+
+    # make the JIT backend fail to import, as if Numba was not installed
+    monkeypatch.setitem(sys.modules, "numba", None)
+    monkeypatch.delitem(sys.modules, "loan_calculator.kernels.jit", raising=False)
+    monkeypatch.delattr(kernels, "jit", raising=False)
+
+    assert backend("numba") == "python"
+    assert kernels.get_backend() == "python"
+
+
+@pytest.mark.parametrize("num_instalments", [1, 2, 12, 360])
+def test_loop_kernels_match_python_kernels(num_instalments):
+
+    d, return_days, values = _random_inputs(num_instalments)
+
+    assert loops.discount_factors(
+        d, return_days, [0.0] * num_instalments
+    ) == pytest.approx(python_backend.discount_factors(d, return_days), rel=1e-14)
+
+    assert loops.period_interest(
+        values, d, return_days, [0.0] * num_instalments
+    ) == pytest.approx(
+        python_backend.period_interest(values, d, return_days), rel=1e-12
+    )
+
+
+@pytest.mark.parametrize("num_instalments", [1, 2, 12, 360])
+def test_jit_kernels_match_python_kernels(num_instalments):
+
+    pytest.importorskip("numba")
+
+    from loan_calculator.kernels import jit
+
+    d, return_days, values = _random_inputs(num_instalments)
+
+    assert jit.discount_factors(d, return_days) == pytest.approx(
+        python_backend.discount_factors(d, return_days), rel=1e-14
+    )
+    assert jit.period_interest(values, d, return_days) == pytest.approx(
+        python_backend.period_interest(values, d, return_days), rel=1e-12
+    )
+    assert jit.evaluate_polynomial(values, return_days, d) == pytest.approx(
+        python_backend.evaluate_polynomial(values, return_days, d), rel=1e-12
+    )
+    assert jit.amortization_iof_sum(values, return_days, 0.000082) == pytest.approx(
+        python_backend.amortization_iof_sum(values, return_days, 0.000082),
+        rel=1e-12,
+    )
+
+
+@pytest.mark.parametrize("schedule_type", list(SCHEDULE_TYPE_CLASS_MAP))
+@pytest.mark.parametrize("seed", range(5))
+def test_backends_agree_on_loans(backend, schedule_type, seed):
+
+    pytest.importorskip("numba")
+
+    d, return_days, _ = _random_inputs(360 if seed == 0 else 12, seed)
+    schedule_cls = SCHEDULE_TYPE_CLASS_MAP[schedule_type]
+
+    results = []
+    for name in kernels.BACKENDS:
+        assert backend(name) == name
+
+        schedule = schedule_cls(1000.0, d, return_days)
+        results.append(
+            (
+                schedule.due_payments,
+                schedule.interest_payments,
+                approximate_irr(990.0, schedule.due_payments, return_days, d),
+                amortization_schedule_iof(schedule.amortizations, return_days),
+            )
+        )
+
+    for python_column, jit_column in zip(*results):
+        assert jit_column == pytest.approx(python_column, rel=1e-9)
@@ -0,0 +1,285 @@
+import pytest
+
+from loan_calculator.schedule import (
+    ConstantAmortizationSchedule,
+    ProgressivePriceSchedule,
+    RegressivePriceSchedule,
+    UnitScheduleCache,
+)
+
+
+class CountingSchedule(ProgressivePriceSchedule):
+
+    def __init__(self, *args):
+        super(CountingSchedule, self).__init__(*args)
+        self.calls = []
+
+    def calculate_balance(self):
+        self.calls.append("balance")
+        return super(CountingSchedule, self).calculate_balance()
+
+    def calculate_interest(self):
+        self.calls.append("interest")
+        return super(CountingSchedule, self).calculate_interest()
+
+
+def test_schedule_columns_are_lazily_evaluated():
+
+    schedule = CountingSchedule(1000.0, 0.01, [30, 60, 90])
+
+    assert schedule.calls == []
+
+    schedule.due_payments
+
+    assert schedule.calls == []
+
+
+def test_schedule_columns_are_memoized():
+
+    schedule = CountingSchedule(1000.0, 0.01, [30, 60, 90])
+
+    schedule.amortizations
+    schedule.interest_payments
+    schedule.total_amortization
+
+    assert schedule.calls == ["interest", "balance"]
+    assert schedule.balance is schedule.balance
+
+    del schedule.balance
+    schedule.balance
+
+    assert schedule.calls == ["interest", "balance", "balance"]
+
+
+@pytest.mark.parametrize(
+    "schedule_cls",
+    [
+        ProgressivePriceSchedule,
+        RegressivePriceSchedule,
+        ConstantAmortizationSchedule,
+    ],
+)
+@pytest.mark.parametrize("cache", [None, UnitScheduleCache()])
+def test_iter_rows_agrees_with_columns(schedule_cls, cache):
+
+    return_days = list(range(7, 7 * 500, 7))
+
+    if cache is None:
+        schedule = schedule_cls(5000.0, 0.0004, return_days)
+    else:
+        schedule = cache.schedule(schedule_cls, 5000.0, 0.0004, return_days)
+
+    rows = list(schedule.iter_rows())
+
+    assert [row[0] for row in rows] == return_days
+    assert [row[1] for row in rows] == pytest.approx(schedule.balance[1:], abs=1e-6)
+    assert [row[2] for row in rows] == pytest.approx(schedule.amortizations)
+    assert [row[3] for row in rows] == pytest.approx(schedule.interest_payments)
+    assert [row[4] for row in rows] == pytest.approx(schedule.due_payments)
+
+
+def _assert_same_schedule(schedule, expected):
+
+    assert schedule.return_days == expected.return_days
+    assert schedule.balance == pytest.approx(expected.balance, abs=1e-9)
+    assert schedule.due_payments == pytest.approx(expected.due_payments)
+    assert schedule.interest_payments == pytest.approx(expected.interest_payments)
+    assert schedule.amortizations == pytest.approx(expected.amortizations)
+    assert schedule.total_paid == pytest.approx(expected.total_paid)
+    assert schedule.total_interest == pytest.approx(expected.total_interest)
+
+
+@pytest.mark.parametrize(
+    "schedule_cls",
+    [
+        ProgressivePriceSchedule,
+        RegressivePriceSchedule,
+        ConstantAmortizationSchedule,
+    ],
+)
+@pytest.mark.parametrize("materialize", [False, True])
+@pytest.mark.parametrize("cache", [None, UnitScheduleCache()])
+@pytest.mark.parametrize(
+    "edit, expected_days",
+    [
+        (lambda s: s.replace_return_day(2, 95), [30, 60, 95, 120, 150]),
+        (lambda s: s.replace_return_day(0, 15), [15, 60, 90, 120, 150]),
+        (lambda s: s.insert_return_day(100), [30, 60, 90, 100, 120, 150]),
+        (lambda s: s.insert_return_day(180), [30, 60, 90, 120, 150, 180]),
+        (lambda s: s.delete_return_day(1), [30, 90, 120, 150]),
+        (lambda s: s.delete_return_day(4), [30, 60, 90, 120]),
+    ],
+)
+def test_edited_schedule_matches_schedule_built_from_scratch(
+    schedule_cls, materialize, cache, edit, expected_days
+):
+
+    return_days = [30, 60, 90, 120, 150]
+
+    if cache is None:
+        schedule = schedule_cls(1000.0, 0.002, return_days)
+    else:
+        schedule = cache.schedule(schedule_cls, 1000.0, 0.002, return_days)
+
+    if materialize:
+        schedule.compact()
+        schedule.total_interest
+        getattr(schedule, "discount_sums", None)
+
+    edit(schedule)
+
+    _assert_same_schedule(schedule, schedule_cls(1000.0, 0.002, expected_days))
+
+    if cache is not None:
+        # the cached unit schedule is left untouched
+        unit_schedule = cache.unit_schedule(schedule_cls, 0.002, return_days)
+        _assert_same_schedule(
+            unit_schedule, schedule_cls(1.0, 0.002, [30, 60, 90, 120, 150])
+        )
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        lambda s: s.replace_return_day(1, 90),
+        lambda s: s.replace_return_day(0, 0),
+        lambda s: s.insert_return_day(60),
+    ],
+)
+def test_edits_must_keep_return_days_increasing(edit):
+
+    schedule = ProgressivePriceSchedule(1000.0, 0.002, [30, 60, 90])
+
+    with pytest.raises(ValueError):
+        edit(schedule)
+
+
+def test_schedule_can_not_be_left_without_return_days():
+
+    schedule = ProgressivePriceSchedule(1000.0, 0.002, [30])
+
+    with pytest.raises(ValueError):
+        schedule.delete_return_day(0)
+
+
+@pytest.mark.parametrize(
+    "schedule_cls",
+    [
+        ProgressivePriceSchedule,
+        RegressivePriceSchedule,
+        ConstantAmortizationSchedule,
+    ],
+)
+def test_balance_and_payoff_at_day(schedule_cls):
+
+    d = 0.001
+    schedule = schedule_cls(1000.0, d, [30, 60, 90]).compact()
+
+    assert schedule.balances_at_days([0, 30, 60, 90, 120]) == pytest.approx(
+        schedule.balance + [0.0]
+    )
+    assert schedule.balance_at_day(45) == pytest.approx(
+        schedule.balance[1] * (1 + d) ** 15
+    )
+    assert schedule.payoffs_at_days([30, 60, 90]) == pytest.approx(
+        [b + p for b, p in zip(schedule.balance[1:], schedule.due_payments)]
+    )
+    assert schedule.payoff_at_day(45) == schedule.balance_at_day(45)
+    assert schedule.payoff_at_day(-5) == 1000.0
+
+    # the days need not be sorted
+    days = [120, 45, -5, 60, 30, 90, 59, 61, 0, 30]
+    assert schedule.balances_at_days(days) == [schedule.balance_at_day(n) for n in days]
+    assert schedule.payoffs_at_days(days) == [schedule.payoff_at_day(n) for n in days]
+
+
+@pytest.mark.parametrize(
+    "schedule_cls",
+    [
+        ProgressivePriceSchedule,
+        RegressivePriceSchedule,
+        ConstantAmortizationSchedule,
+    ],
+)
+@pytest.mark.parametrize("cache", [None, UnitScheduleCache()])
+@pytest.mark.parametrize("day", [0, 20, 30, 75])
+def test_prepaid_schedule_reducing_the_instalments(schedule_cls, cache, day):
+
+    d, return_days = 0.001, [30 * (j + 1) for j in range(12)]
+    unit_schedule = (
+        None if cache is None else cache.unit_schedule(schedule_cls, d, return_days)
+    )
+    schedule = schedule_cls(1000.0, d, return_days, unit_schedule)
+
+    num_paid, prepaid = schedule.prepaid_schedule(day, 100.0)
+    expected = schedule_cls(
+        schedule.balance_at_day(day) - 100.0,
+        d,
+        [n - day for n in return_days[num_paid:]],
+    )
+
+    assert num_paid == len([n for n in return_days if n <= day])
+    assert prepaid.return_days == expected.return_days
+    for column in expected.columns:
+        assert getattr(prepaid, column) == pytest.approx(getattr(expected, column))
+    assert max(prepaid.due_payments) < max(schedule.due_payments[num_paid:])
+
+
+@pytest.mark.parametrize(
+    "schedule_cls",
+    [
+        ProgressivePriceSchedule,
+        RegressivePriceSchedule,
+        ConstantAmortizationSchedule,
+    ],
+)
+@pytest.mark.parametrize("amount", [1.0, 100.0, 450.0, 800.0])
+def test_prepaid_schedule_reducing_the_term(schedule_cls, amount):
+
+    d, return_days = 0.001, [30 * (j + 1) for j in range(12)]
+    schedule = schedule_cls(1000.0, d, return_days)
+
+    num_paid, prepaid = schedule.prepaid_schedule(45, amount, reduce_term=True)
+    balance = schedule.balance_at_day(45) - amount
+    term = len(prepaid.return_days)
+
+    assert num_paid == 1
+    assert prepaid.principal == pytest.approx(balance)
+    assert prepaid.return_days == [n - 45 for n in return_days[1 : 1 + term]]
+
+    def instalment(s):
+        # the PMT of Price schedules and the amortization of constant ones
+        return getattr(s, "pmt", s.principal / len(s.return_days))
+
+    if term < len(return_days) - num_paid:
+        assert instalment(prepaid) <= instalment(schedule) * (1 + 1e-12)
+
+    # one instalment less would increase the instalments
+    if term > 1:
+        shorter = schedule_cls(balance, d, prepaid.return_days[:-1])
+        assert instalment(shorter) > instalment(schedule)
+
+
+def test_prepaid_schedule_of_whole_instalments():
+
+    d, return_days = 0.001, [30 * (j + 1) for j in range(12)]
+    schedule = ProgressivePriceSchedule(1000.0, d, return_days)
+
+    # the present value of the last four instalments at day 30
+    amount = sum(schedule.pmt * (1 + d) ** (30 - n) for n in return_days[-4:])
+
+    _, prepaid = schedule.prepaid_schedule(30, amount, reduce_term=True)
+
+    assert len(prepaid.return_days) == 7
+    assert prepaid.pmt == pytest.approx(schedule.pmt)
+
+
+@pytest.mark.parametrize("day,amount", [(30, 0.0), (30, 2000.0), (360, 1.0)])
+def test_invalid_prepayments(day, amount):
+
+    schedule = ProgressivePriceSchedule(
+        1000.0, 0.001, [30 * (j + 1) for j in range(12)]
+    )
+
+    with pytest.raises(ValueError):
+        schedule.prepaid_schedule(day, amount)
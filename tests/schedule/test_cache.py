@@ -0,0 +1,87 @@
+import threading
+
+import pytest
+
+from loan_calculator.schedule import (
+    ConstantAmortizationSchedule,
+    ProgressivePriceSchedule,
+    RegressivePriceSchedule,
+    UnitScheduleCache,
+)
+
+
+@pytest.mark.parametrize(
+    "schedule_cls",
+    [
+        ProgressivePriceSchedule,
+        RegressivePriceSchedule,
+        ConstantAmortizationSchedule,
+    ],
+)
+def test_scaled_schedule_matches_schedule_built_from_scratch(schedule_cls):
+
+    cache = UnitScheduleCache()
+    return_days = [31, 59, 90, 120]
+
+    expected = schedule_cls(1234.56, 0.001, return_days)
+    schedule = cache.schedule(schedule_cls, 1234.56, 0.001, return_days)
+
+    assert schedule.balance == pytest.approx(expected.balance)
+    assert schedule.due_payments == pytest.approx(expected.due_payments)
+    assert schedule.interest_payments == pytest.approx(expected.interest_payments)
+    assert schedule.amortizations == pytest.approx(expected.amortizations)
+    assert schedule.total_paid == pytest.approx(expected.total_paid)
+    assert schedule.total_interest == pytest.approx(expected.total_interest)
+
+
+def test_cache_statistics_and_eviction():
+
+    cache = UnitScheduleCache(maxsize=2)
+
+    cache.schedule(ProgressivePriceSchedule, 100.0, 0.001, [30, 60])
+    cache.schedule(ProgressivePriceSchedule, 200.0, 0.001, [30, 60])
+    cache.schedule(ProgressivePriceSchedule, 100.0, 0.002, [30, 60])
+    cache.schedule(ProgressivePriceSchedule, 100.0, 0.001, [30, 60])
+    cache.schedule(RegressivePriceSchedule, 100.0, 0.001, [30, 60])
+
+    assert cache.info() == (2, 3, 2, 2)
+
+    # the unit schedule with rate 0.002 was the least recently used one
+    cache.schedule(ProgressivePriceSchedule, 100.0, 0.002, [30, 60])
+
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    cache.clear()
+
+    assert cache.info() == (0, 0, 2, 0)
+
+
+def test_cache_shared_by_threads():
+
+    cache = UnitScheduleCache(maxsize=8)
+    num_threads, num_calls = 8, 500
+    errors = []
+
+    def build_schedules(seed):
+        try:
+            for i in range(num_calls):
+                rate = 0.001 * (1 + (seed * i) % 16)
+                cache.schedule(ProgressivePriceSchedule, 100.0, rate, [30, 60])
+        except Exception as error:  # pragma: no cover
+            errors.append(error)
+
+    threads = [
+        threading.Thread(target=build_schedules, args=(seed,))
+        for seed in range(num_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+    info = cache.info()
+
+    assert info.hits + info.misses == num_threads * num_calls
+    assert info.currsize == 8
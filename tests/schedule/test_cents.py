@@ -0,0 +1,144 @@
+from array import array
+
+import pytest
+
+from loan_calculator.schedule import (
+    ConstantAmortizationSchedule,
+    ProgressivePriceSchedule,
+    RegressivePriceSchedule,
+)
+from loan_calculator.rounds import round_half_up
+from loan_calculator.schedule.cents import CentsSchedule, SimpleCentsSchedule
+
+
+@pytest.mark.parametrize(
+    "schedule_cls",
+    [
+        ProgressivePriceSchedule,
+        RegressivePriceSchedule,
+        ConstantAmortizationSchedule,
+    ],
+)
+@pytest.mark.parametrize("principal", [1000.0, 8530.2, 12345.67])
+def test_cents_schedule_amortizes_exactly_the_principal(schedule_cls, principal):
+
+    schedule = schedule_cls(principal, 0.0011, [31, 59, 90, 120, 151, 181, 212])
+    cents_schedule = CentsSchedule(schedule)
+
+    assert sum(cents_schedule.amortizations_cents) == round(principal * 100)
+    assert cents_schedule.balance_cents[0] == round(principal * 100)
+    assert cents_schedule.balance_cents[-1] == 0
+    assert [
+        a + j
+        for a, j in zip(
+            cents_schedule.amortizations_cents, cents_schedule.interest_payments_cents
+        )
+    ] == cents_schedule.due_payments_cents
+
+    # every rounded value is within a cent of the exact one
+    assert cents_schedule.amortizations == pytest.approx(
+        schedule.amortizations, abs=0.01 * len(schedule.return_days)
+    )
+    assert cents_schedule.interest_payments[:-1] == pytest.approx(
+        schedule.interest_payments[:-1], abs=0.011
+    )
+
+    assert list(cents_schedule.iter_rows()) == list(
+        zip(
+            schedule.return_days,
+            cents_schedule.balance[1:],
+            cents_schedule.amortizations,
+            cents_schedule.interest_payments,
+            cents_schedule.due_payments,
+        )
+    )
+
+
+def test_price_cents_schedule_pays_rounded_pmt_until_last_payment():
+
+    schedule = ProgressivePriceSchedule(8530.20, 0.03, list(range(1, 11)))
+    cents_schedule = CentsSchedule(schedule)
+
+    assert set(cents_schedule.due_payments_cents[:-1]) == {100000}
+    assert cents_schedule.total_amortization == 8530.20
+    assert cents_schedule.balance_cents == [
+        853020,
+        778611,
+        701969,
+        623028,
+        541719,
+        457971,
+        371710,
+        282861,
+        191347,
+        97087,
+        0,
+    ]
+
+
+@pytest.mark.parametrize(
+    "schedule_cls",
+    [
+        ProgressivePriceSchedule,
+        RegressivePriceSchedule,
+        ConstantAmortizationSchedule,
+    ],
+)
+def test_simple_cents_schedule_rounds_every_value(schedule_cls):
+
+    schedule = schedule_cls(8530.2, 0.0011, [31, 59, 90, 120, 151, 181, 212])
+    cents_schedule = SimpleCentsSchedule(schedule)
+
+    for column in ["balance", "amortizations", "interest_payments", "due_payments"]:
+        assert getattr(cents_schedule, column) == [
+            round_half_up(value, 2) for value in getattr(schedule, column)
+        ]
+
+    # the rounded columns are computed once
+    assert cents_schedule.cents_columns is cents_schedule.cents_columns
+    assert cents_schedule.amortizations is cents_schedule.amortizations
+    assert cents_schedule.total_paid == pytest.approx(
+        sum(cents_schedule.due_payments), abs=1e-9
+    )
+    assert list(cents_schedule.iter_rows()) == list(
+        zip(
+            schedule.return_days,
+            cents_schedule.balance[1:],
+            cents_schedule.amortizations,
+            cents_schedule.interest_payments,
+            cents_schedule.due_payments,
+        )
+    )
+
+
+@pytest.mark.parametrize("cents_schedule_cls", [CentsSchedule, SimpleCentsSchedule])
+def test_compact_cents_schedule_keeps_list_columns(cents_schedule_cls):
+
+    schedule = ProgressivePriceSchedule(
+        8530.2, 0.0011, [31 * (j + 1) for j in range(12)]
+    )
+    cents_schedule = cents_schedule_cls(schedule)
+    columns = [
+        "balance",
+        "amortizations",
+        "interest_payments",
+        "due_payments",
+        "balance_cents",
+        "amortizations_cents",
+        "interest_payments_cents",
+        "due_payments_cents",
+    ]
+    expected = [getattr(cents_schedule, column) for column in columns]
+
+    assert cents_schedule.compact() is cents_schedule
+    assert not hasattr(cents_schedule, "__dict__")
+    assert all(isinstance(column, array) for column in cents_schedule.cents_columns)
+    assert all(
+        isinstance(getattr(cents_schedule, "_" + column), array)
+        for column in cents_schedule.columns
+    )
+    assert all(
+        isinstance(getattr(schedule, "_" + column), array)
+        for column in schedule.columns
+    )
+    assert [getattr(cents_schedule, column) for column in columns] == expected
@@ -0,0 +1,118 @@
+import random
+
+import pytest
+
+from loan_calculator.index import CumulativeIndex
+from loan_calculator.schedule import (
+    FLOATING_SCHEDULE_TYPE_CLASS_MAP,
+    SCHEDULE_TYPE_CLASS_MAP,
+)
+from loan_calculator.schedule.base import AmortizationScheduleType
+
+
+def _random_index(num_days, seed=0):
+
+    rnd = random.Random(seed)
+
+    return CumulativeIndex(
+        [rnd.choice([0.0, rnd.uniform(0.0003, 0.0006)]) for _ in range(num_days)],
+        projected_rate=0.0004,
+    )
+
+
+@pytest.mark.parametrize("schedule_type", list(SCHEDULE_TYPE_CLASS_MAP))
+def test_constant_index_matches_fixed_rate(schedule_type):
+
+    r, s = 0.0004, 0.0002
+    return_days = [31, 59, 90, 120]
+
+    floating = FLOATING_SCHEDULE_TYPE_CLASS_MAP[schedule_type](
+        1000.0, s, return_days, CumulativeIndex([r] * 200), index_offset=7
+    )
+    fixed = SCHEDULE_TYPE_CLASS_MAP[schedule_type](
+        1000.0, (1 + r) * (1 + s) - 1, return_days
+    )
+
+    for column in fixed.columns:
+        assert getattr(floating, column) == pytest.approx(getattr(fixed, column))
+
+
+@pytest.mark.parametrize("schedule_type", list(SCHEDULE_TYPE_CLASS_MAP))
+def test_floating_schedule_recurrences(schedule_type):
+
+    index = _random_index(100)
+    return_days = [30, 61, 92, 120, 151]
+
+    schedule = FLOATING_SCHEDULE_TYPE_CLASS_MAP[schedule_type](
+        1000.0, 0.0001, return_days, index, index_offset=3
+    )
+
+    b = schedule.balance
+    assert b[-1] == pytest.approx(0.0, abs=1e-9)
+    assert schedule.total_amortization == pytest.approx(1000.0)
+
+    for i, (n, m) in enumerate(zip(return_days, [0] + return_days[:-1])):
+        g = index.factor_between(3 + m, 3 + n) * 1.0001 ** (n - m)
+        assert b[i + 1] == pytest.approx(b[i] * g - schedule.due_payments[i])
+        if schedule_type != AmortizationScheduleType.regressive_price_schedule:
+            assert schedule.interest_payments[i] == pytest.approx(b[i] * (g - 1))
+
+    assert list(schedule.iter_rows()) == pytest.approx(
+        list(
+            zip(
+                return_days,
+                b[1:],
+                schedule.amortizations,
+                schedule.interest_payments,
+                schedule.due_payments,
+            )
+        )
+    )
+    assert schedule.balance_at_day(45) == pytest.approx(
+        b[1] * index.factor_between(33, 48) * 1.0001**15
+    )
+
+
+@pytest.mark.parametrize("schedule_type", list(SCHEDULE_TYPE_CLASS_MAP))
+def test_floating_schedule_edits_and_revalue(schedule_type):
+
+    schedule_cls = FLOATING_SCHEDULE_TYPE_CLASS_MAP[schedule_type]
+    index = _random_index(50)
+
+    schedule = schedule_cls(1000.0, 0.0001, [30, 60, 90], index)
+    schedule.due_payments
+    schedule.replace_return_day(1, 65)
+
+    fresh = schedule_cls(1000.0, 0.0001, [30, 65, 90], index)
+    assert schedule.due_payments == pytest.approx(fresh.due_payments)
+
+    index.append(0.002)
+    schedule.revalue()
+
+    fresh = schedule_cls(1000.0, 0.0001, [30, 65, 90], index)
+    assert schedule.due_payments == pytest.approx(fresh.due_payments)
+    assert schedule.balance == pytest.approx(fresh.balance)
+
+
+@pytest.mark.parametrize("schedule_type", list(AmortizationScheduleType))
+def test_prepaid_floating_schedule(schedule_type):
+
+    index = _random_index(400)
+    return_days = [30 * (j + 1) for j in range(12)]
+    schedule = FLOATING_SCHEDULE_TYPE_CLASS_MAP[schedule_type](
+        1000.0, 0.0002, return_days, index, index_offset=7
+    )
+
+    num_paid, prepaid = schedule.prepaid_schedule(100, 150.0)
+    expected = FLOATING_SCHEDULE_TYPE_CLASS_MAP[schedule_type](
+        schedule.balance_at_day(100) - 150.0,
+        0.0002,
+        [n - 100 for n in return_days[3:]],
+        index,
+        index_offset=107,
+    )
+
+    assert num_paid == 3
+    assert prepaid.index_offset == 107
+    for column in expected.columns:
+        assert getattr(prepaid, column) == pytest.approx(getattr(expected, column))
@@ -0,0 +1,62 @@
+import pytest
+
+from loan_calculator.index import InflationIndex
+from loan_calculator.schedule import SCHEDULE_TYPE_CLASS_MAP
+from loan_calculator.schedule.indexed import InflationIndexedSchedule
+
+
+@pytest.mark.parametrize("schedule_type", list(SCHEDULE_TYPE_CLASS_MAP))
+def test_inflation_indexed_schedule(schedule_type):
+
+    index = InflationIndex([100.0, 100.5, 101.2, 101.0], projected_rate=0.004)
+    real = SCHEDULE_TYPE_CLASS_MAP[schedule_type](1000.0, 0.0003, [31, 59, 90, 120])
+
+    schedule = InflationIndexedSchedule(real, index, [2, 3, 4, 5], 1)
+
+    c = schedule.correction_factors
+    assert c[:2] == pytest.approx([101.2 / 100.5, 101.0 / 100.5])
+    assert c[2] == pytest.approx(101.0 * 1.004 / 100.5)
+
+    for column in ("due_payments", "interest_payments", "amortizations"):
+        assert getattr(schedule, column) == pytest.approx(
+            [x * c_i for x, c_i in zip(getattr(real, column), c)]
+        )
+
+    # the corrected balance evolves by monetary correction, capitalization
+    # and payments
+    b = schedule.balance
+    for i, (n, m) in enumerate(zip(real.return_days, [0] + real.return_days[:-1])):
+        assert b[i + 1] == pytest.approx(
+            b[i]
+            + schedule.monetary_corrections[i]
+            + real.balance[i] * c[i] * (1.0003 ** (n - m) - 1)
+            - schedule.due_payments[i]
+        )
+
+    assert list(schedule.iter_rows()) == pytest.approx(
+        list(
+            zip(
+                real.return_days,
+                b[1:],
+                schedule.amortizations,
+                schedule.interest_payments,
+                schedule.due_payments,
+            )
+        )
+    )
+
+    index.append(102.0)
+    schedule.revalue()
+
+    assert schedule.correction_factors[2] == pytest.approx(102.0 / 100.5)
+    assert schedule.total_paid == pytest.approx(sum(schedule.due_payments))
+
+
+def test_inflation_indexed_schedule_needs_month_offsets():
+
+    real = SCHEDULE_TYPE_CLASS_MAP[list(SCHEDULE_TYPE_CLASS_MAP)[0]](
+        1000.0, 0.0003, [31, 59]
+    )
+
+    with pytest.raises(ValueError):
+        InflationIndexedSchedule(real, InflationIndex([100.0]), [1])
@@ -151,3 +151,50 @@ def test_regressive_price_amortization_schedule():
     assert schedule.total_amortization == pytest.approx(principal, rel=0.01)
     assert schedule.total_interest == pytest.approx(1469.80, rel=0.01)
     assert schedule.total_paid == pytest.approx(10000.00, rel=0.01)
+
+
+@pytest.mark.parametrize(
+    "schedule_cls", [ProgressivePriceSchedule, RegressivePriceSchedule]
+)
+def test_price_balance_follows_recursive_definition(schedule_cls):
+    """Assert the closed balance formula agrees with its recurrence."""
+    principal = 100000.0
+    daily_interest_rate = 0.0005
+    return_days = list(range(1, 361))
+
+    schedule = schedule_cls(principal, daily_interest_rate, return_days)
+
+    expected_balance = [principal]
+    for n, m in zip(return_days, [0] + return_days[:-1]):
+        expected_balance.append(
+            expected_balance[-1] * (1 + daily_interest_rate) ** (n - m) - schedule.pmt
+        )
+
+    assert schedule.balance == pytest.approx(expected_balance, rel=1e-6, abs=1e-6)
+    assert schedule.total_amortization == pytest.approx(principal)
+
+
+@pytest.mark.parametrize(
+    "schedule_cls", [ProgressivePriceSchedule, RegressivePriceSchedule]
+)
+def test_discount_sums_accumulate_discount_factors(schedule_cls):
+
+    schedule = schedule_cls(1000.0, 0.001, [31, 59, 90, 120])
+
+    assert schedule.discount_sums == pytest.approx(
+        [
+            sum(schedule.discount_factors[: j + 1])
+            for j in range(len(schedule.return_days))
+        ]
+    )
+    assert schedule.discount_sums[-1] == pytest.approx(1000.0 / schedule.pmt)
+
+
+@pytest.mark.parametrize(
+    "schedule_cls", [ProgressivePriceSchedule, RegressivePriceSchedule]
+)
+@pytest.mark.parametrize("return_days", [[31, 60, 60], [31, 90, 59]])
+def test_price_schedules_reject_return_days_not_increasing(schedule_cls, return_days):
+
+    with pytest.raises(ValueError):
+        schedule_cls(1000.0, 0.001, return_days)
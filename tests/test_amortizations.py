@@ -17,3 +17,27 @@ def test_loan_simple_round_strategy():
     )
 
     assert loan.amortizations[0] == 497.68
+    assert loan.due_payments == [round(p, 2) for p in loan.due_payments]
+    assert loan.interest_payments == [round(j, 2) for j in loan.interest_payments]
+    assert loan.balance == [round(b, 2) for b in loan.balance]
+    assert [row[3] for row in loan.iter_rows()] == loan.amortizations
+
+
+def test_loan_by_diference_round_strategy():
+
+    loan = Loan(
+        1000,
+        0.2668,
+        date(2024, 8, 7),
+        year_size=252,
+        return_dates=[date(2024, 8, 28), date(2024, 9, 28), date(2024, 10, 28)],
+        count_working_days=True,
+        include_end_date=True,
+        amortization_schedule_type="progressive-price-schedule",
+        round_strategy=RoundStrategy.by_diference,
+    )
+
+    assert loan.amortizations[0] == 330.15
+    assert loan.total_amortization == 1000.0
+    assert loan.balance[-1] == 0.0
+    assert [row[3] for row in loan.iter_rows()] == loan.amortizations
@@ -0,0 +1,53 @@
+from datetime import date
+
+import pytest
+
+from loan_calculator.index import CumulativeIndex, InflationIndex
+
+
+def test_cumulative_factors():
+
+    index = CumulativeIndex([0.01, 0.0, 0.02], projected_rate=0.001)
+
+    assert len(index) == 3
+    assert list(index.factors) == pytest.approx([1.0, 1.01, 1.01, 1.01 * 1.02])
+    assert index.factor(5) == pytest.approx(1.01 * 1.02 * 1.001**2)
+    assert index.factor_between(1, 3) == pytest.approx(1.02)
+
+    with pytest.raises(ValueError):
+        index.factor(-1)
+
+
+def test_append_daily_rate():
+
+    index = CumulativeIndex([0.01], projected_rate=0.001)
+    projected_factor = index.factor(2)
+
+    index.append(0.001)
+
+    assert len(index) == 2
+    assert index.factor(2) == pytest.approx(projected_factor)
+    assert index.factor(3) == pytest.approx(1.01 * 1.001**2)
+
+
+def test_inflation_index():
+
+    index = InflationIndex(
+        [100.0, 101.0, 102.0], start_date=date(2020, 1, 15), projected_rate=0.01
+    )
+
+    assert len(index) == 3
+    assert index.month_offset(date(2021, 3, 1)) == 14
+    assert index.index_number(1) == 101.0
+    assert index.index_number(4) == pytest.approx(102.0 * 1.01**2)
+    assert index.correction_factor(0, 2) == pytest.approx(1.02)
+
+    index.append(103.0)
+
+    assert index.index_number(3) == 103.0
+
+    with pytest.raises(ValueError):
+        index.index_number(-1)
+
+    with pytest.raises(ValueError):
+        InflationIndex([])
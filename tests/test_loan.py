@@ -1,10 +1,23 @@
+import pickle
+
+from array import array
+
 import pytest
 
 from datetime import date
 
-from loan_calculator.loan import Loan
+from loan_calculator.index import CumulativeIndex, InflationIndex
+from loan_calculator.loan import (
+    FrozenLoan,
+    FrozenLoanError,
+    Loan,
+    PrepaymentType,
+    RoundStrategy,
+)
 from loan_calculator.interest_rate import YearSizeType
-
+from loan_calculator.rounds import round_half_up
+from loan_calculator.schedule import default_unit_schedule_cache
+from loan_calculator.schedule.base import AmortizationScheduleType
 
 args_ = (
     1000.0,
@@ -107,3 +120,570 @@ def test_loan_252_relations(principal, annual_interest_rate):
     assert loan_252.balance[3] == pytest.approx(
         loan_252.balance[2] - loan_252.amortizations[2], 0.0001
     )
+
+
+def test_compact_loan_keeps_list_columns():
+
+    loan = Loan(*args_)
+    expected = [
+        loan.balance,
+        loan.due_payments,
+        loan.interest_payments,
+        loan.amortizations,
+    ]
+
+    assert loan.compact() is loan
+    assert not hasattr(loan, "__dict__")
+    assert not hasattr(loan.amortization_schedule, "__dict__")
+    assert [
+        loan.balance,
+        loan.due_payments,
+        loan.interest_payments,
+        loan.amortizations,
+    ] == expected
+
+
+@pytest.mark.parametrize(
+    "round_strategy", [RoundStrategy.by_diference, RoundStrategy.simple]
+)
+def test_compact_loan_compacts_rounded_schedule(round_strategy):
+
+    loan = Loan(*args_, round_strategy=round_strategy)
+    expected = [loan.balance, loan.due_payments, loan.total_paid]
+
+    assert loan.compact() is loan
+    assert all(
+        isinstance(column, array) for column in loan.rounded_schedule.cents_columns
+    )
+    assert [loan.balance, loan.due_payments, loan.total_paid] == expected
+
+
+def test_iter_rows_streams_loan_schedule():
+
+    loan = Loan(*args_)
+
+    assert list(loan.iter_rows()) == pytest.approx(
+        list(
+            zip(
+                args_[3],
+                loan.return_days,
+                loan.balance[1:],
+                loan.amortizations,
+                loan.interest_payments,
+                loan.due_payments,
+            )
+        )
+    )
+
+
+def test_edited_loan_matches_loan_built_from_scratch():
+
+    loan = Loan(*args_)
+    loan.balance
+
+    loan.replace_return_date(3, date(2020, 1, 6))
+    loan.delete_return_date(0)
+    assert loan.insert_return_date(date(2020, 1, 5)) == 2
+
+    expected_dates = [
+        date(2020, 1, 3),
+        date(2020, 1, 4),
+        date(2020, 1, 5),
+        date(2020, 1, 6),
+    ]
+    expected = Loan(*args_[:3], expected_dates)
+
+    assert loan.return_dates == expected_dates
+    assert args_[3][3] == date(2020, 1, 5)
+    assert loan.return_days == expected.return_days
+    assert loan.balance == pytest.approx(expected.balance)
+    assert loan.due_payments == pytest.approx(expected.due_payments)
+
+
+def test_edited_return_date_can_not_precede_loan_start():
+
+    loan = Loan(*args_)
+
+    with pytest.raises(ValueError):
+        loan.replace_return_date(0, args_[2])
+
+
+def test_balance_and_payoff_at_dates():
+
+    loan = Loan(*args_)
+
+    assert loan.balance_at(args_[2]) == loan.principal
+    assert loan.balances_at(args_[3]) == pytest.approx(loan.balance[1:])
+    assert loan.payoffs_at(args_[3]) == pytest.approx(
+        [b + p for b, p in zip(loan.balance[1:], loan.due_payments)]
+    )
+    assert loan.payoff_at(date(2021, 1, 1)) == 0.0
+
+
+def test_balance_before_a_return_date_on_a_weekend():
+
+    # 2020-11-14 is a Saturday, which counts as many working days as the
+    # Friday before it
+    loan = Loan(
+        1000.0,
+        0.3,
+        date(2020, 10, 1),
+        [date(2020, 11, 14), date(2020, 12, 14)],
+        count_working_days=True,
+    )
+    friday, saturday = date(2020, 11, 13), date(2020, 11, 14)
+
+    assert loan.return_days == [32, 53]
+    assert loan.balance_at(friday) == loan.payoff_at(friday)
+    assert loan.balance_at(friday) == pytest.approx(
+        loan.principal * (1 + loan.daily_interest_rate) ** 32
+    )
+    assert loan.balance_at(saturday) == pytest.approx(loan.balance[1])
+    assert loan.balances_at([saturday, friday]) == [
+        loan.balance_at(saturday),
+        loan.balance_at(friday),
+    ]
+    assert loan.payoffs_at([saturday, friday]) == [
+        loan.payoff_at(saturday),
+        loan.payoff_at(friday),
+    ]
+
+
+def test_floating_rate_loan():
+
+    index = CumulativeIndex(
+        [0.0004] * 12, start_date=date(2019, 12, 20), projected_rate=0.0004
+    )
+    loan = Loan(*args_, rate_index=index)
+
+    assert loan.amortization_schedule.index_offset == 12
+    assert loan.balance[-1] == pytest.approx(0.0, abs=1e-9)
+
+    due_payments = loan.due_payments
+    index.append(0.01)
+    loan.revalue()
+
+    assert loan.due_payments[0] > due_payments[0]
+
+    with pytest.raises(ValueError):
+        Loan(*args_, rate_index=index, count_working_days=True)
+
+    with pytest.raises(ValueError):
+        Loan(*args_, rate_index=CumulativeIndex([], start_date=date(2020, 1, 2)))
+
+
+def test_inflation_indexed_loan():
+
+    index = InflationIndex([100.0, 101.0], start_date=date(2019, 12, 1))
+    start_date = date(2020, 1, 10)
+    return_dates = [date(2020, 2, 10), date(2020, 3, 10), date(2020, 4, 10)]
+
+    loan = Loan(1000.0, 0.1, start_date, return_dates, inflation_index=index)
+    lagged_loan = Loan(
+        1000.0, 0.1, start_date, return_dates, inflation_index=index, inflation_lag=1
+    )
+    real_loan = Loan(1000.0, 0.1, start_date, return_dates)
+
+    # the index is flat after its last print
+    assert loan.due_payments == pytest.approx(real_loan.due_payments)
+    assert lagged_loan.due_payments == pytest.approx(
+        [p * 1.01 for p in real_loan.due_payments]
+    )
+
+    index.append(102.0)
+    loan.revalue()
+    lagged_loan.revalue()
+
+    assert loan.due_payments == pytest.approx(
+        [p * 102.0 / 101.0 for p in real_loan.due_payments]
+    )
+    assert lagged_loan.due_payments == pytest.approx(
+        [real_loan.due_payments[0] * 1.01]
+        + [p * 1.02 for p in real_loan.due_payments[1:]]
+    )
+    assert loan.balance_at(date(2020, 2, 20)) == pytest.approx(
+        real_loan.balance_at(date(2020, 2, 20)) * 102.0 / 101.0
+    )
+    assert loan.balances_at([date(2020, 1, 20)]) == pytest.approx(
+        [real_loan.balance_at(date(2020, 1, 20))]
+    )
+
+    simple_loan = Loan(
+        1000.0,
+        0.1,
+        start_date,
+        return_dates,
+        inflation_index=index,
+        round_strategy=RoundStrategy.simple,
+    )
+
+    assert simple_loan.due_payments == [round_half_up(p, 2) for p in loan.due_payments]
+
+    with pytest.raises(ValueError):
+        Loan(
+            1000.0,
+            0.1,
+            start_date,
+            return_dates,
+            inflation_index=index,
+            round_strategy=RoundStrategy.by_diference,
+        )
+
+
+@pytest.mark.parametrize("schedule_type", list(AmortizationScheduleType))
+@pytest.mark.parametrize(
+    "count_working_days,include_end_date",
+    [(False, False), (False, True), (True, False)],
+)
+def test_from_return_days(schedule_type, count_working_days, include_end_date):
+
+    start_date = date(2020, 1, 1)
+    return_dates = [date(2020, 2, 3), date(2020, 3, 2), date(2020, 4, 1)]
+    kwargs = dict(
+        grace_period=3,
+        amortization_schedule_type=schedule_type,
+        count_working_days=count_working_days,
+        include_end_date=include_end_date,
+        round_strategy=RoundStrategy.by_diference,
+    )
+
+    loan = Loan(1000.0, 0.2, start_date, return_dates, **kwargs)
+    fast_loan = Loan.from_return_days(
+        1000.0,
+        loan.daily_interest_rate,
+        start_date,
+        list(loan.return_days),
+        return_dates=return_dates if count_working_days else None,
+        **kwargs,
+    )
+
+    assert fast_loan.return_dates == return_dates
+    assert fast_loan.annual_interest_rate == pytest.approx(0.2)
+    assert fast_loan.due_payments == loan.due_payments
+    assert fast_loan.balance == loan.balance
+    assert list(fast_loan.iter_rows()) == list(loan.iter_rows())
+    assert fast_loan.balance_at(date(2020, 3, 10)) == loan.balance_at(date(2020, 3, 10))
+
+    fast_loan.replace_return_date(1, date(2020, 3, 4))
+    loan.replace_return_date(1, date(2020, 3, 4))
+
+    assert fast_loan.due_payments == pytest.approx(loan.due_payments)
+
+
+def test_frozen_loan():
+
+    loan = Loan(*args_)
+    fingerprint = loan.fingerprint
+
+    frozen = Loan(*args_).freeze()
+
+    assert isinstance(frozen, FrozenLoan)
+    assert frozen.fingerprint == fingerprint
+    assert frozen == Loan(*args_).freeze()
+    assert frozen != Loan(2000.0, *args_[1:]).freeze()
+    assert frozen != loan
+    assert {frozen: 1}[Loan(*args_).freeze()] == 1
+    assert frozen.due_payments == loan.due_payments
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+
+    with pytest.raises(FrozenLoanError):
+        frozen.principal = 2000.0
+
+    with pytest.raises(FrozenLoanError):
+        frozen.replace_return_date(0, date(2020, 1, 2))
+
+    # the serialization of the fingerprint is stable across processes
+    assert Loan(
+        1000, 0.2, date(2020, 1, 1), [date(2020, 2, 1), date(2020, 3, 1)]
+    ).fingerprint == (
+        "377e75ab5928f57b02e40c67a5261c7758a62f2671e8c80614441d524fcd1dfb"
+    )
+
+
+def test_fingerprint_covers_loan_parameters():
+
+    start_date, return_dates = args_[2], args_[3]
+    regressive_price_schedule = AmortizationScheduleType.regressive_price_schedule
+
+    fingerprints = {
+        Loan(*args_).fingerprint,
+        Loan(1000.0, 0.51, start_date, return_dates).fingerprint,
+        Loan(1000.0, 0.5, start_date, return_dates[:-1]).fingerprint,
+        Loan(*args_, include_end_date=True).fingerprint,
+        Loan(*args_, round_strategy=RoundStrategy.simple).fingerprint,
+        Loan(*args_, amortization_schedule_type=regressive_price_schedule).fingerprint,
+    }
+
+    assert len(fingerprints) == 6
+
+    fast_loan = Loan.from_return_days(
+        1000.0, Loan(*args_).daily_interest_rate, start_date, [1, 2, 3, 4]
+    )
+
+    assert fast_loan.fingerprint == Loan(*args_).fingerprint
+
+    with pytest.raises(ValueError):
+        Loan(*args_, rate_index=CumulativeIndex([], start_date=start_date)).freeze()
+
+
+@pytest.mark.parametrize("schedule_type", list(AmortizationScheduleType))
+@pytest.mark.parametrize("schedule_cache", [default_unit_schedule_cache, None])
+def test_derived_loans_match_loans_built_from_scratch(schedule_type, schedule_cache):
+
+    start_date, return_dates = date(2020, 1, 1), [date(2020, 2, 3), date(2020, 3, 2)]
+    kwargs = dict(
+        grace_period=3,
+        amortization_schedule_type=schedule_type,
+        round_strategy=RoundStrategy.by_diference,
+        schedule_cache=schedule_cache,
+    )
+
+    loan = Loan(1000.0, 0.2, start_date, return_dates, **kwargs)
+    loan.due_payments
+
+    derived_loan = loan.with_principal(2000.0)
+    expected = Loan(2000.0, 0.2, start_date, return_dates, **kwargs)
+
+    assert derived_loan.daily_interest_rate == loan.daily_interest_rate
+    assert derived_loan.due_payments == pytest.approx(expected.due_payments)
+    assert loan.principal == 1000.0
+
+    derived_loan = loan.with_rate(0.3, schedule_cache=schedule_cache)
+    expected = Loan(1000.0, 0.3, start_date, return_dates, **kwargs)
+
+    assert derived_loan.daily_interest_rate == expected.daily_interest_rate
+    assert derived_loan.due_payments == pytest.approx(expected.due_payments)
+
+    new_return_dates = [date(2020, 2, 10), date(2020, 3, 10), date(2020, 4, 10)]
+    derived_loan = loan.with_return_dates(new_return_dates, schedule_cache)
+    expected = Loan(1000.0, 0.2, start_date, new_return_dates, **kwargs)
+
+    assert derived_loan.return_days == expected.return_days
+    assert derived_loan.due_payments == pytest.approx(expected.due_payments)
+
+    # editing a derived loan does not affect the loan it was derived from
+    derived_loan = loan.with_principal(2000.0)
+    derived_loan.replace_return_date(1, date(2020, 3, 10))
+
+    assert loan.return_days == [30, 58]
+    assert loan.return_dates == return_dates
+
+    with pytest.raises(ValueError):
+        loan.with_return_dates([date(2020, 1, 2)])
+
+
+def test_derived_indexed_and_frozen_loans():
+
+    index = CumulativeIndex(
+        [0.0004] * 12, start_date=date(2019, 12, 20), projected_rate=0.0004
+    )
+    loan = Loan(*args_, rate_index=index)
+    derived_loan = loan.with_principal(2000.0)
+
+    assert derived_loan.amortization_schedule.index_offset == 12
+    assert derived_loan.due_payments == pytest.approx(
+        Loan(2000.0, *args_[1:], rate_index=index).due_payments
+    )
+
+    frozen = Loan(*args_).freeze()
+
+    assert isinstance(frozen.with_principal(2000.0), FrozenLoan)
+    assert frozen.with_principal(2000.0) == Loan(2000.0, *args_[1:]).freeze()
+    assert frozen.with_rate(0.5) == frozen
+
+
+MONTHLY_RETURN_DATES = [date(2020 + m // 12, m % 12 + 1, 10) for m in range(1, 25)]
+
+
+@pytest.mark.parametrize("schedule_type", list(AmortizationScheduleType))
+@pytest.mark.parametrize("prepayment_type", list(PrepaymentType))
+@pytest.mark.parametrize("prepayment_date", [date(2020, 6, 10), date(2020, 6, 25)])
+def test_prepaid_loan_matches_loan_built_from_scratch(
+    schedule_type, prepayment_type, prepayment_date
+):
+
+    loan = Loan(
+        10000.0,
+        0.3,
+        date(2020, 1, 1),
+        MONTHLY_RETURN_DATES,
+        amortization_schedule_type=schedule_type,
+    )
+
+    prepaid_loan = loan.with_prepayment(prepayment_date, 2000.0, prepayment_type)
+    remaining_dates = [r for r in MONTHLY_RETURN_DATES if r > prepayment_date]
+    expected = Loan(
+        loan.balance_at(prepayment_date) - 2000.0,
+        0.3,
+        prepayment_date,
+        remaining_dates[: len(prepaid_loan.return_dates)],
+        amortization_schedule_type=schedule_type,
+    )
+
+    assert prepaid_loan.start_date == prepayment_date
+    assert prepaid_loan.principal == pytest.approx(expected.principal)
+    assert prepaid_loan.return_dates == expected.return_dates
+    assert prepaid_loan.return_days == expected.return_days
+    assert prepaid_loan.due_payments == pytest.approx(expected.due_payments)
+    assert prepaid_loan.balance == pytest.approx(expected.balance)
+
+    if prepayment_type == PrepaymentType.reduce_instalment:
+        assert prepaid_loan.return_dates == remaining_dates
+    else:
+        assert len(prepaid_loan.return_dates) < len(remaining_dates)
+
+    assert loan.return_dates == MONTHLY_RETURN_DATES
+
+
+def test_loan_prepaid_during_grace_period():
+
+    loan = Loan(1000.0, 0.3, date(2020, 1, 1), MONTHLY_RETURN_DATES, grace_period=20)
+    prepaid_loan = loan.with_prepayment(
+        date(2020, 1, 11), 100.0, PrepaymentType.reduce_instalment
+    )
+
+    assert prepaid_loan.principal == 900.0
+    assert prepaid_loan.grace_period == 10
+    assert prepaid_loan.capitalization_start_date == date(2020, 1, 21)
+    assert prepaid_loan.return_days == loan.return_days
+    assert prepaid_loan.due_payments == pytest.approx(
+        [0.9 * p for p in loan.due_payments]
+    )
+
+
+@pytest.mark.parametrize("prepayment_type", list(PrepaymentType))
+def test_replayed_prepayments(prepayment_type):
+
+    loan = Loan(10000.0, 0.3, date(2020, 1, 1), MONTHLY_RETURN_DATES).freeze()
+    prepayments = [
+        (date(2020, 3, 15), 500.0),
+        (date(2020, 3, 20), 300.0),
+        (date(2020, 9, 1), 1500.0),
+    ]
+
+    prepaid_loan = loan.with_prepayments(prepayments, prepayment_type)
+
+    # rebuild the loan left by each prepayment from scratch
+    expected = loan
+    for prepayment_date, amount in prepayments:
+        term = len(
+            expected.with_prepayment(
+                prepayment_date, amount, prepayment_type
+            ).return_dates
+        )
+        expected = Loan(
+            expected.balance_at(prepayment_date) - amount,
+            0.3,
+            prepayment_date,
+            [r for r in expected.return_dates if r > prepayment_date][:term],
+        )
+
+    assert isinstance(prepaid_loan, FrozenLoan)
+    assert prepaid_loan.start_date == date(2020, 9, 1)
+    assert list(prepaid_loan.return_dates) == expected.return_dates
+    assert prepaid_loan.due_payments == pytest.approx(expected.due_payments)
+    assert loan.with_prepayments([], prepayment_type) is loan
+
+    if prepayment_type == PrepaymentType.reduce_term:
+        assert prepaid_loan.due_payments[0] <= loan.due_payments[0] * (1 + 1e-12)
+        assert prepaid_loan.return_dates[-1] < MONTHLY_RETURN_DATES[-1]
+    else:
+        assert prepaid_loan.return_dates[-1] == MONTHLY_RETURN_DATES[-1]
+
+
+def test_invalid_prepayments():
+
+    loan = Loan(1000.0, 0.3, date(2020, 1, 1), MONTHLY_RETURN_DATES)
+
+    with pytest.raises(ValueError):
+        loan.with_prepayment(date(2019, 12, 31), 100.0)
+    with pytest.raises(ValueError):
+        loan.with_prepayment(date(2020, 3, 1), 5000.0)
+    with pytest.raises(ValueError):
+        loan.with_prepayment(date(2022, 1, 10), 1.0)
+    with pytest.raises(ValueError):
+        Loan(
+            1000.0,
+            0.3,
+            date(2020, 1, 1),
+            MONTHLY_RETURN_DATES,
+            inflation_index=InflationIndex([100.0], start_date=date(2020, 1, 1)),
+        ).with_prepayment(date(2020, 3, 1), 100.0)
+
+
+@pytest.mark.parametrize(
+    "day_count",
+    [dict(count_working_days=True), dict(include_end_date=True), dict()],
+)
+@pytest.mark.parametrize("prepayment_type", list(PrepaymentType))
+@pytest.mark.parametrize("prepayment_date", [date(2024, 3, 12), date(2024, 3, 16)])
+def test_prepaid_loan_counts_days_as_loans_built_from_scratch(
+    day_count, prepayment_type, prepayment_date
+):
+
+    return_dates = [date(2024, m, 1) for m in range(2, 13)]
+    loan = Loan(10000.0, 0.3, date(2024, 1, 1), return_dates, **day_count)
+
+    prepaid_loan = loan.with_prepayment(prepayment_date, 3000.0, prepayment_type)
+    expected = Loan(
+        prepaid_loan.principal,
+        0.3,
+        prepayment_date,
+        prepaid_loan.return_dates,
+        **day_count,
+    )
+
+    assert prepaid_loan.principal == pytest.approx(
+        loan.balance_at(prepayment_date) - 3000.0
+    )
+    assert prepaid_loan.return_days == expected.return_days
+    assert prepaid_loan.due_payments == pytest.approx(expected.due_payments)
+    assert prepaid_loan.balance_at(date(2024, 3, 29)) == pytest.approx(
+        expected.balance_at(date(2024, 3, 29))
+    )
+
+
+@pytest.mark.parametrize("prepayment_type", list(PrepaymentType))
+def test_prepayment_before_a_return_date_on_a_weekend(prepayment_type):
+
+    # 2020-11-14 is a Saturday, which counts as many working days as the
+    # Friday before it, when the prepayment is made
+    return_dates = [date(2020, 11, 14), date(2020, 12, 14), date(2021, 1, 14)]
+    loan = Loan(1000.0, 0.3, date(2020, 10, 1), return_dates, count_working_days=True)
+    friday = date(2020, 11, 13)
+
+    prepaid_loan = loan.with_prepayment(friday, 100.0, prepayment_type)
+    expected = Loan(
+        prepaid_loan.principal,
+        0.3,
+        friday,
+        prepaid_loan.return_dates,
+        count_working_days=True,
+    )
+
+    assert prepaid_loan.principal == pytest.approx(loan.balance_at(friday) - 100.0)
+    assert prepaid_loan.return_dates[0] == date(2020, 11, 14)
+    assert prepaid_loan.return_days == expected.return_days
+    assert prepaid_loan.return_days[0] == 1
+    assert prepaid_loan.due_payments == pytest.approx(expected.due_payments)
+
+
+def test_loans_without_return_dates_can_not_be_edited():
+
+    loan = Loan.from_return_days(
+        1000.0, 0.001, date(2020, 1, 6), [20, 40, 60], count_working_days=True
+    )
+    due_payments = loan.due_payments
+
+    with pytest.raises(ValueError):
+        loan.replace_return_date(1, date(2020, 2, 10))
+
+    with pytest.raises(ValueError):
+        loan.insert_return_date(date(2020, 2, 10))
+
+    with pytest.raises(ValueError):
+        loan.delete_return_date(1)
+
+    assert loan.return_dates is None
+    assert loan.return_days == [20, 40, 60]
+    assert loan.due_payments == due_payments
@@ -1,9 +1,15 @@
 import pytest
 
-from loan_calculator.pmt import constant_return_pmt
+from loan_calculator.pmt import constant_return_pmt, discount_factors
 
 
 def test_unitary_evaluation():
     """Assert equation :math:`\\mathrm{PMT}(1, 1, (1, 1)) = 1` holds."""
 
     assert 1.0 == pytest.approx(constant_return_pmt(1.0, 1.0, [1, 1]), 0.01)
+
+
+def test_discount_factors():
+
+    assert discount_factors(1.0, [1, 2]) == pytest.approx([0.5, 0.25])
+    assert constant_return_pmt(3.0, 1.0, [1, 2]) == pytest.approx(4.0)
@@ -0,0 +1,76 @@
+import pytest
+
+from loan_calculator.interest_rate import (
+    convert_to_daily_interest_rate,
+    InterestRateType,
+)
+from loan_calculator.pmt import constant_return_pmt
+from loan_calculator.pmt_grid import PmtFactorGrid
+
+RATES = [0.1, 0.25, 0.5]
+TERMS = [1, 6, 12, 24]
+FIRST_PAYMENT_DAYS = [15, 30, 45]
+
+
+@pytest.fixture()
+def grid():
+    return PmtFactorGrid(RATES, TERMS, FIRST_PAYMENT_DAYS)
+
+
+def _exact_pmt(principal, rate, term, first_payment_day, period_days=30):
+    return constant_return_pmt(
+        principal,
+        convert_to_daily_interest_rate(rate, InterestRateType.annual),
+        [first_payment_day + j * period_days for j in range(term)],
+    )
+
+
+@pytest.mark.parametrize("rate", RATES + [0.3])
+@pytest.mark.parametrize("term", TERMS + [3])
+@pytest.mark.parametrize("first_payment_day", FIRST_PAYMENT_DAYS + [20])
+def test_grid_quotes_match_constant_return_pmt(grid, rate, term, first_payment_day):
+
+    assert grid.pmt(1234.5, rate, term, first_payment_day) == pytest.approx(
+        _exact_pmt(1234.5, rate, term, first_payment_day), rel=1e-12
+    )
+    assert grid.factor(rate, term, first_payment_day) == pytest.approx(
+        _exact_pmt(1.0, rate, term, first_payment_day), rel=1e-12
+    )
+
+
+def test_grid_with_other_rate_type_and_period():
+
+    grid = PmtFactorGrid(
+        [0.02], [12], [10], period_days=14, interest_rate_type=InterestRateType.monthly
+    )
+    daily_rate = grid.daily_interest_rate(0.02)
+
+    assert grid.pmt(1000.0, 0.02, 12, 10) == pytest.approx(
+        constant_return_pmt(1000.0, daily_rate, [10 + 14 * j for j in range(12)])
+    )
+
+
+def test_serialized_grid(grid, tmp_path):
+
+    restored = PmtFactorGrid.from_bytes(grid.to_bytes())
+
+    assert list(restored.factors) == list(grid.factors)
+    assert restored.pmt(1000.0, 0.25, 12, 30) == grid.pmt(1000.0, 0.25, 12, 30)
+
+    path = tmp_path / "grid.bin"
+    grid.save(path)
+
+    for memory_map in (True, False):
+        loaded = PmtFactorGrid.load(path, memory_map=memory_map)
+
+        assert list(loaded.factors) == list(grid.factors)
+        assert loaded.terms == TERMS
+        assert loaded.pmt(1000.0, 0.5, 24, 45) == grid.pmt(1000.0, 0.5, 24, 45)
+
+        loaded.close()
+
+    with pytest.raises(ValueError):
+        PmtFactorGrid.from_bytes(b"not a grid")
+
+    with pytest.raises(ValueError):
+        PmtFactorGrid(RATES, TERMS, FIRST_PAYMENT_DAYS, factors=[1.0])
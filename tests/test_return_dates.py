@@ -0,0 +1,114 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from loan_calculator import Loan, PaymentFrequency, generate_return_dates
+from loan_calculator.return_dates import add_months, count_weekdays
+from loan_calculator.utils import count_days_between_dates
+
+
+def test_add_months_clamps_the_day_to_the_month_end():
+
+    assert add_months(date(2020, 1, 31), 1) == date(2020, 2, 29)
+    assert add_months(date(2020, 1, 31), 13) == date(2021, 2, 28)
+    assert add_months(date(2020, 11, 15), 2, 31) == date(2021, 1, 31)
+    assert add_months(date(2020, 3, 15), -3) == date(2019, 12, 15)
+
+
+def test_count_weekdays_matches_count_days_between_dates():
+
+    rnd = random.Random(0)
+
+    for _ in range(200):
+        start_date = date(2020, 1, 1) + timedelta(rnd.randint(0, 365))
+        end_date = start_date + timedelta(rnd.randint(0, 120))
+
+        assert count_weekdays(start_date, end_date) == count_days_between_dates(
+            start_date, end_date, count_working_days=True
+        )
+
+
+def test_monthly_return_dates():
+
+    # the day of the month does not drift after short months
+    assert generate_return_dates(date(2020, 1, 31), 4).return_dates == [
+        date(2020, 2, 29),
+        date(2020, 3, 31),
+        date(2020, 4, 30),
+        date(2020, 5, 31),
+    ]
+
+    grid = generate_return_dates(date(2020, 1, 1), 3, payment_day=3, min_days=15)
+
+    assert grid.return_dates == [date(2020, 2, 3), date(2020, 3, 3), date(2020, 4, 3)]
+    assert grid.return_days == [33, 62, 93]
+
+    grid = generate_return_dates(date(2020, 1, 1), 2, payment_day=3)
+
+    assert grid.return_dates == [date(2020, 1, 3), date(2020, 2, 3)]
+
+
+def test_weekly_and_biweekly_return_dates():
+
+    # 2020-01-01 is a Wednesday
+    assert generate_return_dates(
+        date(2020, 1, 1), 3, PaymentFrequency.biweekly
+    ).return_dates == [date(2020, 1, 15), date(2020, 1, 29), date(2020, 2, 12)]
+
+    assert generate_return_dates(
+        date(2020, 1, 1), 2, "weekly", payment_day=0
+    ).return_dates == [date(2020, 1, 13), date(2020, 1, 20)]
+
+
+def test_business_day_rolling():
+
+    grid = generate_return_dates(
+        date(2020, 1, 1),
+        3,
+        PaymentFrequency.weekly,
+        payment_day=5,
+        business_day_rolling=True,
+        holidays=[date(2020, 1, 20)],
+    )
+
+    assert grid.return_dates == [
+        date(2020, 1, 13),
+        date(2020, 1, 21),
+        date(2020, 1, 27),
+    ]
+
+
+@pytest.mark.parametrize(
+    "count_working_days,include_end_date",
+    [(False, False), (False, True), (True, False)],
+)
+def test_return_days_match_loan(count_working_days, include_end_date):
+
+    kwargs = dict(
+        grace_period=5,
+        count_working_days=count_working_days,
+        include_end_date=include_end_date,
+    )
+    grid = generate_return_dates(
+        date(2020, 1, 10), 12, business_day_rolling=True, **kwargs
+    )
+    loan = Loan(1000.0, 0.2, date(2020, 1, 10), grid.return_dates, **kwargs)
+
+    assert grid.return_days == loan.return_days
+
+    with pytest.raises(ValueError):
+        generate_return_dates(date(2020, 1, 10), 12, grace_period=40)
+
+
+def test_return_dates_are_memoized():
+
+    generate_return_dates.cache_clear()
+
+    grid = generate_return_dates(date(2020, 1, 10), 12)
+    grid.return_dates.pop()
+
+    assert generate_return_dates(date(2020, 1, 10), 12) == grid._replace(
+        return_dates=grid.return_dates + [date(2021, 1, 10)]
+    )
+    assert generate_return_dates.cache_info().hits == 1
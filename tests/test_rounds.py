@@ -1,4 +1,4 @@
-from loan_calculator.rounds import arredmultb
+from loan_calculator.rounds import arredmultb, round_half_up_scaled
 
 
 def test_arredmultb():
@@ -6,3 +6,13 @@ def test_arredmultb():
     assert arredmultb(16.1057755, 2) == 16.10
     assert arredmultb(9.2902503, 2) == 9.29
     assert arredmultb(11.6071394, 2) == 11.60
+
+
+def test_round_half_up_scaled():
+
+    assert round_half_up_scaled(16.105) == 1611
+    assert round_half_up_scaled(1.005) == 100
+    assert round_half_up_scaled(0.125) == 13
+    assert round_half_up_scaled(-0.125) == -13
+    assert round_half_up_scaled(2.675, 2) == 267
+    assert round_half_up_scaled(2.5, 0) == 3
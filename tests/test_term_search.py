@@ -0,0 +1,120 @@
+import pytest
+
+from loan_calculator.schedule import SCHEDULE_TYPE_CLASS_MAP
+from loan_calculator.schedule.base import AmortizationScheduleType
+from loan_calculator.term_search import minimal_term
+
+RETURN_DAYS = [30 * j + 5 * (j % 3) for j in range(1, 61)]
+SCHEDULE_TYPES = list(AmortizationScheduleType)
+
+
+def _brute_force(principal, d, max_payment, max_total_interest, schedule_type):
+
+    for k in range(1, len(RETURN_DAYS) + 1):
+        schedule = SCHEDULE_TYPE_CLASS_MAP[schedule_type](principal, d, RETURN_DAYS[:k])
+        if max_payment is not None and max(schedule.due_payments) > max_payment:
+            continue
+        if (
+            max_total_interest is not None
+            and schedule.total_interest > max_total_interest
+        ):
+            continue
+        return k, schedule
+
+    return None
+
+
+@pytest.mark.parametrize("schedule_type", SCHEDULE_TYPES)
+@pytest.mark.parametrize("d", [0.0005, 0.001, 0.003])
+@pytest.mark.parametrize(
+    "max_payment,max_total_interest",
+    [(1000.0, None), (350.0, None), (None, 2000.0), (600.0, 5000.0), (None, None)],
+)
+def test_minimal_term_matches_brute_force(
+    schedule_type, d, max_payment, max_total_interest
+):
+
+    expected = _brute_force(10000.0, d, max_payment, max_total_interest, schedule_type)
+    result = minimal_term(
+        10000.0,
+        d,
+        RETURN_DAYS,
+        max_payment=max_payment,
+        max_total_interest=max_total_interest,
+        amortization_schedule_type=schedule_type,
+    )
+
+    if expected is None:
+        assert result is None
+        return
+
+    term, schedule = expected
+
+    assert result.term == term
+    assert result.schedule.return_days == RETURN_DAYS[:term]
+    assert result.schedule.due_payments == pytest.approx(schedule.due_payments)
+    assert result.schedule.total_interest == pytest.approx(schedule.total_interest)
+
+
+def test_minimal_term_without_constraints_is_a_single_instalment():
+
+    result = minimal_term(1000.0, 0.001, RETURN_DAYS)
+
+    assert result.term == 1
+    assert result.schedule.return_days == RETURN_DAYS[:1]
+
+
+def test_minimal_term_not_found():
+
+    # the payment can not go below the principal divided by the longest term
+    assert minimal_term(10000.0, 0.001, RETURN_DAYS, max_payment=100.0) is None
+    # the total interest only grows with the term
+    assert minimal_term(10000.0, 0.001, RETURN_DAYS, max_total_interest=1.0) is None
+
+
+def test_minimal_term_accepts_schedule_type_values():
+
+    result = minimal_term(
+        10000.0,
+        0.001,
+        RETURN_DAYS,
+        max_payment=600.0,
+        amortization_schedule_type="constant-amortization-schedule",
+    )
+
+    assert (
+        result.term
+        == _brute_force(
+            10000.0,
+            0.001,
+            600.0,
+            None,
+            AmortizationScheduleType.constant_amortization_schedule,
+        )[0]
+    )
+
+
+@pytest.mark.parametrize("d", [0.0, 0.001, 0.01])
+def test_minimal_term_of_irregular_constant_amortization_schedules(d):
+
+    return_days = [20, 30, 150, 160, 175, 400, 405, 410, 420, 900]
+    schedule_type = AmortizationScheduleType.constant_amortization_schedule
+    schedules = [
+        SCHEDULE_TYPE_CLASS_MAP[schedule_type](10000.0, d, return_days[:k])
+        for k in range(1, len(return_days) + 1)
+    ]
+
+    for k, schedule in enumerate(schedules, 1):
+        result = minimal_term(
+            10000.0,
+            d,
+            return_days,
+            max_payment=max(schedule.due_payments) * (1 + 1e-9),
+            amortization_schedule_type=schedule_type,
+        )
+
+        assert result.term == next(
+            j
+            for j, other in enumerate(schedules, 1)
+            if max(other.due_payments) <= max(schedule.due_payments) * (1 + 1e-9)
+        )
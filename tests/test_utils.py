@@ -50,3 +50,45 @@ def test_display_summary_shows_expected_loan_summary(capsys):
         "|            |          |              |     10000.00 |       174.17 |     10174.17 |\n"  # noqa
         "+------------+----------+--------------+--------------+--------------+--------------+\n"  # noqa
     )
+
+
+def test_display_summary_streams_the_loan_rows(capsys):
+
+    loan = Loan(
+        10000.0,
+        0.05,
+        date(2020, 1, 5),
+        [date(2020, 2, 12), date(2020, 3, 13), date(2020, 4, 13)],
+        schedule_cache=None,
+    )
+
+    display_summary(loan)
+
+    schedule = loan.amortization_schedule
+    assert all(getattr(schedule, "_" + name, None) is None for name in schedule.columns)
+
+    footer = capsys.readouterr().out.splitlines()[-2]
+    assert footer.split("|")[-4:-1] == [
+        " {:>12.2f} ".format(total)
+        for total in [loan.total_amortization, loan.total_interest, loan.total_paid]
+    ]
+
+
+def test_display_summary_of_loan_without_return_dates(capsys):
+
+    loan = Loan.from_return_days(
+        10000.0, 0.0002, date(2020, 1, 6), [20, 40, 60], count_working_days=True
+    )
+
+    assert loan.return_dates is None
+    assert [row[:2] for row in loan.iter_rows()] == [(None, 20), (None, 40), (None, 60)]
+
+    display_summary(loan)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [line[:25] for line in lines[4:7]] == [
+        "|            |       20 |",
+        "|            |       40 |",
+        "|            |       60 |",
+    ]
+    assert len({len(line) for line in lines}) == 1